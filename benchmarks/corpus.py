@@ -0,0 +1,172 @@
+"""Generate synthetic Makefiles that conform to schemas/makefile.yml."""
+
+import argparse
+import sys
+from typing import Callable, Dict, Iterator, NamedTuple, TextIO
+
+LETTERS = "abcdefghijklmnopqrstuvwxyz"
+SCHEMA_PATH = "schemas/makefile.yml"
+TYPICAL_SHAPE = "makefile"
+
+# The shebang, phonies, help title and the blank lines between sections.
+FIXED_LINES = 8
+
+
+class CorpusLayout(NamedTuple):
+  """The number of each kind of entry in a synthetic Makefile."""
+
+  commands: int
+  command_lines: int
+  aliases: int
+  alias_dependencies: int
+  comments: bool
+
+
+def letters(index: int, width: int) -> str:
+  """Return a fixed width name, that sorts in the same order as its index."""
+
+  name = ""
+  for _ in range(width):
+    index, remainder = divmod(index, len(LETTERS))
+    name = LETTERS[remainder] + name
+  return name
+
+
+def name_width(count: int) -> int:
+  """Return the fixed width needed to name a number of entries."""
+
+  required = 1
+  while len(LETTERS)**required < count:
+    required += 1
+  return required
+
+
+def command_layout(
+    lines: int,
+    command_lines: int,
+    comments: bool = False,
+) -> CorpusLayout:
+  """Divide the lines between commands of the same size."""
+
+  aliases = 10
+  # Each command has an entry, its contents, a blank line and a help line.
+  lines_per_command = command_lines + 3 + comments
+  return CorpusLayout(
+      commands=max(1, (lines - FIXED_LINES - aliases) // lines_per_command),
+      command_lines=command_lines,
+      aliases=aliases,
+      alias_dependencies=3,
+      comments=comments,
+  )
+
+
+def comments_layout(lines: int) -> CorpusLayout:
+  """Commands that are each preceded by a comment."""
+
+  return command_layout(lines, command_lines=3, comments=True)
+
+
+def deep_splits_layout(lines: int) -> CorpusLayout:
+  """Aliases with many dependencies, creating wide result trees."""
+
+  return CorpusLayout(
+      commands=1,
+      command_lines=1,
+      aliases=max(1, lines - FIXED_LINES - 4),
+      alias_dependencies=64,
+      comments=False,
+  )
+
+
+def huge_section_layout(lines: int) -> CorpusLayout:
+  """A single command with a section containing almost every line."""
+
+  return CorpusLayout(
+      commands=1,
+      command_lines=max(1, lines - FIXED_LINES - 13),
+      aliases=10,
+      alias_dependencies=3,
+      comments=False,
+  )
+
+
+def makefile_layout(lines: int) -> CorpusLayout:
+  """Commands with a few lines each, like a typical Makefile."""
+
+  return command_layout(lines, command_lines=3)
+
+
+def many_loops_layout(lines: int) -> CorpusLayout:
+  """Commands with a single line each, repeating the loop the most times."""
+
+  return command_layout(lines, command_lines=1)
+
+
+shapes: Dict[str, Callable[[int], CorpusLayout]] = {
+    "comments": comments_layout,
+    "deep_splits": deep_splits_layout,
+    "huge_section": huge_section_layout,
+    "makefile": makefile_layout,
+    "many_loops": many_loops_layout,
+}
+
+
+def generate(layout: CorpusLayout) -> Iterator[str]:
+  """Yield the lines of a synthetic Makefile with the specified layout."""
+
+  alias_width = name_width(layout.aliases)
+  command_width = name_width(layout.commands)
+  dependency_width = name_width(layout.alias_dependencies)
+  aliases = [
+      "alias" + letters(index, alias_width) for index in range(layout.aliases)
+  ]
+  commands = [
+      "command-" + letters(index, command_width)
+      for index in range(layout.commands)
+  ]
+  dependencies = " ".join(
+      letters(index, dependency_width)
+      for index in range(layout.alias_dependencies)
+  )
+
+  yield "#!/usr/bin/make -f\n"
+  yield "\n"
+  yield ".PHONY: " + " ".join(["help"] + aliases + commands) + "\n"
+  yield "\n"
+  yield "help:\n"
+  yield "\t@echo \"Please use 'make <target>' where <target> is one of:\"\n"
+  for command in commands:
+    yield "\t@echo \"  " + command + "  to run " + command + "\"\n"
+  yield "\n"
+  for alias in aliases:
+    yield alias + ": " + dependencies + "\n"
+  for command in commands:
+    yield "\n"
+    if layout.comments:
+      yield "# " + command + " is a synthetic command\n"
+    yield command + ":\n"
+    for _ in range(layout.command_lines):
+      yield "\t@echo \"" + command + "\"\n"
+
+
+def write(fh: TextIO, lines: int, shape: str) -> None:
+  """Write a synthetic Makefile of approximately the specified size."""
+
+  fh.writelines(generate(shapes[shape](lines)))
+
+
+def main() -> None:
+  parser = argparse.ArgumentParser(description=__doc__)
+  parser.add_argument("--lines", default=1000, type=int)
+  parser.add_argument(
+      "--shape",
+      choices=sorted(shapes),
+      default=TYPICAL_SHAPE,
+  )
+  args = parser.parse_args()
+
+  write(sys.stdout, args.lines, args.shape)
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,329 @@
+"""Generate text files that satisfy the rules of any schema.
+
+Lines are sampled from each rule's regex, loops are repeated until the text
+file reaches the requested size, and violations can be injected at chosen
+line numbers.  Validators are not considered, so only the rules of a schema
+are guaranteed to pass.
+"""
+
+import argparse
+import random
+import re
+import string
+import sys
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Pattern,
+    Sequence,
+    Tuple,
+)
+
+from text_lint.config import LOOP_COUNT
+from text_lint.operations.rules import (
+    AssertBlank,
+    AssertEqual,
+    AssertRegex,
+    AssertRegexSection,
+    AssertSequenceBegins,
+    AssertSequenceEnds,
+)
+from text_lint.operations.rules.bases.rule_base import RuleBase
+from text_lint.schema import Schema
+from text_lint.utilities.whitespace import new_line
+
+try:
+  from re import _parser as sre_parse  # type: ignore[attr-defined]
+except ImportError:
+  import sre_parse  # type: ignore[no-redef]  # pylint: disable=deprecated-module
+
+ALPHABET = string.ascii_letters + string.digits + string.punctuation + " \t"
+SAMPLE_ATTEMPTS = 100
+VIOLATIONS = (
+    "~ injected violation ~\n",
+    "injected violation\n",
+    "\n",
+)
+
+AliasLine = Tuple[RuleBase, str]
+AliasParsed = Any
+
+
+class RegexSampler:
+  """Create random strings that match a regex."""
+
+  def __init__(self, generator: random.Random, max_repeat: int) -> None:
+    self.generator = generator
+    self.max_repeat = max_repeat
+    self.groups: Dict[int, str] = {}
+    self.categories: Dict[Any, Callable[[str], bool]] = {
+        sre_parse.CATEGORY_DIGIT:
+            str.isdigit,
+        sre_parse.CATEGORY_NOT_DIGIT:
+            lambda char: not char.isdigit(),
+        sre_parse.CATEGORY_SPACE:
+            str.isspace,
+        sre_parse.CATEGORY_NOT_SPACE:
+            lambda char: not char.isspace(),
+        sre_parse.CATEGORY_WORD:
+            lambda char: char.isalnum() or char == "_",
+        sre_parse.CATEGORY_NOT_WORD:
+            (lambda char: not char.isalnum() and char != "_"),
+    }
+
+  def sample(self, regex: Pattern[str]) -> str:
+    """Return a random string built from a regex's parsed syntax."""
+
+    self.groups = {}
+    return self._sample(sre_parse.parse(regex.pattern, regex.flags))
+
+  def _sample(self, parsed: AliasParsed) -> str:
+    return "".join(self._sample_item(opcode, av) for opcode, av in parsed)
+
+  # pylint: disable=too-many-branches,too-many-return-statements
+  def _sample_item(self, opcode: Any, av: Any) -> str:
+    if opcode is sre_parse.LITERAL:
+      return chr(av)
+    if opcode is sre_parse.NOT_LITERAL:
+      return self._choose([char for char in ALPHABET if ord(char) != av])
+    if opcode is sre_parse.ANY:
+      return self._choose(string.ascii_letters)
+    if opcode is sre_parse.IN:
+      return self._sample_in(av)
+    if opcode is sre_parse.BRANCH:
+      return self._sample(self.generator.choice(av[1]))
+    if opcode is sre_parse.SUBPATTERN:
+      value = self._sample(av[-1])
+      if av[0] is not None:
+        self.groups[av[0]] = value
+      return value
+    if opcode in (
+        sre_parse.MAX_REPEAT,
+        sre_parse.MIN_REPEAT,
+        getattr(sre_parse, "POSSESSIVE_REPEAT", sre_parse.MAX_REPEAT),
+    ):
+      minimum, maximum, item = av
+      count = self.generator.randint(
+          minimum,
+          min(maximum, minimum + self.max_repeat),
+      )
+      return "".join(self._sample(item) for _ in range(count))
+    if opcode is getattr(sre_parse, "ATOMIC_GROUP", None):
+      return self._sample(av)
+    if opcode is sre_parse.GROUPREF:
+      return self.groups.get(av, "")
+    if opcode is sre_parse.GROUPREF_EXISTS:
+      group, matched, unmatched = av
+      if group in self.groups:
+        return self._sample(matched)
+      return self._sample(unmatched) if unmatched else ""
+    # Anchors and lookarounds consume no characters, so any failures they
+    # cause are caught when the sample is matched against the regex.
+    return ""
+
+  def _sample_in(self, items: List[Tuple[Any, Any]]) -> str:
+    negate = bool(items) and items[0][0] is sre_parse.NEGATE
+    if negate:
+      items = items[1:]
+    candidates = [
+        char for char in ALPHABET if self._in_class(char, items) != negate
+    ]
+    if candidates:
+      return self._choose(candidates)
+    for opcode, av in items:
+      if opcode is sre_parse.LITERAL:
+        return chr(av)
+      if opcode is sre_parse.RANGE:
+        return chr(av[0])
+    return ""
+
+  def _in_class(self, char: str, items: List[Tuple[Any, Any]]) -> bool:
+    for opcode, av in items:
+      if opcode is sre_parse.LITERAL and ord(char) == av:
+        return True
+      if opcode is sre_parse.RANGE and av[0] <= ord(char) <= av[1]:
+        return True
+      if opcode is sre_parse.CATEGORY and self.categories.get(
+          av,
+          lambda _: False,
+      )(char):
+        return True
+    return False
+
+  def _choose(self, candidates: Sequence[str]) -> str:
+    return self.generator.choice(candidates)
+
+
+class DocumentGenerator:
+  """Create text files that satisfy the rules of a schema."""
+
+  def __init__(
+      self,
+      schema: Schema,
+      lines: int,
+      section_lines: int = 3,
+      max_repeat: int = 8,
+      seed: Optional[int] = None,
+  ) -> None:
+    self.generator = random.Random(seed)
+    self.lines = lines
+    self.rules = schema.load_rules()
+    self.sampler = RegexSampler(self.generator, max_repeat)
+    self.section_lines = section_lines
+    self.comment_regex: Optional[Pattern[str]] = None
+    if schema.settings.comment_regex:
+      self.comment_regex = re.compile(
+          schema.settings.comment_regex,
+          re.DOTALL,
+      )
+    self.line_generators: Dict[str, Callable[[Any], Iterator[str]]] = {
+        AssertBlank.operation: self._blank,
+        AssertEqual.operation: self._equal,
+        AssertRegex.operation: self._regex,
+        AssertRegexSection.operation: self._regex_section,
+        AssertSequenceEnds.operation: self._sequence_ends,
+    }
+
+  def generate(self, violations: Sequence[int] = ()) -> Iterator[str]:
+    """Yield each line, replacing lines at 1-based positions by violations."""
+
+    positions = set(violations)
+    position = 0
+    for rule, line in self._generate_rules(self.rules, [0]):
+      position += 1
+      if position in positions:
+        positions.remove(position)
+        line = self.violation(rule, line)
+      yield line
+    if positions:
+      raise ValueError(
+          "violation positions are beyond the end of the text file: " +
+          ", ".join(str(position) for position in sorted(positions))
+      )
+
+  def violation(self, rule: RuleBase, line: str) -> str:
+    """Return a line that the rule will not accept in place of a valid line."""
+
+    for candidate in VIOLATIONS:
+      if (
+          candidate != line and not self._is_comment(candidate)
+          and not self._accepts(rule, candidate)
+      ):
+        return candidate
+    raise ValueError("rule '{0}' accepts every line".format(rule.name))
+
+  def _accepts(self, rule: RuleBase, line: str) -> bool:
+    if isinstance(rule, AssertBlank):
+      return line == new_line()
+    if isinstance(rule, AssertEqual):
+      if rule.case_sensitive:
+        return line == rule.expected
+      return line.casefold() == rule.comparable_expected
+    if isinstance(rule, AssertRegexSection) and line == new_line():
+      return True
+    if isinstance(rule, (AssertRegex, AssertRegexSection)):
+      return re.match(rule.regex, line) is not None
+    return False
+
+  def _generate_rules(
+      self,
+      rules: List[RuleBase],
+      count: List[int],
+  ) -> Iterator[AliasLine]:
+    for rule in rules:
+      if isinstance(rule, AssertSequenceBegins):
+        yield from self._sequence(rule, count)
+        continue
+      try:
+        line_generator = self.line_generators[rule.operation]
+      except KeyError as exc:
+        raise ValueError(
+            "rule '{0}' uses the unsupported operation '{1}'".format(
+                rule.name,
+                rule.operation,
+            )
+        ) from exc
+      for line in line_generator(rule):
+        count[0] += 1
+        yield rule, line
+
+  def _sequence(
+      self,
+      rule: AssertSequenceBegins,
+      count: List[int],
+  ) -> Iterator[AliasLine]:
+    if rule.count == LOOP_COUNT:
+      iterations = 0
+      while iterations == 0 or count[0] < self.lines:
+        iterations += 1
+        yield from self._generate_rules(rule.rules, count)
+    else:
+      for _ in range(rule.count):
+        yield from self._generate_rules(rule.rules, count)
+
+  def _blank(self, _: AssertBlank) -> Iterator[str]:
+    yield new_line()
+
+  def _equal(self, rule: AssertEqual) -> Iterator[str]:
+    yield rule.expected
+
+  def _regex(self, rule: AssertRegex) -> Iterator[str]:
+    yield self._sample_line(rule, rule.regex)
+
+  def _regex_section(self, rule: AssertRegexSection) -> Iterator[str]:
+    for _ in range(self.section_lines):
+      yield self._sample_line(rule, rule.regex)
+    yield new_line()
+
+  def _sequence_ends(self, _: AssertSequenceEnds) -> Iterator[str]:
+    yield from ()
+
+  def _sample_line(self, rule: RuleBase, regex: Pattern[str]) -> str:
+    for _ in range(SAMPLE_ATTEMPTS):
+      line = self.sampler.sample(regex)
+      if not line.endswith(new_line()):
+        line = new_line(line)
+      if (
+          line.count("\n") == 1 and line != new_line()
+          and not self._is_comment(line) and re.match(regex, line)
+      ):
+        return line
+    raise ValueError(
+        "unable to create a line for rule '{0}' from '{1}'".format(
+            rule.name,
+            regex.pattern,
+        )
+    )
+
+  def _is_comment(self, line: str) -> bool:
+    if self.comment_regex:
+      return re.match(self.comment_regex, line) is not None
+    return False
+
+
+def main() -> None:
+  parser = argparse.ArgumentParser(description=__doc__)
+  parser.add_argument("schema")
+  parser.add_argument("--lines", default=1000, type=int)
+  parser.add_argument("--max-repeat", default=8, type=int)
+  parser.add_argument("--section-lines", default=3, type=int)
+  parser.add_argument("--seed", default=None, type=int)
+  parser.add_argument("--violations", default=[], nargs="+", type=int)
+  args = parser.parse_args()
+
+  generator = DocumentGenerator(
+      Schema(args.schema),
+      lines=args.lines,
+      section_lines=args.section_lines,
+      max_repeat=args.max_repeat,
+      seed=args.seed,
+  )
+  sys.stdout.writelines(generator.generate(args.violations))
+
+
+if __name__ == "__main__":
+  main()
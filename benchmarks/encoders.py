@@ -0,0 +1,109 @@
+"""Compare encoder transforms with the equivalent JSON round trips."""
+
+import argparse
+import json
+import timeit
+import tracemalloc
+from typing import Any, Callable, List, Tuple, Type
+
+from text_lint.operations.lookups.encoders.bases.encoder_base import EncoderBase
+from text_lint.operations.lookups.encoders.lower import LowerCaseEncoder
+from text_lint.operations.lookups.encoders.reversed import ReversedEncoder
+from text_lint.operations.lookups.encoders.sorted import SortedEncoder
+from text_lint.operations.lookups.encoders.tree import ResultTreeEncoder
+from text_lint.operations.lookups.encoders.unique import UniqueEncoder
+from text_lint.operations.lookups.encoders.upper import UpperCaseEncoder
+from text_lint.results.tree import ResultTree
+
+AliasBenchmark = Tuple[Type[EncoderBase], Any]
+AliasMeasurement = Tuple[float, float]
+
+MEGABYTE = 1024 * 1024
+
+
+def create_results(size: int) -> List[List[str]]:
+  """Create nested capture results, with some repeated values."""
+
+  return [
+      ["Target_{0}".format(index % 512), "Value_{0}".format(index)]
+      for index in range(0, size)
+  ]
+
+
+def create_trees(size: int) -> List[List[ResultTree]]:
+  """Create saved result trees, as selected by a lookup cursor."""
+
+  tree = ResultTree.create(value="targets")
+  for index in range(0, size):
+    tree.add_matches(("Target_{0}".format(index), "a b c"), {2: " "})
+  return [[tree]]
+
+
+def measure(function: Callable[[], Any], repeat: int) -> AliasMeasurement:
+  """Return the best time in seconds, and the peak memory use in MB."""
+
+  seconds = min(timeit.repeat(function, number=1, repeat=repeat))
+  tracemalloc.start()
+  function()
+  _, peak = tracemalloc.get_traced_memory()
+  tracemalloc.stop()
+  return seconds, peak / MEGABYTE
+
+
+def main() -> None:
+  parser = argparse.ArgumentParser(description=__doc__)
+  parser.add_argument("--repeat", default=3, type=int)
+  parser.add_argument("--size", default=10000, type=int)
+  args = parser.parse_args()
+
+  results = create_results(args.size)
+  benchmarks: List[AliasBenchmark] = [
+      (LowerCaseEncoder, results),
+      (ReversedEncoder, results),
+      (SortedEncoder, results),
+      (UniqueEncoder, results),
+      (UpperCaseEncoder, results),
+      (ResultTreeEncoder, create_trees(args.size)),
+  ]
+
+  print(
+      "{0:<20} {1:>10} {2:>10} {3:>8} {4:>10} {5:>10}".format(
+          "encoder",
+          "json (s)",
+          "native (s)",
+          "speedup",
+          "json (MB)",
+          "native (MB)",
+      )
+  )
+  for encoder_class, value in benchmarks:
+    encoder = encoder_class()
+
+    def round_trip(
+        encoder_class: Type[EncoderBase] = encoder_class,
+        value: Any = value,
+    ) -> Any:
+      return json.loads(json.dumps(value, cls=encoder_class))
+
+    def transform(encoder: EncoderBase = encoder, value: Any = value) -> Any:
+      return encoder.transform(value)
+
+    if round_trip() != transform():
+      raise AssertionError(encoder_class.__name__)
+
+    json_seconds, json_peak = measure(round_trip, args.repeat)
+    native_seconds, native_peak = measure(transform, args.repeat)
+    print(
+        "{0:<20} {1:>10.4f} {2:>10.4f} {3:>7.1f}x {4:>10.1f} {5:>10.1f}".format(
+            encoder_class.__name__,
+            json_seconds,
+            native_seconds,
+            json_seconds / native_seconds,
+            json_peak,
+            native_peak,
+        )
+    )
+
+
+if __name__ == "__main__":
+  main()
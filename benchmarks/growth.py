@@ -0,0 +1,235 @@
+"""Fail if the time taken by key operations grows faster than linearly.
+
+Each operation is timed at geometrically increasing sizes, and a growth
+exponent is fitted to the timings on a log-log scale.  An exponent near 1.0
+is linear, while an exponent near 2.0 is quadratic.
+"""
+
+import argparse
+import io
+import math
+import os
+import sys
+import tempfile
+import timeit
+from contextlib import redirect_stdout
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+from benchmarks import corpus
+from text_lint.controller import Controller
+from text_lint.operations.lookups.encoders.reversed import ReversedEncoder
+from text_lint.operations.lookups.encoders.sorted import SortedEncoder
+from text_lint.operations.lookups.encoders.tree import ResultTreeEncoder
+from text_lint.operations.lookups.encoders.unique import UniqueEncoder
+from text_lint.operations.validators.args.result_set import ResultSet
+from text_lint.results.cursor import ResultTreeCursor
+from text_lint.results.tree import ResultTree
+from text_lint.schema import Schema
+
+AliasCase = Callable[[int], Callable[[], Any]]
+
+LOOKUPS = (
+    "commands.capture.0.to_sorted",
+    "commands.capture.to_unique",
+    "helps.capture.0.to_json",
+    "phonies.capture.0.to_upper",
+)
+
+
+class GrowthCases:
+  """Create each timed operation, for a text file or result of a given size."""
+
+  names = (
+      "cursor_traversal",
+      "encoders",
+      "lookups",
+      "rules_loops",
+      "rules_makefile",
+      "rules_sections",
+      "validators",
+  )
+
+  def __init__(self, directory: str) -> None:
+    self.directory = directory
+    self.schema = Schema(corpus.SCHEMA_PATH)
+    self.schema.load_rules()
+    self.schema.load_validators()
+
+  def cases(self) -> Dict[str, AliasCase]:
+    """Return the operations to measure, by name."""
+
+    return {name: getattr(self, name) for name in self.names}
+
+  def create_controller(self, size: int, shape: str) -> Controller:
+    """Create a controller for a synthetic Makefile of the specified size."""
+
+    file_path = os.path.join(self.directory, "{0}_{1}.mk".format(shape, size))
+    if not os.path.exists(file_path):
+      with open(file_path, "w", encoding="utf-8") as fh:
+        corpus.write(fh, size, shape)
+    return Controller(file_path, self.schema)
+
+  def create_parsed_controller(self, size: int) -> Controller:
+    """Create a controller that has applied all rules to a Makefile."""
+
+    controller = self.create_controller(size, corpus.TYPICAL_SHAPE)
+    controller._parse()  # pylint: disable=protected-access
+    return controller
+
+  def cursor_traversal(self, size: int) -> Callable[[], Any]:
+    tree = ResultTree.create(value="targets")
+    for index in range(0, size):
+      tree.add_matches(("target_{0}".format(index), "a b c"), {2: " "})
+    cursor = ResultTreeCursor()
+
+    def benchmark() -> None:
+      cursor.location = [tree]
+      cursor.traverse()
+      cursor.traverse()
+      cursor.flatten()
+
+    return benchmark
+
+  def encoders(self, size: int) -> Callable[[], Any]:
+    results = [
+        ["target_{0}".format(index % (size // 2 + 1)), "value"]
+        for index in range(0, size)
+    ]
+    tree = ResultTree.create(value="targets")
+    for index in range(0, size):
+      tree.add_matches(("target_{0}".format(index),), {})
+    trees = [[tree]]
+    encoders = (ReversedEncoder(), SortedEncoder(), UniqueEncoder())
+    tree_encoder = ResultTreeEncoder()
+
+    def benchmark() -> None:
+      for encoder in encoders:
+        encoder.transform(results)
+      tree_encoder.transform(trees)
+
+    return benchmark
+
+  def lookups(self, size: int) -> Callable[[], Any]:
+    controller = self.create_parsed_controller(size)
+    result_sets = [ResultSet(lookup, "growth") for lookup in LOOKUPS]
+
+    def benchmark() -> None:
+      controller.forest.lookup_cache.clear()
+      for result_set in result_sets:
+        controller.forest.lookup(controller, result_set, "growth")
+
+    return benchmark
+
+  def rules_loops(self, size: int) -> Callable[[], Any]:
+    return self.rules(size, "many_loops")
+
+  def rules_makefile(self, size: int) -> Callable[[], Any]:
+    return self.rules(size, corpus.TYPICAL_SHAPE)
+
+  def rules_sections(self, size: int) -> Callable[[], Any]:
+    return self.rules(size, "huge_section")
+
+  def rules(self, size: int, shape: str) -> Callable[[], Any]:
+    self.create_controller(size, shape)
+
+    def benchmark() -> None:
+      controller = self.create_controller(size, shape)
+      controller._parse()  # pylint: disable=protected-access
+
+    return benchmark
+
+  def validators(self, size: int) -> Callable[[], Any]:
+    """Apply the validators, after applying the rules they depend on."""
+
+    def benchmark() -> None:
+      controller = self.create_parsed_controller(size)
+      with redirect_stdout(io.StringIO()):
+        controller._run_validators()  # pylint: disable=protected-access
+
+    return benchmark
+
+
+def fit_exponent(sizes: Sequence[int], seconds: Sequence[float]) -> float:
+  """Return the least squares slope of the timings on a log-log scale."""
+
+  log_sizes = [math.log(size) for size in sizes]
+  log_seconds = [math.log(max(second, 1e-9)) for second in seconds]
+  mean_size = sum(log_sizes) / len(log_sizes)
+  mean_seconds = sum(log_seconds) / len(log_seconds)
+  covariance = sum(
+      (log_size - mean_size) * (log_second - mean_seconds)
+      for log_size, log_second in zip(log_sizes, log_seconds)
+  )
+  variance = sum((log_size - mean_size)**2 for log_size in log_sizes)
+  return covariance / variance
+
+
+def measure(
+    case: AliasCase,
+    sizes: Sequence[int],
+    repeat: int,
+) -> Tuple[List[float], float]:
+  """Return the best time at each size, and the fitted growth exponent."""
+
+  seconds = [
+      min(timeit.repeat(case(size), number=1, repeat=repeat)) for size in sizes
+  ]
+  return seconds, fit_exponent(sizes, seconds)
+
+
+def main() -> None:
+  parser = argparse.ArgumentParser(description=__doc__)
+  parser.add_argument(
+      "--cases",
+      choices=GrowthCases.names,
+      default=GrowthCases.names,
+      nargs="+",
+  )
+  parser.add_argument("--factor", default=2, type=int)
+  parser.add_argument("--repeat", default=3, type=int)
+  parser.add_argument("--start", default=5000, type=int)
+  parser.add_argument("--steps", default=5, type=int)
+  parser.add_argument("--threshold", default=1.3, type=float)
+  args = parser.parse_args()
+
+  sizes = [args.start * args.factor**step for step in range(args.steps)]
+  failures = []
+
+  print(
+      "{0:<20} {1:>10} {2:>10} {3:>10}  {4}".format(
+          "operation",
+          "smallest",
+          "largest",
+          "exponent",
+          "seconds",
+      )
+  )
+  with tempfile.TemporaryDirectory() as directory:
+    cases = GrowthCases(directory).cases()
+    for name in args.cases:
+      seconds, exponent = measure(cases[name], sizes, args.repeat)
+      if exponent > args.threshold:
+        failures.append(name)
+      print(
+          "{0:<20} {1:>10} {2:>10} {3:>10.2f}  {4}".format(
+              name,
+              sizes[0],
+              sizes[-1],
+              exponent,
+              " ".join("{0:.4f}".format(second) for second in seconds),
+          )
+      )
+
+  if failures:
+    print(
+        "growth exponent above {0}: {1}".format(
+            args.threshold,
+            ", ".join(failures),
+        ),
+        file=sys.stderr,
+    )
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+  main()
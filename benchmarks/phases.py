@@ -0,0 +1,158 @@
+"""Measure the time and peak memory of each phase of linting a Makefile.
+
+The adversarial shapes are measured at smaller sizes by default, as some of
+them create hundreds of result tree nodes for each line.
+"""
+# pylint: disable=protected-access
+
+import argparse
+import io
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+from typing import Callable, Dict, List, Tuple
+
+from benchmarks import corpus
+from text_lint.controller import Controller
+from text_lint.schema import Schema
+from text_lint.sequencers import textfile_registry
+from text_lint.sequencers.textfile import TextFileSequencer
+
+MEGABYTE = 1024 * 1024
+
+AliasPhases = List[Tuple[str, Callable[[], None]]]
+AliasMeasurements = Dict[str, Dict[str, float]]
+
+
+def create_phases(file_path: str, textfile_mode: str) -> AliasPhases:
+  """Return each phase of linting a text file, in the order they run."""
+
+  state: Dict[str, Schema] = {}
+  controllers: List[Controller] = []
+
+  def load_schema() -> None:
+    schema = Schema(corpus.SCHEMA_PATH)
+    schema.load_rules()
+    schema.load_validators()
+    state["schema"] = schema
+
+  def read() -> None:
+    controllers.append(Controller(file_path, state["schema"], textfile_mode))
+
+  def rules() -> None:
+    controllers[0]._parse()
+
+  def validators() -> None:
+    controllers[0]._run_validators()
+
+  return [
+      ("schema", load_schema),
+      ("read", read),
+      ("rules", rules),
+      ("validators", validators),
+  ]
+
+
+def measure(file_path: str, textfile_mode: str) -> AliasMeasurements:
+  """Time each phase, and then measure each phase's peak memory separately.
+
+  Tracing memory allocations slows Python down considerably, so the phases
+  are repeated with tracemalloc enabled after they have been timed.
+  """
+
+  measurements: AliasMeasurements = {}
+
+  with redirect_stdout(io.StringIO()):
+    for name, phase in create_phases(file_path, textfile_mode):
+      start = time.perf_counter()
+      phase()
+      measurements[name] = {"seconds": time.perf_counter() - start}
+
+    tracemalloc.start()
+    for name, phase in create_phases(file_path, textfile_mode):
+      tracemalloc.reset_peak()
+      phase()
+      measurements[name]["peak_mb"] = (
+          tracemalloc.get_traced_memory()[1] / MEGABYTE
+      )
+    tracemalloc.stop()
+
+  return measurements
+
+
+def main() -> None:
+  parser = argparse.ArgumentParser(description=__doc__)
+  parser.add_argument(
+      "--mode",
+      choices=sorted(textfile_registry),
+      default=TextFileSequencer.mode,
+  )
+  parser.add_argument("--output", default="benchmarks.json")
+  parser.add_argument(
+      "--shapes",
+      choices=sorted(corpus.shapes),
+      default=sorted(corpus.shapes),
+      nargs="+",
+  )
+  parser.add_argument(
+      "--sizes",
+      default=[1000, 100000, 10000000],
+      nargs="+",
+      type=int,
+  )
+  parser.add_argument(
+      "--adversarial-sizes",
+      default=[1000, 100000],
+      nargs="+",
+      type=int,
+  )
+  args = parser.parse_args()
+
+  results = []
+  print(
+      "{0:<14} {1:>10} {2:<12} {3:>10} {4:>10}".format(
+          "shape",
+          "lines",
+          "phase",
+          "seconds",
+          "peak MB",
+      )
+  )
+  with tempfile.TemporaryDirectory() as directory:
+    for shape in args.shapes:
+      sizes = args.sizes
+      if shape != corpus.TYPICAL_SHAPE:
+        sizes = args.adversarial_sizes
+      for size in sizes:
+        file_path = os.path.join(directory, shape + ".mk")
+        with open(file_path, "w", encoding="utf-8") as fh:
+          corpus.write(fh, size, shape)
+        measurements = measure(file_path, args.mode)
+        for phase, measurement in measurements.items():
+          print(
+              "{0:<14} {1:>10} {2:<12} {3:>10.4f} {4:>10.1f}".format(
+                  shape,
+                  size,
+                  phase,
+                  measurement["seconds"],
+                  measurement["peak_mb"],
+              )
+          )
+        results.append(
+            {
+                "lines": size,
+                "mode": args.mode,
+                "phases": measurements,
+                "shape": shape,
+            }
+        )
+
+  with open(args.output, "w", encoding="utf-8") as fh:
+    json.dump(results, fh, indent=2)
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,85 @@
+"""Measure the time and memory used to store saved results."""
+
+import argparse
+import functools
+import re
+import timeit
+import tracemalloc
+from typing import List, Match
+
+from text_lint.results.forest import ResultForest
+from text_lint.results.tree import ResultTree
+
+MEGABYTE = 1024 * 1024
+
+
+def create_matches(size: int, targets: int) -> List[Match[str]]:
+  """Create regex matches for target and dependency lines."""
+
+  pattern = re.compile(r"(\w+): (.*)")
+  matches: List[Match[str]] = []
+  for index in range(0, size):
+    line = "target_{0}: dependency_{1} dependency_{2}".format(
+        index % targets,
+        index % 100,
+        index % 7,
+    )
+    match = pattern.match(line)
+    assert match
+    matches.append(match)
+  return matches
+
+
+def create_forest(matches: List[Match[str]]) -> ResultForest:
+  """Save the capture groups of each match, splitting the dependencies."""
+
+  forest = ResultForest()
+  tree = ResultTree.create(value="targets", arena=forest.arena)
+  for match in matches:
+    tree.add_matches(match.groups(), {2: " "})
+  forest.add(tree)
+  return forest
+
+
+def main() -> None:
+  parser = argparse.ArgumentParser(description=__doc__)
+  parser.add_argument("--repeat", default=3, type=int)
+  parser.add_argument("--size", default=200000, type=int)
+  args = parser.parse_args()
+
+  print(
+      "{0:<10} {1:>10} {2:>10} {3:>10} {4:>12}".format(
+          "targets",
+          "nodes",
+          "seconds",
+          "MB",
+          "bytes/node",
+      )
+  )
+  for targets in (args.size, 1000):
+    matches = create_matches(args.size, targets)
+    seconds = min(
+        timeit.repeat(
+            functools.partial(create_forest, matches),
+            number=1,
+            repeat=args.repeat,
+        )
+    )
+    tracemalloc.start()
+    forest = create_forest(matches)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    nodes = len(forest.arena)
+    print(
+        "{0:<10} {1:>10} {2:>10.4f} {3:>10.1f} {4:>12.1f}".format(
+            targets,
+            nodes,
+            seconds,
+            size / MEGABYTE,
+            size / nodes,
+        )
+    )
+
+
+if __name__ == "__main__":
+  main()
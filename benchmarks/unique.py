@@ -0,0 +1,98 @@
+"""Measure how deduplication scales as the number of results grows."""
+
+import argparse
+import timeit
+from typing import Any, Callable, List, Tuple
+
+from text_lint.operations.lookups.encoders.unique import UniqueEncoder
+from text_lint.results.cursor import ResultTreeCursor
+from text_lint.results.tree import ResultTree
+from text_lint.utilities.collections import unique_list
+
+AliasBenchmark = Tuple[str, Callable[[int], Callable[[], Any]]]
+
+
+def create_results(size: int) -> List[List[str]]:
+  """Create nested capture results, with half of them repeated."""
+
+  return [
+      ["Target_{0}".format(index % (size // 2)), "Value"]
+      for index in range(0, size)
+  ]
+
+
+def create_tree(size: int) -> ResultTree:
+  """Create a saved result tree, with half of its children repeated."""
+
+  tree = ResultTree.create(value="targets")
+  for index in range(0, size):
+    tree.add_matches(("Target_{0}".format(index % (size // 2)),), {})
+  return tree
+
+
+def unique_list_benchmark(size: int) -> Callable[[], Any]:
+  results = create_results(size)
+  return lambda: unique_list(results)
+
+
+def unique_encoder_benchmark(size: int) -> Callable[[], Any]:
+  encoder = UniqueEncoder()
+  results = create_results(size)
+  return lambda: encoder.transform(results)
+
+
+def cursor_unique_benchmark(size: int) -> Callable[[], Any]:
+  cursor = ResultTreeCursor()
+  tree = create_tree(size)
+
+  def benchmark() -> None:
+    cursor.location = [list(tree.children), tree]
+    cursor.unique()
+
+  return benchmark
+
+
+def main() -> None:
+  parser = argparse.ArgumentParser(description=__doc__)
+  parser.add_argument("--repeat", default=3, type=int)
+  parser.add_argument(
+      "--sizes", default=[12500, 25000, 50000, 100000], nargs="+", type=int
+  )
+  args = parser.parse_args()
+
+  benchmarks: List[AliasBenchmark] = [
+      ("unique_list", unique_list_benchmark),
+      ("UniqueEncoder", unique_encoder_benchmark),
+      ("ResultTreeCursor", cursor_unique_benchmark),
+  ]
+
+  print(
+      "{0:<20} {1:>10} {2:>10} {3:>12} {4:>8}".format(
+          "deduplication",
+          "size",
+          "seconds",
+          "us/result",
+          "growth",
+      )
+  )
+  for name, create_benchmark in benchmarks:
+    previous_seconds = None
+    for size in args.sizes:
+      seconds = min(
+          timeit.repeat(create_benchmark(size), number=1, repeat=args.repeat)
+      )
+      growth = seconds / previous_seconds if previous_seconds else 1.0
+      print(
+          "{0:<20} {1:>10} {2:>10.4f} {3:>12.3f} {4:>7.2f}x".format(
+              name,
+              size,
+              seconds,
+              seconds / size * 1000000,
+              growth,
+          )
+      )
+      previous_seconds = seconds
+
+
+if __name__ == "__main__":
+  main()
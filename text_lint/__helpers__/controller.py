@@ -0,0 +1,32 @@
+"""Shared controller testing helpers."""
+
+from typing import Any, List
+
+import pytest
+from text_lint.__helpers__.translations import assert_all_translated
+from text_lint.exceptions.controller import CollectedErrors
+from text_lint.utilities.translations import f as translation_f
+
+
+def assert_is_collected_errors(
+    exc: pytest.ExceptionInfo[CollectedErrors],
+    errors: List[Exception],
+    limit_reached: bool,
+) -> None:
+  expected_translation = []
+
+  def f(*args: Any, nl: int = 0, **kwargs: Any) -> str:
+    expected_translation.append(args[0])
+    return translation_f(*args, nl=nl, **kwargs)
+
+  message = f(CollectedErrors.msg_fmt_error_count, len(errors), nl=1)
+  for error in errors:
+    message += translation_f("{0}", str(error).rstrip(), nl=1)
+  if limit_reached:
+    message += f(CollectedErrors.msg_fmt_error_limit, nl=1)
+
+  assert exc.value.__class__ == CollectedErrors
+  assert exc.value.args[0] == message
+  assert exc.value.errors == errors
+  assert exc.value.limit_reached == limit_reached
+  assert_all_translated(expected_translation)
@@ -235,3 +235,31 @@ result_sorting_test_cases = pytest.mark.parametrize(
     ],
     ids=["list", "tuple", "dict", "nested"]
 )
+
+result_encoding_test_cases = pytest.mark.parametrize(
+    "result", [
+        "Value",
+        ["b", "A", "b", ("c", "C"), 1],
+        [["b", "a"], ["A", "b"], ["b", "a"], ("b", "a"), ("b", ["a", "a"])],
+        {
+            "Key": ["b", "a", "b"],
+            "nested": {
+                "Key": ("B", "a", "a")
+            },
+        },
+        [
+            {
+                "value": "A",
+                "children": ({
+                    "value": "b",
+                    "children": ()
+                },),
+            },
+            {
+                "value": "A",
+                "children": (),
+            },
+        ],
+    ],
+    ids=["string", "list", "nested_list", "dict", "representation"]
+)
@@ -1,13 +1,14 @@
 """Shared integration test fixtures."""
 # pylint: disable=redefined-outer-name
 
-from io import StringIO
+from pathlib import Path
 from typing import Callable
 from unittest import mock
 
 import pytest
 from text_lint.controller import Controller
 from text_lint.schema import Schema
+from text_lint.sequencers import textfile_registry
 from text_lint.sequencers.rules import RuleSequencer
 from text_lint.sequencers.textfile import TextFileSequencer
 
@@ -32,38 +33,33 @@ def mocked_controller() -> mock.MagicMock:
 
 
 @pytest.fixture
-def mocked_file_content_schema() -> StringIO:
-  return StringIO()
+def schema_path(tmp_path: Path) -> str:
+  return str(tmp_path / "schema.yml")
 
 
 @pytest.fixture
-def mocked_file_content_file() -> StringIO:
-  return StringIO()
+def textfile_path(tmp_path: Path) -> str:
+  return str(tmp_path / "textfile.txt")
 
 
-@pytest.fixture
-def mocked_file_handle(
-    mocked_file_content_schema: StringIO,
-    mocked_file_content_file: StringIO,
-) -> mock.MagicMock:
-  instance = mock.MagicMock()
-  instance.return_value.__enter__.side_effect = (
-      mocked_file_content_schema,
-      mocked_file_content_file,
-  )
-  return instance
+@pytest.fixture(params=sorted(textfile_registry))
+def textfile_mode(request: pytest.FixtureRequest) -> str:
+  return str(request.param)
 
 
 @pytest.fixture
 def create_controller_instance(
-    patch_schema: Callable[[str], None],
-    patch_textfile: Callable[[str], None],
+    create_schema_file: Callable[[str], None],
+    create_textfile: Callable[[str], None],
+    schema_path: str,
+    textfile_path: str,
+    textfile_mode: str,
 ) -> Callable[[str, str], Controller]:
 
   def setup(schema_content: str, textfile_content: str) -> Controller:
-    patch_schema(schema_content)
-    patch_textfile(textfile_content)
-    controller = Controller("mock/file/1", "mock/file/2")
+    create_schema_file(schema_content)
+    create_textfile(textfile_content)
+    controller = Controller(textfile_path, Schema(schema_path), textfile_mode)
     return controller
 
   return setup
@@ -72,53 +68,39 @@ def create_controller_instance(
 @pytest.fixture
 def create_mocked_controller(
     mocked_controller: mock.MagicMock,
-    patch_schema: Callable[[str], None],
-    patch_textfile: Callable[[str], None],
+    create_schema_file: Callable[[str], None],
+    create_textfile: Callable[[str], None],
+    schema_path: str,
+    textfile_path: str,
 ) -> Callable[[str, str], mock.Mock]:
 
   def setup(schema_content: str, textfile_content: str) -> mock.Mock:
-    patch_schema(schema_content)
-    schema = Schema("mock/schema/file/path")
-    patch_textfile(textfile_content)
+    create_schema_file(schema_content)
+    schema = Schema(schema_path)
+    create_textfile(textfile_content)
     mocked_controller.rules = RuleSequencer(schema)
-    mocked_controller.textfile = TextFileSequencer("mock/text/file/path")
+    mocked_controller.textfile = TextFileSequencer(textfile_path)
     return mocked_controller
 
   return setup
 
 
 @pytest.fixture
-def patch_schema(
-    mocked_file_content_schema: StringIO,
-    mocked_file_handle: mock.MagicMock,
-    monkeypatch: pytest.MonkeyPatch,
-) -> Callable[[str], None]:
+def create_schema_file(schema_path: str) -> Callable[[str], None]:
 
   def setup(content: str) -> None:
-    monkeypatch.setattr(
-        "builtins.open",
-        mocked_file_handle,
-    )
-    mocked_file_content_schema.write(content)
-    mocked_file_content_schema.seek(0)
+    with open(schema_path, "w", encoding="utf-8") as fh:
+      fh.write(content)
 
   return setup
 
 
 @pytest.fixture
-def patch_textfile(
-    mocked_file_content_file: StringIO,
-    mocked_file_handle: mock.MagicMock,
-    monkeypatch: pytest.MonkeyPatch,
-) -> Callable[[str], None]:
+def create_textfile(textfile_path: str) -> Callable[[str], None]:
 
   def setup(content: str) -> None:
-    monkeypatch.setattr(
-        "builtins.open",
-        mocked_file_handle,
-    )
-    mocked_file_content_file.write(content)
-    mocked_file_content_file.seek(0)
+    with open(textfile_path, "w", encoding="utf-8") as fh:
+      fh.write(content)
 
   return setup
 
@@ -189,3 +171,113 @@ def yaml_nested_infinite_sequence() -> str:
               operation: assert_equal
               expected: "a\\n"
     """ + YAML_SUFFIX
+
+
+@pytest.fixture
+def yaml_saved_sequence() -> str:
+  return YAML_PREFIX + """
+    - name: read infinite lines
+      operation: assert_sequence_begins
+      count: -1
+      rules:
+        - name: read blank line
+          operation: assert_blank
+        - name: read a line
+          operation: assert_regex
+          regex: "^(.+)\\n$"
+          save: lines
+    """ + """
+validators:
+  - name: combine lines
+    operation: validate_combine
+    saved:
+      - lines.capture
+    new_saved: combined
+"""
+
+
+@pytest.fixture
+def yaml_section_sequence() -> str:
+  return YAML_PREFIX + """
+    - name: read infinite sections
+      operation: assert_sequence_begins
+      count: -1
+      rules:
+        - name: read a header
+          operation: assert_equal
+          expected: "header\\n"
+        - name: read a section
+          operation: assert_regex_section
+          regex: "^(.+)\\n$"
+          save: sections
+    """ + """
+validators:
+  - name: combine all sections
+    operation: validate_combine
+    saved:
+      - sections.capture
+    new_saved: combined
+"""
+
+
+@pytest.fixture
+def yaml_section_only_sequence() -> str:
+  return YAML_PREFIX + """
+    - name: read infinite sections
+      operation: assert_sequence_begins
+      count: -1
+      rules:
+        - name: read a section
+          operation: assert_regex_section
+          regex: "^(.+)\\n$"
+          save: sections
+    """ + """
+validators:
+  - name: combine all sections
+    operation: validate_combine
+    saved:
+      - sections.capture
+    new_saved: combined
+"""
+
+
+@pytest.fixture
+def yaml_unused_save_sequence() -> str:
+  return YAML_PREFIX + """
+    - name: read infinite lines
+      operation: assert_sequence_begins
+      count: -1
+      rules:
+        - name: read a line
+          operation: assert_regex
+          regex: "^(.+)\\n$"
+          save: lines
+    """ + YAML_SUFFIX
+
+
+@pytest.fixture
+def yaml_unique_sequence() -> str:
+  return YAML_PREFIX + """
+    - name: read infinite lines
+      operation: assert_sequence_begins
+      count: -1
+      rules:
+        - name: read blank line
+          operation: assert_blank
+        - name: read a line
+          operation: assert_regex
+          regex: "^(.+)\\n$"
+          save: lines
+    """ + """
+validators:
+  - name: combine unique lines
+    operation: validate_combine
+    saved:
+      - lines.unique.capture
+    new_saved: unique
+  - name: combine all lines
+    operation: validate_combine
+    saved:
+      - lines.capture
+    new_saved: combined
+"""
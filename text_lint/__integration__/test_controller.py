@@ -1,14 +1,20 @@
 """Controller integration testing."""
 
-from typing import TYPE_CHECKING, Callable, Optional, Type
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, List, Optional, Type
 
 import pytest
 from text_lint.config import NEW_LINE
+from text_lint.controller import Controller
+from text_lint.exceptions.controller import CollectedErrors
 from text_lint.exceptions.rules import RuleViolation
 from text_lint.exceptions.sequencers import UnconsumedData
+from text_lint.schema import Schema
 
 if TYPE_CHECKING:
-  from text_lint.controller import Controller
+  from text_lint.results.tree import ResultTree
 
 
 class TestController:
@@ -20,7 +26,7 @@ class TestController:
 
   def call_controller(
       self,
-      controller: "Controller",
+      controller: Controller,
       exception: Optional[Type[Exception]],
   ) -> None:
     if exception:
@@ -29,6 +35,9 @@ class TestController:
     else:
       controller.start()
 
+  def get_values(self, tree: "ResultTree") -> List[str]:
+    return [child.value for child in tree.children]
+
   @pytest.mark.parametrize(
       "data,exception",
       [
@@ -40,7 +49,7 @@ class TestController:
   )
   def test_simple_sequence__vary_file__raises_correct_exception(
       self,
-      create_controller_instance: Callable[[str, str], "Controller"],
+      create_controller_instance: Callable[[str, str], Controller],
       yaml_simple_sequence: str,
       data: str,
       exception: Optional[Type[Exception]],
@@ -60,7 +69,7 @@ class TestController:
   )
   def test_nested_sequence__vary_file__raises_correct_exception(
       self,
-      create_controller_instance: Callable[[str, str], "Controller"],
+      create_controller_instance: Callable[[str, str], Controller],
       yaml_nested_sequence: str,
       data: str,
       exception: Optional[Type[Exception]],
@@ -80,7 +89,7 @@ class TestController:
   )
   def test_infinite_sequence__vary_file__raises_correct_exception(
       self,
-      create_controller_instance: Callable[[str, str], "Controller"],
+      create_controller_instance: Callable[[str, str], Controller],
       yaml_infinite_sequence: str,
       data: str,
       exception: Optional[Type[Exception]],
@@ -100,7 +109,7 @@ class TestController:
   )
   def test_nested_infinite_sequence__vary_file__raises_correct_exception(
       self,
-      create_controller_instance: Callable[[str, str], "Controller"],
+      create_controller_instance: Callable[[str, str], Controller],
       yaml_nested_infinite_sequence: str,
       data: str,
       exception: Optional[Type[Exception]],
@@ -108,3 +117,162 @@ class TestController:
     controller = create_controller_instance(yaml_nested_infinite_sequence, data)
 
     self.call_controller(controller, exception)
+
+  def test_shared_schema__multiple_files__creates_independent_results(
+      self,
+      create_controller_instance: Callable[[str, str], Controller],
+      yaml_saved_sequence: str,
+      textfile_mode: str,
+      textfile_path: str,
+      create_textfile: Callable[[str], None],
+  ) -> None:
+    first_controller = create_controller_instance(
+        yaml_saved_sequence,
+        (NEW_LINE + "a" + NEW_LINE) * 2,
+    )
+    first_controller.start()
+    schema = first_controller.schema
+    assert isinstance(schema, Schema)
+    create_textfile((NEW_LINE + "b" + NEW_LINE) * 3)
+    second_controller = Controller(textfile_path, schema, textfile_mode)
+
+    second_controller.start()
+
+    assert self.get_values(first_controller.forest.trees["combined"]) == [
+        "a",
+        "a",
+    ]
+    assert self.get_values(second_controller.forest.trees["combined"]) == [
+        "b",
+        "b",
+        "b",
+    ]
+
+  def test_shared_schema__thread_pool__creates_independent_results(
+      self,
+      create_schema_file: Callable[[str], None],
+      yaml_saved_sequence: str,
+      schema_path: str,
+      textfile_mode: str,
+      tmp_path: Path,
+  ) -> None:
+    create_schema_file(yaml_saved_sequence)
+    schema = Schema(schema_path)
+    expected_results: List[List[str]] = []
+    file_paths: List[str] = []
+    for index in range(20):
+      expected_results.append([str(index)] * (index + 1))
+      file_paths.append(os.path.join(tmp_path, "{0}.txt".format(index)))
+      with open(file_paths[-1], "w", encoding="utf-8") as fh:
+        fh.write((NEW_LINE + str(index) + NEW_LINE) * (index + 1))
+
+    def lint(file_path: str) -> List[str]:
+      controller = Controller(file_path, schema, textfile_mode)
+      controller.start()
+      return self.get_values(controller.forest.trees["combined"])
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+      results = list(executor.map(lint, file_paths))
+
+    assert results == expected_results
+
+  def test_section_sequence__multiple_sections__saves_each_line_once(
+      self,
+      create_controller_instance: Callable[[str, str], Controller],
+      yaml_section_sequence: str,
+  ) -> None:
+    controller = create_controller_instance(
+        yaml_section_sequence,
+        ("header" + NEW_LINE + "a" + NEW_LINE + "b" + NEW_LINE + NEW_LINE) * 3,
+    )
+
+    controller.start()
+
+    assert self.get_values(controller.forest.trees["sections"]) == [
+        "a",
+        "b",
+    ] * 3
+
+  def test_section_only_sequence__eof__stops_reading_sections(
+      self,
+      create_controller_instance: Callable[[str, str], Controller],
+      yaml_section_only_sequence: str,
+  ) -> None:
+    controller = create_controller_instance(
+        yaml_section_only_sequence,
+        NEW_LINE.join(["a" + NEW_LINE + "b" + NEW_LINE] * 3),
+    )
+
+    controller.start()
+
+    assert self.get_values(controller.forest.trees["sections"]) == [
+        "a",
+        "b",
+    ] * 3
+
+  def test_section_sequence__max_errors__resynchronizes_with_next_section(
+      self,
+      create_controller_instance: Callable[[str, str], Controller],
+      yaml_section_sequence: str,
+  ) -> None:
+    controller = create_controller_instance(
+        yaml_section_sequence,
+        "".join(
+            header + NEW_LINE + "a" + NEW_LINE + "b" + NEW_LINE + NEW_LINE
+            for header in ("header", "invalid", "invalid", "header")
+        ),
+    )
+    controller.max_errors = 10
+
+    with pytest.raises(CollectedErrors) as exc:
+      controller.start()
+
+    assert exc.value.limit_reached is False
+    assert [error.__class__ for error in exc.value.errors] == [
+        RuleViolation,
+        RuleViolation,
+    ]
+    assert "FILE LINE NUMBER: 5" in str(exc.value.errors[0])
+    assert "FILE LINE NUMBER: 9" in str(exc.value.errors[1])
+    assert self.get_values(controller.forest.trees["combined"]) == [
+        "a",
+        "b",
+    ] * 2
+
+  def test_unused_save__multiple_lines__does_not_save_results(
+      self,
+      create_controller_instance: Callable[[str, str], Controller],
+      yaml_unused_save_sequence: str,
+  ) -> None:
+    controller = create_controller_instance(
+        yaml_unused_save_sequence,
+        "a" + NEW_LINE + "b" + NEW_LINE,
+    )
+
+    controller.start()
+
+    assert controller.unused_saves == frozenset({"lines"})
+    assert not controller.forest.captures
+    assert not controller.forest.trees
+
+  def test_unique_lookup__duplicate_results__does_not_modify_saved_results(
+      self,
+      create_controller_instance: Callable[[str, str], Controller],
+      yaml_unique_sequence: str,
+  ) -> None:
+    controller = create_controller_instance(
+        yaml_unique_sequence,
+        (NEW_LINE + "a" + NEW_LINE + NEW_LINE + "b" + NEW_LINE) * 3,
+    )
+
+    controller.start()
+
+    assert self.get_values(controller.forest.trees["unique"]) == ["a", "b"]
+    assert self.get_values(controller.forest.trees["combined"]) == [
+        "a",
+        "b",
+    ] * 3
+    assert self.get_values(controller.forest.trees["lines"]) == [
+        "a",
+        "b",
+    ] * 3
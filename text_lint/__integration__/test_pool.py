@@ -0,0 +1,57 @@
+"""Integration tests for the ControllerPool class."""
+
+import os
+from pathlib import Path
+
+import pytest
+from text_lint.exceptions.schema import SchemaError
+from text_lint.pool import ControllerPool
+from text_lint.sequencers.textfile import TextFileSequencer
+
+SCHEMA_CONTENT = """
+version: "0.1.0"
+rules:
+  - name: example assert equal
+    operation: assert_equal
+    expected: "hello\\n"
+    save: greeting
+validators: []
+"""
+
+
+class TestControllerPool:
+  """Integration tests for the ControllerPool class."""
+
+  def test_start__multiple_files__yields_ordered_results(
+      self,
+      tmp_path: Path,
+  ) -> None:
+    schema_path = os.path.join(tmp_path, "schema.yml")
+    with open(schema_path, "w", encoding="utf-8") as fh:
+      fh.write(SCHEMA_CONTENT)
+    file_paths = []
+    for index, content in enumerate(["hello\n", "goodbye\n", "hello\n"]):
+      file_paths.append(os.path.join(tmp_path, "file{0}.txt".format(index)))
+      with open(file_paths[-1], "w", encoding="utf-8") as fh:
+        fh.write(content)
+    instance = ControllerPool(schema_path, TextFileSequencer.mode, 2)
+
+    results = list(instance.start(file_paths))
+
+    assert [result.file_path for result in results] == file_paths
+    assert results[0].error is None
+    assert results[1].error is not None
+    assert results[1].error.startswith("RuleViolation: ")
+    assert results[2].error is None
+
+  def test_start__invalid_schema__raises_exception_once(
+      self,
+      tmp_path: Path,
+  ) -> None:
+    schema_path = os.path.join(tmp_path, "schema.yml")
+    with open(schema_path, "w", encoding="utf-8") as fh:
+      fh.write('version: "x"\n')
+    instance = ControllerPool(schema_path, TextFileSequencer.mode, 2)
+
+    with pytest.raises(SchemaError):
+      list(instance.start([schema_path, schema_path]))
@@ -1,11 +1,20 @@
 """CheckCommand class."""
 
+import json
+import sys
 from argparse import ArgumentParser, Namespace
+from typing import Any, Dict, List
 
 from text_lint.cli.commands.bases.command_base import CLICommandBase
 from text_lint.cli.types.file_type import file_type
-from text_lint.controller import Controller
-from text_lint.utilities.translations import _
+from text_lint.cli.types.jobs_type import jobs_type
+from text_lint.cli.types.max_errors_type import max_errors_type
+from text_lint.pool import ControllerPool
+from text_lint.profiler import Profiler
+from text_lint.sequencers import textfile_registry
+from text_lint.sequencers.textfile import TextFileSequencer
+from text_lint.statistics import Statistics
+from text_lint.utilities.translations import _, f
 
 
 class CheckCommand(CLICommandBase):
@@ -15,7 +24,20 @@ class CheckCommand(CLICommandBase):
   command_name = _("check")
 
   arg_filename_help = _("the text file(s) to lint")
+  arg_jobs_help = _("the number of text files to lint in parallel")
+  arg_max_errors_help = _(
+      "the number of errors to collect from each text file before stopping"
+  )
+  arg_mode_help = _("the method used to read each text file")
+  arg_profile_help = _(
+      "report the time spent applying each schema operation to stderr"
+  )
   arg_schema_help = _("the schema to apply")
+  arg_statistics_help = _("write statistics for each text file to a JSON file")
+
+  msg_fmt_unused_save = _(
+      "warning: the saved result '{0}' is not used by any validator"
+  )
 
   def create_parser(self, command_parser: "ArgumentParser") -> None:
     """Create an argument parser for this CLI command."""
@@ -33,10 +55,86 @@ class CheckCommand(CLICommandBase):
         required=True,
         type=file_type,
     )
+    command_parser.add_argument(
+        "-m",
+        "--mode",
+        help=self.arg_mode_help,
+        choices=sorted(textfile_registry),
+        default=TextFileSequencer.mode,
+    )
+    command_parser.add_argument(
+        "-j",
+        "--jobs",
+        help=self.arg_jobs_help,
+        type=jobs_type,
+        default=1,
+    )
+    command_parser.add_argument(
+        "--max-errors",
+        help=self.arg_max_errors_help,
+        type=max_errors_type,
+        default=1,
+    )
+    command_parser.add_argument(
+        "--profile",
+        help=self.arg_profile_help,
+        action="store_true",
+    )
+    command_parser.add_argument(
+        "--statistics",
+        help=self.arg_statistics_help,
+        default=None,
+    )
 
   def invoke(self, args: "Namespace") -> None:
     """Invoke this CLI command."""
 
-    for filename in args.filenames:
-      ctrl = Controller(filename, args.schema)
-      ctrl.start()
+    failures = 0
+    profiler = Profiler()
+    statistics = Statistics()
+    file_statistics: List[Dict[str, Any]] = []
+    pool = ControllerPool(
+        args.schema,
+        args.mode,
+        args.jobs,
+        args.profile,
+        args.statistics is not None,
+        max_errors=args.max_errors,
+    )
+
+    for result in pool.start(args.filenames):
+      sys.stdout.write(result.output)
+      sys.stdout.flush()
+      if result.error is not None:
+        failures += 1
+        sys.stderr.write(f("{0}: {1}", result.file_path, result.error, nl=1))
+      if result.profiler is not None:
+        profiler.merge(result.profiler)
+      if result.statistics is not None:
+        statistics.merge(result.statistics)
+        file_statistics.append(
+            {
+                "file_path": result.file_path,
+                "statistics": result.statistics.as_dict(),
+            }
+        )
+
+    for unused_save in pool.unused_saves:
+      sys.stderr.write(f(self.msg_fmt_unused_save, unused_save, nl=1))
+
+    if args.profile:
+      sys.stderr.write(profiler.report())
+
+    if args.statistics is not None:
+      with open(args.statistics, "w", encoding="utf-8") as fh:
+        json.dump(
+            {
+                "files": file_statistics,
+                "total": statistics.as_dict(),
+            },
+            fh,
+            indent=2,
+        )
+
+    if failures:
+      sys.exit(1)
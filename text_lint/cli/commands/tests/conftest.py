@@ -8,8 +8,10 @@ from .. import check_command, documentation_command, list_command
 
 
 @pytest.fixture
-def mocked_controller() -> mock.Mock:
-  return mock.Mock()
+def mocked_controller_pool() -> mock.Mock:
+  instance = mock.Mock()
+  instance.return_value.unused_saves = ()
+  return instance
 
 
 @pytest.fixture
@@ -19,13 +21,13 @@ def mocked_documentation() -> mock.Mock:
 
 @pytest.fixture
 def check_command_instance(
-    mocked_controller: mock.Mock,
+    mocked_controller_pool: mock.Mock,
     monkeypatch: pytest.MonkeyPatch,
 ) -> check_command.CheckCommand:
   monkeypatch.setattr(
       check_command,
-      "Controller",
-      mocked_controller,
+      "ControllerPool",
+      mocked_controller_pool,
   )
   return check_command.CheckCommand()
 
@@ -1,14 +1,26 @@
 """Test the CheckCommand class."""
 
+import json
+from pathlib import Path
+from typing import List, Optional
 from unittest import mock
 
+import pytest
 from text_lint.__helpers__.translations import (
     as_translation,
     assert_is_translated,
 )
 from text_lint.cli.commands.bases.command_base import CLICommandBase
 from text_lint.cli.types.file_type import file_type
+from text_lint.cli.types.jobs_type import jobs_type
+from text_lint.cli.types.max_errors_type import max_errors_type
 from text_lint.operations.documentation import OperationDocumentation
+from text_lint.pool import ControllerResult
+from text_lint.profiler import Profiler
+from text_lint.sequencers import textfile_registry
+from text_lint.sequencers.textfile import TextFileSequencer
+from text_lint.statistics import Statistics
+from text_lint.utilities.translations import f as translation_f
 from ..check_command import CheckCommand
 
 
@@ -26,9 +38,27 @@ class TestCheckCommand:
     assert check_command_instance.arg_filename_help == as_translation(
         "the text file(s) to lint"
     )
+    assert check_command_instance.arg_jobs_help == as_translation(
+        "the number of text files to lint in parallel"
+    )
+    assert check_command_instance.arg_max_errors_help == as_translation(
+        "the number of errors to collect from each text file before stopping"
+    )
+    assert check_command_instance.arg_mode_help == as_translation(
+        "the method used to read each text file"
+    )
+    assert check_command_instance.arg_profile_help == as_translation(
+        "report the time spent applying each schema operation to stderr"
+    )
     assert check_command_instance.arg_schema_help == as_translation(
         "the schema to apply"
     )
+    assert check_command_instance.arg_statistics_help == as_translation(
+        "write statistics for each text file to a JSON file"
+    )
+    assert check_command_instance.msg_fmt_unused_save == as_translation(
+        "warning: the saved result '{0}' is not used by any validator"
+    )
     assert isinstance(
         check_command_instance.documentation,
         OperationDocumentation,
@@ -41,7 +71,13 @@ class TestCheckCommand:
     assert_is_translated(check_command_instance.command_help)
     assert_is_translated(check_command_instance.command_name)
     assert_is_translated(check_command_instance.arg_filename_help)
+    assert_is_translated(check_command_instance.arg_jobs_help)
+    assert_is_translated(check_command_instance.arg_max_errors_help)
+    assert_is_translated(check_command_instance.arg_mode_help)
+    assert_is_translated(check_command_instance.arg_profile_help)
     assert_is_translated(check_command_instance.arg_schema_help)
+    assert_is_translated(check_command_instance.arg_statistics_help)
+    assert_is_translated(check_command_instance.msg_fmt_unused_save)
 
   def test_initialize__inheritance(
       self,
@@ -78,25 +114,267 @@ class TestCheckCommand:
             required=True,
             type=file_type,
         ),
+        mock.call(
+            "-m",
+            "--mode",
+            help=check_command_instance.arg_mode_help,
+            choices=sorted(textfile_registry),
+            default=TextFileSequencer.mode,
+        ),
+        mock.call(
+            "-j",
+            "--jobs",
+            help=check_command_instance.arg_jobs_help,
+            type=jobs_type,
+            default=1,
+        ),
+        mock.call(
+            "--max-errors",
+            help=check_command_instance.arg_max_errors_help,
+            type=max_errors_type,
+            default=1,
+        ),
+        mock.call(
+            "--profile",
+            help=check_command_instance.arg_profile_help,
+            action="store_true",
+        ),
+        mock.call(
+            "--statistics",
+            help=check_command_instance.arg_statistics_help,
+            default=None,
+        ),
     ]
 
-  def test_invoke__starts_controller_correctly(
+  @pytest.mark.parametrize("jobs", [1, 2])
+  def test_invoke__vary_jobs__starts_controller_pool_correctly(
       self,
-      mocked_controller: mock.Mock,
+      mocked_controller_pool: mock.Mock,
       check_command_instance: CheckCommand,
+      jobs: int,
   ) -> None:
     mocked_args = mock.Mock()
     mocked_args.filenames = ["1.txt", "2.txt", "3.txt"]
     mocked_args.schema = "/path/to/schema.yml"
+    mocked_args.mode = "mocked_mode"
+    mocked_args.jobs = jobs
+    mocked_args.max_errors = 1
+    mocked_args.profile = False
+    mocked_args.statistics = None
+    mocked_controller_pool.return_value.start.return_value = []
+
+    check_command_instance.invoke(mocked_args)
+
+    mocked_controller_pool.assert_called_once_with(
+        mocked_args.schema,
+        mocked_args.mode,
+        mocked_args.jobs,
+        mocked_args.profile,
+        False,
+        max_errors=mocked_args.max_errors,
+    )
+    mocked_controller_pool.return_value.start.assert_called_once_with(
+        mocked_args.filenames
+    )
+
+  @pytest.mark.parametrize("errors", [[None, None], [None, "Error: 1"]])
+  def test_invoke__results__writes_results_in_order(
+      self,
+      mocked_controller_pool: mock.Mock,
+      check_command_instance: CheckCommand,
+      errors: List[Optional[str]],
+      capsys: pytest.CaptureFixture[str],
+  ) -> None:
+    mocked_args = mock.Mock(profile=False, statistics=None)
+    mocked_args.filenames = ["1.txt", "2.txt"]
+    mocked_controller_pool.return_value.start.return_value = [
+        ControllerResult(filename, "output " + filename + "\n", error)
+        for filename, error in zip(mocked_args.filenames, errors)
+    ]
+
+    try:
+      check_command_instance.invoke(mocked_args)
+    except SystemExit:
+      pass
+
+    captured = capsys.readouterr()
+    assert captured.out == "output 1.txt\noutput 2.txt\n"
+    assert captured.err == "".join(
+        filename + ": " + error + "\n"
+        for filename, error in zip(mocked_args.filenames, errors)
+        if error is not None
+    )
+
+  def test_invoke__unused_saves__writes_warnings_after_results(
+      self,
+      mocked_controller_pool: mock.Mock,
+      check_command_instance: CheckCommand,
+      capsys: pytest.CaptureFixture[str],
+  ) -> None:
+    mocked_args = mock.Mock(profile=False, statistics=None)
+    mocked_args.filenames = ["1.txt"]
+    mocked_controller_pool.return_value.start.return_value = [
+        ControllerResult("1.txt", "output 1.txt\n", "Error: 1"),
+    ]
+    mocked_controller_pool.return_value.unused_saves = ("save_a", "save_b")
+
+    with pytest.raises(SystemExit):
+      check_command_instance.invoke(mocked_args)
+
+    captured = capsys.readouterr()
+    assert captured.out == "output 1.txt\n"
+    assert captured.err == "".join(
+        [
+            "1.txt: Error: 1\n",
+            translation_f(
+                check_command_instance.msg_fmt_unused_save,
+                "save_a",
+                nl=1,
+            ),
+            translation_f(
+                check_command_instance.msg_fmt_unused_save,
+                "save_b",
+                nl=1,
+            ),
+        ]
+    )
+
+  def test_invoke__profile__writes_merged_profile_after_warnings(
+      self,
+      mocked_controller_pool: mock.Mock,
+      check_command_instance: CheckCommand,
+      capsys: pytest.CaptureFixture[str],
+  ) -> None:
+    mocked_args = mock.Mock(profile=True, statistics=None)
+    mocked_args.filenames = ["1.txt", "2.txt", "3.txt"]
+    profilers = [Profiler(), Profiler()]
+    profilers[0].record(("rule", "rule_a", "assert_blank"), 1, 0.25)
+    profilers[1].record(("rule", "rule_a", "assert_blank"), 2, 0.5)
+    mocked_controller_pool.return_value.start.return_value = [
+        ControllerResult("1.txt", "", None, profilers[0]),
+        ControllerResult("2.txt", "", None),
+        ControllerResult("3.txt", "", None, profilers[1]),
+    ]
+    mocked_controller_pool.return_value.unused_saves = ("save_a",)
+    expected_profiler = Profiler()
+    expected_profiler.record(("rule", "rule_a", "assert_blank"), 3, 0.75)
 
     check_command_instance.invoke(mocked_args)
 
-    assert mocked_controller.call_count == 3
-    assert mocked_controller.return_value.start.call_count == 3
-    for index, mock_filename in enumerate(mocked_args.filenames):
-      assert mocked_controller.mock_calls[index * 2:index * 2 + 2] == [
-          mock.call(
-              mock_filename,
-              mocked_args.schema,
-          ), mock.call().start()
-      ]
+    assert capsys.readouterr().err == "".join(
+        [
+            translation_f(
+                check_command_instance.msg_fmt_unused_save,
+                "save_a",
+                nl=1,
+            ),
+            expected_profiler.report(),
+        ]
+    )
+
+  def test_invoke__statistics__starts_controller_pool_correctly(
+      self,
+      mocked_controller_pool: mock.Mock,
+      check_command_instance: CheckCommand,
+      tmp_path: Path,
+  ) -> None:
+    mocked_args = mock.Mock(profile=False)
+    mocked_args.statistics = str(tmp_path / "statistics.json")
+    mocked_controller_pool.return_value.start.return_value = []
+
+    check_command_instance.invoke(mocked_args)
+
+    mocked_controller_pool.assert_called_once_with(
+        mocked_args.schema,
+        mocked_args.mode,
+        mocked_args.jobs,
+        mocked_args.profile,
+        True,
+        max_errors=mocked_args.max_errors,
+    )
+
+  def test_invoke__statistics__writes_file_and_total_statistics(
+      self,
+      mocked_controller_pool: mock.Mock,
+      check_command_instance: CheckCommand,
+      tmp_path: Path,
+  ) -> None:
+    mocked_args = mock.Mock(profile=False)
+    mocked_args.filenames = ["1.txt", "2.txt", "3.txt"]
+    mocked_args.statistics = str(tmp_path / "statistics.json")
+    statistics = [Statistics(), Statistics()]
+    statistics[0].count("lines_read", 2)
+    statistics[0].count_match("rule_a", True)
+    statistics[1].count("lines_read", 3)
+    statistics[1].count_match("rule_a", False)
+    mocked_controller_pool.return_value.start.return_value = [
+        ControllerResult("1.txt", "", None, statistics=statistics[0]),
+        ControllerResult("2.txt", "", "Error: 1"),
+        ControllerResult("3.txt", "", "Error: 2", statistics=statistics[1]),
+    ]
+
+    with pytest.raises(SystemExit):
+      check_command_instance.invoke(mocked_args)
+
+    with open(mocked_args.statistics, "r", encoding="utf-8") as fh:
+      assert json.load(fh) == {
+          "files":
+              [
+                  {
+                      "file_path": "1.txt",
+                      "statistics": statistics[0].as_dict(),
+                  },
+                  {
+                      "file_path": "3.txt",
+                      "statistics": statistics[1].as_dict(),
+                  },
+              ],
+          "total":
+              {
+                  "counters": {
+                      "lines_read": 5
+                  },
+                  "rules":
+                      {
+                          "rule_a":
+                              {
+                                  "match_attempts": 2,
+                                  "match_failures": 1,
+                                  "prefilter_rejections": 0,
+                              },
+                      },
+              },
+      }
+
+  def test_invoke__no_failures__does_not_exit(
+      self,
+      mocked_controller_pool: mock.Mock,
+      check_command_instance: CheckCommand,
+  ) -> None:
+    mocked_args = mock.Mock(profile=False, statistics=None)
+    mocked_args.filenames = ["1.txt", "2.txt"]
+    mocked_controller_pool.return_value.start.return_value = [
+        ControllerResult("1.txt", "", None),
+        ControllerResult("2.txt", "", None),
+    ]
+
+    check_command_instance.invoke(mocked_args)
+
+  def test_invoke__failures__lints_all_files_and_exits_with_error(
+      self,
+      mocked_controller_pool: mock.Mock,
+      check_command_instance: CheckCommand,
+      capsys: pytest.CaptureFixture[str],
+  ) -> None:
+    mocked_args = mock.Mock(profile=False, statistics=None)
+    mocked_args.filenames = ["1.txt", "2.txt"]
+    mocked_controller_pool.return_value.start.return_value = [
+        ControllerResult("1.txt", "", "Error: 1"),
+        ControllerResult("2.txt", "output 2.txt\n", None),
+    ]
+
+    with pytest.raises(SystemExit) as exc:
+      check_command_instance.invoke(mocked_args)
+
+    assert exc.value.code == 1
+    assert capsys.readouterr().out == "output 2.txt\n"
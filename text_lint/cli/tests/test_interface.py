@@ -11,6 +11,7 @@ from text_lint.__helpers__.translations import (
 from text_lint.cli.commands.check_command import CheckCommand
 from text_lint.cli.commands.documentation_command import DocumentationCommand
 from text_lint.cli.commands.list_command import ListCommand
+from text_lint.sequencers.textfile import TextFileSequencer
 from .. import command_classes
 from ..interface import TextLintCli
 from .conftest import AliasArgumentMockCreator, AliasCommandMockCreator
@@ -115,6 +116,8 @@ class TestTextLintCli:
     assert namespace.command == CheckCommand.command_name
     assert namespace.schema == mocked_files[0]
     assert namespace.filenames == mocked_files[1:]
+    assert namespace.mode == TextFileSequencer.mode
+    assert namespace.jobs == 1
 
   def test_invoke__docs_command__invokes_command_correctly(
       self,
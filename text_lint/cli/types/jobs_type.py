@@ -0,0 +1,12 @@
+"""Parallel jobs type for CLI command arguments."""
+
+import os
+
+
+def jobs_type(jobs: str) -> int:
+  """Validate a specified number of parallel jobs (0 uses every core)."""
+
+  requested_jobs = int(jobs)
+  if requested_jobs < 0:
+    raise ValueError(jobs)
+  return requested_jobs or os.cpu_count() or 1
@@ -0,0 +1,10 @@
+"""Maximum errors type for CLI command arguments."""
+
+
+def max_errors_type(max_errors: str) -> int:
+  """Validate a specified maximum number of errors to collect."""
+
+  requested_max_errors = int(max_errors)
+  if requested_max_errors < 1:
+    raise ValueError(max_errors)
+  return requested_max_errors
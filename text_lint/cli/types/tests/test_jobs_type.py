@@ -0,0 +1,40 @@
+"""Test the jobs_type CLI argument type."""
+from unittest import mock
+
+import pytest
+from .. import jobs_type
+
+
+class TestJobsType:
+  """Test the jobs_type CLI argument type."""
+
+  @pytest.mark.parametrize("jobs", ["1", "4"])
+  def test_positive_integer__returns_integer(
+      self,
+      jobs: str,
+  ) -> None:
+    result = jobs_type.jobs_type(jobs)
+
+    assert result == int(jobs)
+
+  @pytest.mark.parametrize("cpu_count", [8, None])
+  def test_zero__returns_cpu_count(
+      self,
+      cpu_count: int,
+  ) -> None:
+    with mock.patch(jobs_type.__name__ + ".os") as mocked_os:
+      mocked_os.cpu_count.return_value = cpu_count
+
+      result = jobs_type.jobs_type("0")
+
+    assert result == (cpu_count or 1)
+
+  def test_negative_integer__raises_exception(self) -> None:
+    with pytest.raises(ValueError) as exc:
+      jobs_type.jobs_type("-1")
+
+    assert str(exc.value) == "-1"
+
+  def test_not_an_integer__raises_exception(self) -> None:
+    with pytest.raises(ValueError):
+      jobs_type.jobs_type("many")
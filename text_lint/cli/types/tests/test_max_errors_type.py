@@ -0,0 +1,31 @@
+"""Test the max_errors_type CLI argument type."""
+
+import pytest
+from .. import max_errors_type
+
+
+class TestMaxErrorsType:
+  """Test the max_errors_type CLI argument type."""
+
+  @pytest.mark.parametrize("max_errors", ["1", "50"])
+  def test_positive_integer__returns_integer(
+      self,
+      max_errors: str,
+  ) -> None:
+    result = max_errors_type.max_errors_type(max_errors)
+
+    assert result == int(max_errors)
+
+  @pytest.mark.parametrize("max_errors", ["0", "-1"])
+  def test_not_positive__raises_exception(
+      self,
+      max_errors: str,
+  ) -> None:
+    with pytest.raises(ValueError) as exc:
+      max_errors_type.max_errors_type(max_errors)
+
+    assert str(exc.value) == max_errors
+
+  def test_not_an_integer__raises_exception(self) -> None:
+    with pytest.raises(ValueError):
+      max_errors_type.max_errors_type("many")
@@ -8,3 +8,6 @@ LOOKUP_STATIC_VALUE_MARKER = "~"
 LOOKUP_TRANSFORMATION_PREFIX = "to_"
 LOOP_COUNT = -1
 NEW_LINE = os.linesep
+POOL_CHUNKS_PER_JOB = 4
+TEXTFILE_MMAP_DECODE_CHUNK = 1024 * 1024
+TEXTFILE_STREAM_WINDOW = 16
@@ -1,17 +1,35 @@
 """Controller class."""
 
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from text_lint.exceptions.controller import CollectedErrors
+from text_lint.exceptions.lookups import LookupExceptionBase
+from text_lint.exceptions.results import ResultExceptionBase
+from text_lint.exceptions.rules import RuleExceptionBase
 from text_lint.exceptions.sequencers import UnconsumedData
+from text_lint.exceptions.validators import ValidationExceptionBase
 from text_lint.results.forest import ResultForest
-from text_lint.schema import Schema
-from text_lint.sequencers.patterns.loop import LinearLoopPattern
+from text_lint.sequencers import textfile_registry
 from text_lint.sequencers.rules import RuleSequencer
 from text_lint.sequencers.textfile import TextFileSequencer
 from text_lint.sequencers.validators import ValidatorSequencer
 from text_lint.utilities.translations import _
 
+if TYPE_CHECKING:  # pragma: no cover
+  from text_lint.operations.rules.bases.rule_base import RuleBase
+  from text_lint.profiler import Profiler
+  from text_lint.schema import Schema
+  from text_lint.statistics import Statistics
+
+
+class Controller:  # pylint: disable=too-many-instance-attributes
+  """Orchestrates the text file parsing and validation processes.
 
-class Controller:
-  """Orchestrates the text file parsing and validation processes."""
+  By default the first error aborts linting.  If more than one error may be
+  collected, rule violations are recorded and the rules resynchronize with the
+  text file, so that all errors are reported together once the validators
+  have also run, or once the maximum number of errors is reached.
+  """
 
   msg_fmt_all_rules_not_read = _(
       "The entire file was read before all schema rules were run."
@@ -20,39 +38,113 @@ class Controller:
       "The entire file was not read after all schema rules were run."
   )
 
-  def __init__(self, file_path: str, schema_path: str) -> None:
-    schema = Schema(schema_path)
-
+  def __init__(
+      self,
+      file_path: str,
+      schema: "Schema",
+      textfile_mode: str = TextFileSequencer.mode,
+      profiler: Optional["Profiler"] = None,
+      statistics: Optional["Statistics"] = None,
+      *,
+      max_errors: int = 1,
+  ) -> None:
+    self.schema = schema
+    self.max_errors = max_errors
+    self.errors: List[Exception] = []
+    self.profiler = profiler
+    self.statistics = statistics
     self.rules = RuleSequencer(schema)
     self.validators = ValidatorSequencer(schema)
 
-    self.textfile = TextFileSequencer(file_path)
+    self.textfile = textfile_registry[textfile_mode](file_path)
     self.textfile.configure(schema)
 
     self.forest = ResultForest()
+    self.unused_saves = frozenset(schema.load_unused_saves())
+    self.captures: Dict["RuleBase", List[Tuple[str, ...]]] = {}
 
   def start(self) -> None:
     """Start the text file parsing and validation processes."""
 
-    self._run_rules()
-    self._ensure_all_rules()
-    self._ensure_eof()
-    self._run_validators()
+    try:
+      self._parse()
+      self._run_validators()
+      if self.errors:
+        raise CollectedErrors(self.errors, limit_reached=False)
+    finally:
+      if self.statistics is not None:
+        self.statistics.collect(self)
+
+  def _parse(self) -> None:
+    try:
+      self._run_rules()
+      for ensure in (self._ensure_all_rules, self._ensure_eof):
+        try:
+          ensure()
+        except UnconsumedData as exc:
+          self._collect(exc)
+    finally:
+      self.textfile.close()
 
   def _run_rules(self) -> None:
     count = 0
     for operation in self.rules:
       count += 1
       try:
-        operation.apply(self)
+        if self.profiler is None:
+          operation.apply(self)
+        else:
+          self.profiler.apply(
+              self.profiler.section_rule,
+              operation.name,
+              operation,
+              self,
+          )
       except StopIteration:
         # Text file has finished.
         break
-      self.forest.add(operation.results)
+      except RuleExceptionBase as exc:
+        self._collect(exc)
+        try:
+          self._resynchronize(operation)
+        except StopIteration:
+          break
+        continue
+      operation.save_results(self)
 
   def _run_validators(self) -> None:
     for operation in self.validators:
-      operation.apply(self)
+      try:
+        if self.profiler is None:
+          operation.apply(self)
+        else:
+          self.profiler.apply(
+              self.profiler.section_validator,
+              operation.name,
+              operation,
+              self,
+          )
+      except (
+          LookupExceptionBase,
+          ResultExceptionBase,
+          ValidationExceptionBase,
+      ) as exc:
+        self._collect(exc)
+
+  def _collect(self, exc: Exception) -> None:
+    if self.max_errors == 1:
+      raise exc
+    self.errors.append(exc)
+    if len(self.errors) >= self.max_errors:
+      raise CollectedErrors(self.errors, limit_reached=True) from exc
+
+  def _resynchronize(self, operation: "RuleBase") -> None:
+    # Inside a sequence, skip to the next section and the next iteration.
+    if self.rules.frames:
+      self.textfile.read_section()
+      self.rules.skip_iteration()
+    else:
+      operation.resynchronize(self)
 
   def _ensure_all_rules(self) -> None:
     try:
@@ -60,7 +152,7 @@ class Controller:
     except StopIteration:
       pass
     else:
-      if not isinstance(self.rules.pattern, LinearLoopPattern):
+      if not self.rules.looping:
         raise UnconsumedData(self.msg_fmt_all_rules_not_read)
 
   def _ensure_eof(self) -> None:
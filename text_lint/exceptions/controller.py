@@ -0,0 +1,30 @@
+"""Exceptions for the text_lint controller."""
+
+from typing import List
+
+from text_lint.utilities.translations import _, f
+
+
+class ControllerExceptionBase(ValueError):
+  """Base class for controller exceptions."""
+
+
+class CollectedErrors(ControllerExceptionBase):
+  """Raised when one or more errors were collected from a text file."""
+
+  msg_fmt_error_count = _("ERRORS FOUND: {0}")
+  msg_fmt_error_limit = _(
+      "ERROR LIMIT REACHED: the remainder of the text file was not checked"
+  )
+
+  def __init__(self, errors: List[Exception], limit_reached: bool) -> None:
+    self.errors = list(errors)
+    self.limit_reached = limit_reached
+
+    message = f(self.msg_fmt_error_count, len(self.errors), nl=1)
+    for error in self.errors:
+      message += f("{0}", str(error).rstrip(), nl=1)
+    if limit_reached:
+      message += f(self.msg_fmt_error_limit, nl=1)
+
+    super().__init__(message)
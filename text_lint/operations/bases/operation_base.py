@@ -8,7 +8,11 @@ if TYPE_CHECKING:  # pragma: no cover
 
 
 class OperationBase(abc.ABC):
-  """Text file operation base class."""
+  """Text file operation base class.
+
+  Operation instances are shared by every text file (and thread) linted with a
+  schema, so any state created while applying them belongs on the Controller.
+  """
 
   hint: str
   internal_use_only: bool = False
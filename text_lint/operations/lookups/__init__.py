@@ -1,6 +1,5 @@
 """Parser result lookups for text_lint."""
 
-from collections import defaultdict
 from typing import Dict, Type
 
 from text_lint.config import LOOKUP_SENTINEL
@@ -20,19 +19,17 @@ from .to_unique import UniqueLookup
 from .to_upper import UpperLookup
 from .unique import UniqueFilterLookup
 
-lookup_registry: Dict[str, Type[LookupBase]] = defaultdict(
-    lambda: DefaultLookup, {
-        LOOKUP_SENTINEL: NoopLookup,
-        CaptureLookup.operation: CaptureLookup,
-        CountLookup.operation: CountLookup,
-        GroupLookup.operation: GroupLookup,
-        JsonLookup.operation: JsonLookup,
-        LowerLookup.operation: LowerLookup,
-        NoopLookup.operation: NoopLookup,
-        ReversedLookup.operation: ReversedLookup,
-        SortedLookup.operation: SortedLookup,
-        UniqueFilterLookup.operation: UniqueFilterLookup,
-        UniqueLookup.operation: UniqueLookup,
-        UpperLookup.operation: UpperLookup,
-    }
-)
+lookup_registry: Dict[str, Type[LookupBase]] = {
+    LOOKUP_SENTINEL: NoopLookup,
+    CaptureLookup.operation: CaptureLookup,
+    CountLookup.operation: CountLookup,
+    GroupLookup.operation: GroupLookup,
+    JsonLookup.operation: JsonLookup,
+    LowerLookup.operation: LowerLookup,
+    NoopLookup.operation: NoopLookup,
+    ReversedLookup.operation: ReversedLookup,
+    SortedLookup.operation: SortedLookup,
+    UniqueFilterLookup.operation: UniqueFilterLookup,
+    UniqueLookup.operation: UniqueLookup,
+    UpperLookup.operation: UpperLookup,
+}
@@ -1,18 +1,29 @@
 """LookupEncoderBase class."""
 import abc
-import json
-from typing import Any, Type
+from typing import TYPE_CHECKING, Any, Type
 
 from .lookup_base import LookupBase
 
+if TYPE_CHECKING:  # pragma: no cover
+  from text_lint.operations.lookups.encoders.bases.encoder_base import (
+      EncoderBase,
+  )
+  from text_lint.operations.validators.args.result_set import ResultSet
+
 
 class LookupEncoderBase(LookupBase, abc.ABC):
   """Lookup encoding operation base class."""
 
-  encoder_class: Type[json.JSONEncoder]
+  encoder_class: Type["EncoderBase"]
+
+  def __init__(
+      self,
+      lookup_name: str,
+      result_set: "ResultSet",
+      requesting_operation_name: str,
+  ) -> None:
+    super().__init__(lookup_name, result_set, requesting_operation_name)
+    self.encoder = self.encoder_class()
 
   def encode(self, value_set: Any) -> Any:
-    return json.loads(json.dumps(
-        value_set,
-        cls=self.encoder_class,
-    ))
+    return self.encoder.transform(value_set)
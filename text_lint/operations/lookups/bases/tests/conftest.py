@@ -17,11 +17,6 @@ def mocked_encoder_class() -> mock.Mock:
   return mock.Mock()
 
 
-@pytest.fixture
-def mocked_json_module() -> mock.Mock:
-  return mock.Mock()
-
-
 @pytest.fixture
 def mocked_lookup_name() -> str:
   return "mocked_lookup_name"
@@ -55,14 +50,7 @@ def concrete_lookup_base_class() -> Type[lookup_base.LookupBase]:
 @pytest.fixture
 def concrete_lookup_encoder_base_class(
     mocked_encoder_class: mock.Mock,
-    mocked_json_module: mock.Mock,
-    monkeypatch: pytest.MonkeyPatch,
 ) -> Type[lookup_encoder_base.LookupEncoderBase]:
-  monkeypatch.setattr(
-      lookup_encoder_base,
-      "json",
-      mocked_json_module,
-  )
 
   class ConcreteLookupEncoder(lookup_encoder_base.LookupEncoderBase):
 
@@ -23,6 +23,7 @@ class TestLookupEncoderBase:
       mocked_result_set: mock.Mock,
   ) -> None:
     attributes: AliasOperationAttributes = {
+        "encoder": mocked_encoder_class.return_value,
         "encoder_class": mocked_encoder_class,
         "hint": "mocked_hint_lookup_encoder",
         "internal_use_only": False,
@@ -47,30 +48,37 @@ class TestLookupEncoderBase:
         bases=(LookupBase, LookupEncoderBase),
     )
 
-  def test_encode__calls_json_methods_with_correct_encoder(
+  def test_initialize__creates_encoder_instance(
       self,
       concrete_lookup_encoder_base_instance: LookupEncoderBase,
-      mocked_json_module: mock.Mock,
+      mocked_encoder_class: mock.Mock,
+  ) -> None:
+    mocked_encoder_class.assert_called_once_with()
+    assert concrete_lookup_encoder_base_instance.encoder == (
+        mocked_encoder_class.return_value
+    )
+
+  def test_encode__calls_encoder_transform(
+      self,
+      concrete_lookup_encoder_base_instance: LookupEncoderBase,
+      mocked_encoder_class: mock.Mock,
   ) -> None:
     mocked_object = {"mock": "object"}
 
     concrete_lookup_encoder_base_instance.encode(mocked_object)
 
-    mocked_json_module.dumps.assert_called_once_with(
-        mocked_object,
-        cls=concrete_lookup_encoder_base_instance.encoder_class,
-    )
-    mocked_json_module.loads.assert_called_once_with(
-        mocked_json_module.dumps.return_value
+    mocked_encoder_class.return_value.transform.assert_called_once_with(
+        mocked_object
     )
 
   def test_encode__returns_expected_value(
       self,
       concrete_lookup_encoder_base_instance: LookupEncoderBase,
-      mocked_json_module: mock.Mock,
+      mocked_encoder_class: mock.Mock,
   ) -> None:
     mocked_object = {"mock": "object"}
 
     return_value = concrete_lookup_encoder_base_instance.encode(mocked_object)
 
-    assert return_value == mocked_json_module.loads.return_value
+    assert return_value == mocked_encoder_class.return_value.transform.\
+        return_value
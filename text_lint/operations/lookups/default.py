@@ -11,6 +11,7 @@ from .name import NameLookup
 
 if TYPE_CHECKING:  # pragma: no cover
   from text_lint.controller import Controller
+  from text_lint.operations.validators.args.result_set import ResultSet
 
 YAML_EXAMPLE = """
 
@@ -31,23 +32,31 @@ class DefaultLookup(LookupBase):
   operation = "default"
   yaml_example = YAML_EXAMPLE
 
+  @classmethod
+  def create(
+      cls,
+      lookup_name: str,
+      result_set: "ResultSet",
+      requesting_operation_name: str,
+  ) -> LookupBase:
+    """Create an instance of the LookupBase subclass for an unknown lookup."""
+    lookup_class: Type[LookupBase] = cls
+
+    if lookup_name.isdigit():
+      lookup_class = IndexLookup
+    elif lookup_name.startswith(LOOKUP_STATIC_VALUE_MARKER):
+      lookup_class = NameLookup
+
+    return lookup_class(
+        lookup_name,
+        result_set,
+        requesting_operation_name,
+    )
+
   def apply(
       self,
       controller: "Controller",
   ) -> None:
-    """Handle unknown lookups by selecting a LookupBase subclass."""
-    lookup_class: Type[LookupBase]
+    """Raise an exception for lookups that could not be selected."""
 
-    if self.lookup_name.isdigit():
-      lookup_class = IndexLookup
-    elif self.lookup_name.startswith(LOOKUP_STATIC_VALUE_MARKER):
-      lookup_class = NameLookup
-    else:
-      raise LookupUnknown(lookup=self)
-
-    lookup_instance = lookup_class(
-        self.lookup_name,
-        self.result_set,
-        self.requesting_operation_name,
-    )
-    lookup_instance.apply(controller)
+    raise LookupUnknown(lookup=self)
@@ -0,0 +1 @@
+"""Parser result lookup encoder base classes."""
@@ -0,0 +1,67 @@
+"""EncoderBase class."""
+
+import json
+from typing import Any, Dict, List, Sequence
+
+
+class EncoderBase(json.JSONEncoder):
+  """Encode JSON data, or transform it directly into its decoded value."""
+
+  def encode(self, o: Any) -> Any:
+    return super().encode(self._prepared(o))
+
+  def transform(self, value: Any) -> Any:
+    """Return the value created by decoding this encoder's JSON output."""
+
+    return self._decoded(value)
+
+  def transform_dictionary(self, value: Dict[str, Any]) -> Dict[str, Any]:
+    """Transform a decoded dictionary."""
+
+    return value
+
+  # pylint: disable=unused-argument
+  def transform_list(
+      self,
+      original: Sequence[Any],
+      value: List[Any],
+  ) -> List[Any]:
+    """Transform a decoded list, created from the original list or tuple."""
+
+    return value
+
+  def _prepared(self, value: Any) -> Any:
+    return value
+
+  def _decoded(self, value: Any) -> Any:
+    if isinstance(value, str):
+      return value
+    if isinstance(value, (list, tuple)):
+      decoded = self._decoded
+      return self.transform_list(
+          value,
+          [
+              element if element.__class__ is str else decoded(element)
+              for element in value
+          ],
+      )
+    if isinstance(value, dict):
+      return self.transform_dictionary(
+          {
+              self._decoded_key(key): self._decoded(nested_value)
+              for key, nested_value in value.items()
+          }
+      )
+    if value is None or isinstance(value, (int, float)):
+      return value
+    return self._decoded(self.default(value))
+
+  def _decoded_key(self, key: Any) -> str:
+    if not isinstance(key, str):
+      if key is not None and not isinstance(key, (int, float)):
+        raise TypeError(
+            "keys must be str, int, float, bool or None, "
+            f"not {key.__class__.__name__}"
+        )
+      key = json.dumps(key)
+    return key
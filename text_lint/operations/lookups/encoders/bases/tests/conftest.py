@@ -0,0 +1,9 @@
+"""Shared test fixtures for the lookup encoder base classes."""
+
+import pytest
+from .. import encoder_base
+
+
+@pytest.fixture
+def concrete_encoder_base_instance() -> encoder_base.EncoderBase:
+  return encoder_base.EncoderBase()
@@ -0,0 +1,119 @@
+"""Test the EncoderBase class."""
+import json
+from typing import Any
+from unittest import mock
+
+import pytest
+from text_lint.__helpers__.lookups import result_encoding_test_cases
+from ..encoder_base import EncoderBase
+
+
+class TestEncoderBase:
+  """Test the EncoderBase class."""
+
+  def test_initialize__inheritance(
+      self,
+      concrete_encoder_base_instance: EncoderBase,
+  ) -> None:
+    assert isinstance(
+        concrete_encoder_base_instance,
+        EncoderBase,
+    )
+    assert isinstance(
+        concrete_encoder_base_instance,
+        json.JSONEncoder,
+    )
+
+  @result_encoding_test_cases
+  def test_encode__vary_value__returns_json_encoded_value(
+      self,
+      concrete_encoder_base_instance: EncoderBase,
+      result: Any,
+  ) -> None:
+    return_value = concrete_encoder_base_instance.encode(result)
+
+    assert return_value == json.dumps(result)
+
+  @result_encoding_test_cases
+  def test_transform__vary_value__returns_decoded_json_value(
+      self,
+      concrete_encoder_base_instance: EncoderBase,
+      result: Any,
+  ) -> None:
+    return_value = concrete_encoder_base_instance.transform(result)
+
+    assert return_value == json.loads(json.dumps(result))
+
+  @pytest.mark.parametrize("value", [None, True, 1, 1.5])
+  def test_transform__vary_scalar_value__returns_value(
+      self,
+      concrete_encoder_base_instance: EncoderBase,
+      value: Any,
+  ) -> None:
+    return_value = concrete_encoder_base_instance.transform([value])
+
+    assert return_value == [value]
+
+  def test_transform__nested_containers__creates_new_containers(
+      self,
+      concrete_encoder_base_instance: EncoderBase,
+  ) -> None:
+    mocked_list = ["a"]
+    mocked_dict = {"list": mocked_list}
+    mocked_object = [mocked_dict]
+
+    return_value = concrete_encoder_base_instance.transform(mocked_object)
+
+    assert return_value == mocked_object
+    assert return_value is not mocked_object
+    assert return_value[0] is not mocked_dict
+    assert return_value[0]["list"] is not mocked_list
+
+  @pytest.mark.parametrize("key", [1, 1.5, True, None])
+  def test_transform__vary_non_string_key__returns_decoded_json_key(
+      self,
+      concrete_encoder_base_instance: EncoderBase,
+      key: Any,
+  ) -> None:
+    mocked_object = {key: "value"}
+
+    return_value = concrete_encoder_base_instance.transform(mocked_object)
+
+    assert return_value == json.loads(json.dumps(mocked_object))
+
+  def test_transform__invalid_key__raises_type_error(
+      self,
+      concrete_encoder_base_instance: EncoderBase,
+  ) -> None:
+    mocked_object = {("invalid", "key"): "value"}
+
+    with pytest.raises(TypeError) as exc:
+      concrete_encoder_base_instance.transform(mocked_object)
+
+    assert str(exc.value
+              ) == ("keys must be str, int, float, bool or None, not tuple")
+
+  def test_transform__unknown_object__uses_default_method(
+      self,
+      concrete_encoder_base_instance: EncoderBase,
+      monkeypatch: pytest.MonkeyPatch,
+  ) -> None:
+    mocked_default = mock.Mock(return_value=("converted",))
+    monkeypatch.setattr(
+        concrete_encoder_base_instance, "default", mocked_default
+    )
+    mocked_unknown_object = mock.Mock()
+
+    return_value = concrete_encoder_base_instance.transform(
+        [mocked_unknown_object]
+    )
+
+    mocked_default.assert_called_once_with(mocked_unknown_object)
+    assert return_value == [["converted"]]
+
+  def test_transform__unknown_object__raises_type_error(
+      self,
+      concrete_encoder_base_instance: EncoderBase,
+  ) -> None:
+    with pytest.raises(TypeError):
+      concrete_encoder_base_instance.transform([mock.Mock()])
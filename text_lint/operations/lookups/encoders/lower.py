@@ -3,8 +3,10 @@
 import json
 from typing import Any
 
+from .bases.encoder_base import EncoderBase
 
-class LowerCaseEncoder(json.JSONEncoder):
+
+class LowerCaseEncoder(EncoderBase):
   """Encode JSON data while converting strings to lower case."""
 
   def encode(self, o: Any) -> Any:
@@ -12,3 +14,7 @@ class LowerCaseEncoder(json.JSONEncoder):
     if isinstance(value, str):
       return value.lower()
     return value
+
+  def transform(self, value: Any) -> Any:
+    # Converting the case of the encoded text is faster than a traversal.
+    return json.loads(self.encode(value))
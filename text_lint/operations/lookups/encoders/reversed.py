@@ -1,10 +1,11 @@
 """ReversedEncoder class."""
 
-import json
-from typing import Any, Dict
+from typing import Any, Dict, List, Sequence
 
+from .bases.encoder_base import EncoderBase
 
-class ReversedEncoder(json.JSONEncoder):
+
+class ReversedEncoder(EncoderBase):
   """Encode JSON data while reversing dictionaries, lists and tuples."""
 
   def _recursive_reversed(
@@ -12,16 +13,29 @@ class ReversedEncoder(json.JSONEncoder):
       target: Any,
   ) -> Any:
     if isinstance(target, (list, tuple)):
-      target = list(
-          reversed([self._recursive_reversed(element) for element in target])
+      target = self.transform_list(
+          target,
+          [self._recursive_reversed(element) for element in target],
       )
     if isinstance(target, dict):
-      new_dictionary: Dict[Any, Any] = {}
-      for key in reversed(target.keys()):
-        new_dictionary[key] = self._recursive_reversed(target[key])
-      target = new_dictionary
+      target = self.transform_dictionary(
+          {
+              key: self._recursive_reversed(value)
+              for key, value in target.items()
+          }
+      )
     return target
 
-  def encode(self, o: Any) -> Any:
-    value = self._recursive_reversed(o)
-    return super().encode(value)
+  def _prepared(self, value: Any) -> Any:
+    return self._recursive_reversed(value)
+
+  def transform_dictionary(self, value: Dict[str, Any]) -> Dict[str, Any]:
+    return dict(reversed(list(value.items())))
+
+  def transform_list(
+      self,
+      original: Sequence[Any],
+      value: List[Any],
+  ) -> List[Any]:
+    value.reverse()
+    return value
@@ -1,10 +1,11 @@
 """SortedEncoder class."""
 
-import json
-from typing import Any, List
+from typing import Any, Dict, List, Sequence
 
+from .bases.encoder_base import EncoderBase
 
-class SortedEncoder(json.JSONEncoder):
+
+class SortedEncoder(EncoderBase):
   """Encode JSON data while sorting dictionaries, lists and tuples."""
 
   def _recursive_sorted(
@@ -12,25 +13,30 @@ class SortedEncoder(json.JSONEncoder):
       target: Any,
   ) -> Any:
     if isinstance(target, (list, tuple)):
-      string_elements: List[str] = []
-      other_elements: List[Any] = []
-      for element in target:
-        if isinstance(element, str):
-          string_elements.append(element)
-        else:
-          other_elements.append(element)
-      target = sorted(string_elements) + [
-          self._recursive_sorted(element) for element in other_elements
-      ]
+      target = self.transform_list(
+          target,
+          [self._recursive_sorted(element) for element in target],
+      )
     if isinstance(target, dict):
-      for key, value in target.items():
-        target[key] = self._recursive_sorted(value)
-      target = dict(sorted(
-          target.items(),
-          key=lambda item: str(item[1]),
-      ))
+      target = self.transform_dictionary(
+          {
+              key: self._recursive_sorted(nested_value)
+              for key, nested_value in target.items()
+          }
+      )
     return target
 
-  def encode(self, o: Any) -> Any:
-    value = self._recursive_sorted(o)
-    return super().encode(value)
+  def _prepared(self, value: Any) -> Any:
+    return self._recursive_sorted(value)
+
+  def transform_dictionary(self, value: Dict[str, Any]) -> Dict[str, Any]:
+    return dict(sorted(value.items(), key=lambda item: str(item[1])))
+
+  def transform_list(
+      self,
+      original: Sequence[Any],
+      value: List[Any],
+  ) -> List[Any]:
+    return sorted(element for element in value if isinstance(element, str)) + [
+        element for element in value if not isinstance(element, str)
+    ]
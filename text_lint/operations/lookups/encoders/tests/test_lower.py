@@ -1,6 +1,8 @@
 """Test the LowerCaseEncoder class."""
 import json
+from typing import Any
 
+from text_lint.__helpers__.lookups import result_encoding_test_cases
 from ..lower import LowerCaseEncoder
 from .conftest import AliasSetupEncoderMock
 
@@ -62,3 +64,15 @@ class TestLowerCaseEncoder:
             }
         }
     )
+
+  @result_encoding_test_cases
+  def test_transform__vary_value__returns_decoded_encoding(
+      self,
+      concrete_lower_case_encoder_instance: LowerCaseEncoder,
+      result: Any,
+  ) -> None:
+    return_value = concrete_lower_case_encoder_instance.transform(result)
+
+    assert return_value == json.loads(
+        concrete_lower_case_encoder_instance.encode(result)
+    )
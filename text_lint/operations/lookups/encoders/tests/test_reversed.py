@@ -1,9 +1,13 @@
 """Test the ReversedEncoder class."""
 
 import json
+from copy import deepcopy
 from typing import Any
 
-from text_lint.__helpers__.lookups import result_reversing_test_cases
+from text_lint.__helpers__.lookups import (
+    result_encoding_test_cases,
+    result_reversing_test_cases,
+)
 from ..reversed import ReversedEncoder
 from .conftest import AliasSetupEncoderMock
 
@@ -46,3 +50,27 @@ class TestReversedEncoder:
     return_value = concrete_reversed_encoder_instance.encode(result)
 
     assert return_value == json.dumps(expected)
+
+  @result_encoding_test_cases
+  def test_transform__vary_value__returns_decoded_encoding(
+      self,
+      concrete_reversed_encoder_instance: ReversedEncoder,
+      result: Any,
+  ) -> None:
+    return_value = concrete_reversed_encoder_instance.transform(result)
+
+    assert return_value == json.loads(
+        concrete_reversed_encoder_instance.encode(result)
+    )
+
+  @result_encoding_test_cases
+  def test_transform__vary_value__does_not_modify_value(
+      self,
+      concrete_reversed_encoder_instance: ReversedEncoder,
+      result: Any,
+  ) -> None:
+    original_result = deepcopy(result)
+
+    concrete_reversed_encoder_instance.transform(result)
+
+    assert result == original_result
@@ -1,8 +1,12 @@
 """Test the SortedEncoder class."""
 import json
+from copy import deepcopy
 from typing import Any
 
-from text_lint.__helpers__.lookups import result_sorting_test_cases
+from text_lint.__helpers__.lookups import (
+    result_encoding_test_cases,
+    result_sorting_test_cases,
+)
 from ..sorted import SortedEncoder
 from .conftest import AliasSetupEncoderMock
 
@@ -45,3 +49,27 @@ class TestSortedEncoder:
     return_value = concrete_sorted_encoder_instance.encode(result)
 
     assert return_value == json.dumps(expected)
+
+  @result_encoding_test_cases
+  def test_transform__vary_value__returns_decoded_encoding(
+      self,
+      concrete_sorted_encoder_instance: SortedEncoder,
+      result: Any,
+  ) -> None:
+    return_value = concrete_sorted_encoder_instance.transform(result)
+
+    assert return_value == json.loads(
+        concrete_sorted_encoder_instance.encode(result)
+    )
+
+  @result_encoding_test_cases
+  def test_transform__vary_value__does_not_modify_value(
+      self,
+      concrete_sorted_encoder_instance: SortedEncoder,
+      result: Any,
+  ) -> None:
+    original_result = deepcopy(result)
+
+    concrete_sorted_encoder_instance.transform(result)
+
+    assert result == original_result
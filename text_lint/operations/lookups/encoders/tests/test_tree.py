@@ -1,7 +1,9 @@
 """Test the ResultTreeEncoder class."""
 import json
+from typing import Any
 from unittest import mock
 
+from text_lint.__helpers__.lookups import result_encoding_test_cases
 from text_lint.results.tree import ResultTree
 from ..tree import ResultTreeEncoder
 from .conftest import AliasSetupEncoderMock
@@ -74,3 +76,31 @@ class TestResultTreeEncoder:
             }
         }
     )
+
+  @result_encoding_test_cases
+  def test_transform__vary_value__returns_decoded_encoding(
+      self,
+      concrete_result_tree_encoder_instance: ResultTreeEncoder,
+      result: Any,
+  ) -> None:
+    return_value = concrete_result_tree_encoder_instance.transform(result)
+
+    assert return_value == json.loads(
+        concrete_result_tree_encoder_instance.encode(result)
+    )
+
+  def test_transform__result_tree__returns_decoded_encoding(
+      self,
+      concrete_result_tree_encoder_instance: ResultTreeEncoder,
+  ) -> None:
+    mocked_result_tree = ResultTree(value="root")
+    mocked_result_tree.add_matches(("a", "b c"), {2: " "})
+    mocked_object = [[mocked_result_tree]]
+
+    return_value = concrete_result_tree_encoder_instance.transform(
+        mocked_object
+    )
+
+    assert return_value == json.loads(
+        concrete_result_tree_encoder_instance.encode(mocked_object)
+    )
@@ -1,8 +1,10 @@
 """Test the UniqueEncoder class."""
 import json
-from typing import List
+from copy import deepcopy
+from typing import Any, List
 
 import pytest
+from text_lint.__helpers__.lookups import result_encoding_test_cases
 from text_lint.utilities.collections import unique_list
 from ..unique import UniqueEncoder
 from .conftest import AliasSetupEncoderMock
@@ -88,3 +90,27 @@ class TestUniqueEncoder:
     return_value = concrete_unique_encoder_instance.encode(mocked_list)
 
     assert return_value == json.dumps([unique_list(mocked_list[0])])
+
+  @result_encoding_test_cases
+  def test_transform__vary_value__returns_decoded_encoding(
+      self,
+      concrete_unique_encoder_instance: UniqueEncoder,
+      result: Any,
+  ) -> None:
+    return_value = concrete_unique_encoder_instance.transform(result)
+
+    assert return_value == json.loads(
+        concrete_unique_encoder_instance.encode(result)
+    )
+
+  @result_encoding_test_cases
+  def test_transform__vary_value__does_not_modify_value(
+      self,
+      concrete_unique_encoder_instance: UniqueEncoder,
+      result: Any,
+  ) -> None:
+    original_result = deepcopy(result)
+
+    concrete_unique_encoder_instance.transform(result)
+
+    assert result == original_result
@@ -1,6 +1,8 @@
 """Test the UpperCaseEncoder class."""
 import json
+from typing import Any
 
+from text_lint.__helpers__.lookups import result_encoding_test_cases
 from ..upper import UpperCaseEncoder
 from .conftest import AliasSetupEncoderMock
 
@@ -62,3 +64,15 @@ class TestUpperCaseEncoder:
             }
         }
     )
+
+  @result_encoding_test_cases
+  def test_transform__vary_value__returns_decoded_encoding(
+      self,
+      concrete_upper_case_encoder_instance: UpperCaseEncoder,
+      result: Any,
+  ) -> None:
+    return_value = concrete_upper_case_encoder_instance.transform(result)
+
+    assert return_value == json.loads(
+        concrete_upper_case_encoder_instance.encode(result)
+    )
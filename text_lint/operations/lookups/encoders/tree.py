@@ -1,14 +1,33 @@
 """ResultTreeEncoder class."""
 
-import json
-from typing import Any
+from typing import TYPE_CHECKING, Any, Dict
 
 from text_lint.results.tree import ResultTree
+from .bases.encoder_base import EncoderBase
 
+if TYPE_CHECKING:  # pragma: no cover
+  from text_lint.results.arena import ResultArena
 
-class ResultTreeEncoder(json.JSONEncoder):
+
+class ResultTreeEncoder(EncoderBase):
   """Encode JSON data containing ResultTrees instances."""
 
+  def _decoded(self, value: Any) -> Any:
+    if isinstance(value, ResultTree):
+      return self._decoded_node(value.arena, value.node)
+    return super()._decoded(value)
+
+  def _decoded_node(self, arena: "ResultArena", node: int) -> Dict[str, Any]:
+    return {
+        "value":
+            arena.value(node),
+        "children":
+            [
+                self._decoded_node(arena, child)
+                for child in arena.children(node)
+            ],
+    }
+
   def default(self, o: Any) -> Any:
     if isinstance(o, ResultTree):
       return o.representation()
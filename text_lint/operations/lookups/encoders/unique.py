@@ -1,10 +1,12 @@
 """UniqueEncoder class."""
 
-import json
-from typing import Any, List
+from typing import Any
 
+from text_lint.utilities.collections import unique_list
+from .bases.encoder_base import EncoderBase
 
-class UniqueEncoder(json.JSONEncoder):
+
+class UniqueEncoder(EncoderBase):
   """Encode JSON data while ensuring all lists contain unique values."""
 
   def _recursive_unique_lists(
@@ -12,17 +14,19 @@ class UniqueEncoder(json.JSONEncoder):
       target: Any,
   ) -> Any:
     if isinstance(target, list):
-      unique_list: List[Any] = []
-      for value in target:
-        value = self._recursive_unique_lists(value)
-        if value not in unique_list:
-          unique_list.append(value)
-      return unique_list
+      return unique_list(
+          [self._recursive_unique_lists(value) for value in target]
+      )
     if isinstance(target, dict):
-      for key, value in target.copy().items():
-        target[key] = self._recursive_unique_lists(value)
+      return {
+          key: self._recursive_unique_lists(value)
+          for key, value in target.items()
+      }
     return target
 
-  def encode(self, o: Any) -> Any:
-    value = self._recursive_unique_lists(o)
-    return super().encode(value)
+  def _prepared(self, value: Any) -> Any:
+    return self._recursive_unique_lists(value)
+
+  def transform(self, value: Any) -> Any:
+    # Tuples are compared before decoding, as they are when encoding.
+    return self._decoded(self._prepared(value))
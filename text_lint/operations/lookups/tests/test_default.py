@@ -87,133 +87,72 @@ class TestDefaultLookup:
         bases=(LookupBase, DefaultLookup),
     )
 
-  def test_apply__result_index__applies_index_lookup(
+  def test_create__result_index__returns_index_lookup(
       self,
       mocked_default_subclasses: Dict[str, mock.Mock],
-      mocked_controller: mock.Mock,
       mocked_requesting_operation_name: str,
       mocked_result_set: mock.Mock,
   ) -> None:
     index = generate_result_index()
 
-    instance = DefaultLookup(
+    instance = DefaultLookup.create(
         index,
         mocked_result_set,
         mocked_requesting_operation_name,
     )
 
-    instance.apply(mocked_controller)
-
     mocked_default_subclasses["IndexLookup"].assert_called_once_with(
         index,
         mocked_result_set,
         mocked_requesting_operation_name,
     )
-    mocked_default_subclasses["IndexLookup"].\
-        return_value.apply.assert_called_once_with(mocked_controller)
-
-  def test_apply__result_index__does_not_apply_name_lookup(
-      self,
-      mocked_default_subclasses: Dict[str, mock.Mock],
-      mocked_controller: mock.Mock,
-      mocked_requesting_operation_name: str,
-      mocked_result_set: mock.Mock,
-  ) -> None:
-    index = generate_result_index()
-
-    instance = DefaultLookup(
-        index,
-        mocked_result_set,
-        mocked_requesting_operation_name,
-    )
-
-    instance.apply(mocked_controller)
-
     mocked_default_subclasses["NameLookup"].assert_not_called()
+    assert instance == mocked_default_subclasses["IndexLookup"].return_value
 
-  def test_apply__result_name__applies_name_lookup(
+  def test_create__result_name__returns_name_lookup(
       self,
       mocked_default_subclasses: Dict[str, mock.Mock],
-      mocked_controller: mock.Mock,
       mocked_requesting_operation_name: str,
       mocked_result_set: mock.Mock,
   ) -> None:
     mock_name = generate_static_name()
 
-    instance = DefaultLookup(
+    instance = DefaultLookup.create(
         LOOKUP_STATIC_VALUE_MARKER + mock_name,
         mocked_result_set,
         mocked_requesting_operation_name,
     )
 
-    instance.apply(mocked_controller)
-
     mocked_default_subclasses["NameLookup"].assert_called_once_with(
         LOOKUP_STATIC_VALUE_MARKER + mock_name,
         mocked_result_set,
         mocked_requesting_operation_name,
     )
-    mocked_default_subclasses["NameLookup"].\
-        return_value.apply.assert_called_once_with(mocked_controller)
-
-  def test_apply__result_name__does_not_apply_index_lookup(
-      self,
-      mocked_default_subclasses: Dict[str, mock.Mock],
-      mocked_controller: mock.Mock,
-      mocked_requesting_operation_name: str,
-      mocked_result_set: mock.Mock,
-  ) -> None:
-    mock_name = generate_static_name()
-
-    instance = DefaultLookup(
-        LOOKUP_STATIC_VALUE_MARKER + mock_name,
-        mocked_result_set,
-        mocked_requesting_operation_name,
-    )
-
-    instance.apply(mocked_controller)
-
     mocked_default_subclasses["IndexLookup"].assert_not_called()
+    assert instance == mocked_default_subclasses["NameLookup"].return_value
 
-  def test_apply__invalid_name__does_not_apply_index_lookup(
+  def test_create__invalid_name__returns_default_lookup(
       self,
       mocked_default_subclasses: Dict[str, mock.Mock],
-      mocked_controller: mock.Mock,
       mocked_requesting_operation_name: str,
       mocked_result_set: mock.Mock,
   ) -> None:
     mock_name = generate_static_name()
 
-    instance = DefaultLookup(
+    instance = DefaultLookup.create(
         mock_name,
         mocked_result_set,
         mocked_requesting_operation_name,
     )
 
-    with pytest.raises(LookupUnknown):
-      instance.apply(mocked_controller)
-
     mocked_default_subclasses["IndexLookup"].assert_not_called()
-
-  def test_apply__invalid_name__does_not_apply_name_lookup(
-      self,
-      mocked_default_subclasses: Dict[str, mock.Mock],
-      mocked_controller: mock.Mock,
-      mocked_requesting_operation_name: str,
-      mocked_result_set: mock.Mock,
-  ) -> None:
-    mock_name = generate_static_name()
-
-    instance = DefaultLookup(
-        mock_name,
-        mocked_result_set,
-        mocked_requesting_operation_name,
-    )
-
-    with pytest.raises(LookupUnknown):
-      instance.apply(mocked_controller)
-
     mocked_default_subclasses["NameLookup"].assert_not_called()
+    assert isinstance(instance, DefaultLookup)
+    assert instance.lookup_name == mock_name
+    assert instance.result_set == mocked_result_set
+    assert instance.requesting_operation_name == (
+        mocked_requesting_operation_name
+    )
 
   def test_apply__invalid_name__raises_unknown_lookup(
       self,
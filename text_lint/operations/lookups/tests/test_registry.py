@@ -1,4 +1,4 @@
-"""Test the lookup_registry default dictionary."""
+"""Test the lookup_registry dictionary."""
 
 import pytest
 from .. import (
@@ -20,14 +20,11 @@ from .. import (
 
 
 class TestLookupRegistry:
-  """Test the lookup_registry default dictionary."""
+  """Test the lookup_registry dictionary."""
 
-  def test_default__returns_default_lookup(self) -> None:
-    default_lookup_class = lookup_registry["non-existent-lookup-operation"]
-
-    assert default_lookup_class == DefaultLookup
-
-    del lookup_registry["non-existent-lookup-operation"]
+  def test_unknown__is_not_registered(self) -> None:
+    assert "non-existent-lookup-operation" not in lookup_registry
+    assert DefaultLookup not in lookup_registry.values()
 
   def test_sentinel__returns_noop_lookup(self) -> None:
     default_lookup_class = lookup_registry[LOOKUP_SENTINEL]
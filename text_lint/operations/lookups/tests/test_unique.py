@@ -2,7 +2,6 @@
 
 from unittest import mock
 
-import pytest
 from text_lint.__helpers__.operations import (
     AliasOperationAttributes,
     assert_operation_attributes,
@@ -10,7 +9,7 @@ from text_lint.__helpers__.operations import (
 )
 from text_lint.__helpers__.translations import assert_is_translated
 from text_lint.operations.lookups.bases.lookup_base import LookupBase
-from .. import unique
+from ..to_unique import UniqueLookup
 from ..unique import YAML_EXAMPLE, UniqueFilterLookup
 
 
@@ -36,6 +35,19 @@ class TestUniqueFilterLookup:
 
     assert_operation_attributes(unique_lookup_instance, attributes)
 
+  def test_initialize__creates_unique_lookup(
+      self,
+      unique_lookup_instance: UniqueFilterLookup,
+  ) -> None:
+    to_unique_lookup = unique_lookup_instance.to_unique_lookup
+
+    assert isinstance(to_unique_lookup, UniqueLookup)
+    assert to_unique_lookup.lookup_name == unique_lookup_instance.lookup_name
+    assert to_unique_lookup.result_set == unique_lookup_instance.result_set
+    assert to_unique_lookup.requesting_operation_name == (
+        unique_lookup_instance.requesting_operation_name
+    )
+
   def test_initialize__translations(
       self,
       unique_lookup_instance: UniqueFilterLookup,
@@ -72,23 +84,11 @@ class TestUniqueFilterLookup:
       unique_lookup_instance: UniqueFilterLookup,
       mocked_controller: mock.Mock,
       mocked_trees_woods: mock.Mock,
-      monkeypatch: pytest.MonkeyPatch,
   ) -> None:
     mocked_unique_lookup = mock.Mock()
     mocked_controller.forest.cursor.location = mocked_trees_woods
-    monkeypatch.setattr(
-        unique,
-        "UniqueLookup",
-        mocked_unique_lookup,
-    )
+    unique_lookup_instance.to_unique_lookup = mocked_unique_lookup
 
     unique_lookup_instance.apply(mocked_controller)
 
-    mocked_unique_lookup.assert_called_once_with(
-        unique_lookup_instance.lookup_name,
-        unique_lookup_instance.result_set,
-        unique_lookup_instance.requesting_operation_name,
-    )
-    mocked_unique_lookup.return_value.apply.assert_called_once_with(
-        mocked_controller
-    )
+    mocked_unique_lookup.apply.assert_called_once_with(mocked_controller)
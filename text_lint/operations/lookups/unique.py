@@ -8,6 +8,7 @@ from .to_unique import UniqueLookup
 
 if TYPE_CHECKING:  # pragma: no cover
   from text_lint.controller import Controller
+  from text_lint.operations.validators.args.result_set import ResultSet
 
 YAML_EXAMPLE = """
 
@@ -26,6 +27,19 @@ class UniqueFilterLookup(LookupBase):
   operation = "unique"
   yaml_example = YAML_EXAMPLE
 
+  def __init__(
+      self,
+      lookup_name: str,
+      result_set: "ResultSet",
+      requesting_operation_name: str,
+  ) -> None:
+    super().__init__(lookup_name, result_set, requesting_operation_name)
+    self.to_unique_lookup = UniqueLookup(
+        lookup_name,
+        result_set,
+        requesting_operation_name,
+    )
+
   def apply(
       self,
       controller: "Controller",
@@ -33,10 +47,4 @@ class UniqueFilterLookup(LookupBase):
     """Filter unique values from the saved result."""
 
     controller.forest.cursor.unique()
-
-    to_unique_lookup = UniqueLookup(
-        self.lookup_name,
-        self.result_set,
-        self.requesting_operation_name,
-    )
-    to_unique_lookup.apply(controller)
+    self.to_unique_lookup.apply(controller)
@@ -1,6 +1,5 @@
 """AssertEqual class."""
 
-import re
 from typing import TYPE_CHECKING, Optional
 
 from text_lint.exceptions.rules import RuleViolation
@@ -30,7 +29,11 @@ optional: 'case_insensitive' will match strings with differing cases.
 
 
 class AssertEqual(rule_regex_base.RuleRegexBase):
-  """Assert that the line matches an expected static value."""
+  """Assert that the line matches an expected static value.
+
+  Lines are compared directly, without running the regex, and are saved as a
+  single capture group as though the regex "(.*)" had matched them.
+  """
 
   hint = _("this line must match the expected value")
   operation = "assert_equal"
@@ -46,6 +49,7 @@ class AssertEqual(rule_regex_base.RuleRegexBase):
   ) -> None:
     self.expected = expected
     self.case_sensitive = case_sensitive
+    self.comparable_expected = self._comparable(expected)
     super().__init__(name, "(.*)", save, splits)
 
   def apply(
@@ -55,17 +59,12 @@ class AssertEqual(rule_regex_base.RuleRegexBase):
     """Apply the AssertEqual rule logic."""
 
     data = next(controller.textfile)
-    match = re.match(self.regex, data)
-
-    equality_check: bool = False
+    equality_check = self._comparable(data) == self.comparable_expected
 
-    if match and not self.case_sensitive:
-      equality_check = match.group(1).lower() == self.expected.lower()
+    if controller.statistics is not None:
+      controller.statistics.count_match(self.name, equality_check)
 
-    if match and self.case_sensitive:
-      equality_check = match.group(1) == self.expected
-
-    if not match or not equality_check:
+    if not equality_check:
       # pylint: disable=duplicate-code
       raise RuleViolation(
           rule=self,
@@ -73,4 +72,9 @@ class AssertEqual(rule_regex_base.RuleRegexBase):
           textfile=controller.textfile,
       )
 
-    self.matches = [match]
+    controller.captures[self] = [(data,)]
+
+  def _comparable(self, value: str) -> str:
+    if self.case_sensitive:
+      return value
+    return value.casefold()
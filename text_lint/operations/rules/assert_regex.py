@@ -1,6 +1,5 @@
 """AssertRegex class."""
 
-import re
 from typing import TYPE_CHECKING
 
 from text_lint.exceptions.rules import RuleViolation
@@ -39,7 +38,7 @@ class AssertRegex(rule_regex_base.RuleRegexBase):
     """Apply the AssertRegex rule logic."""
 
     data = next(controller.textfile)
-    match = re.match(self.regex, data)
+    match = self.match(controller, data)
 
     if not match:
       # pylint: disable=duplicate-code
@@ -49,4 +48,4 @@ class AssertRegex(rule_regex_base.RuleRegexBase):
           textfile=controller.textfile,
       )
 
-    self.matches = [match]
+    controller.captures[self] = [match.groups()]
@@ -1,12 +1,10 @@
 """AssertRegexSection class."""
 
-import re
 from typing import TYPE_CHECKING
 
 from text_lint.exceptions.rules import RuleViolation
 from text_lint.operations.rules.bases import rule_regex_base
 from text_lint.utilities.translations import _
-from text_lint.utilities.whitespace import new_line
 
 if TYPE_CHECKING:  # pragma: no cover
   from text_lint.controller import Controller
@@ -28,7 +26,9 @@ YAML_EXAMPLE = """
 class AssertRegexSection(rule_regex_base.RuleRegexBase):
   """Assert a sequence of lines matches a regular expression.
 
-  The regex will be evaluated until a blank line is encountered.
+  The regex will be evaluated until a blank line is encountered.  Each section
+  is read and matched as a single batch, and if any line fails to match, the
+  text file is rewound to report that line.
   """
 
   hint = _("sections must be separated and contain lines that match this regex")
@@ -41,17 +41,27 @@ class AssertRegexSection(rule_regex_base.RuleRegexBase):
   ) -> None:
     """Apply the AssertRegexSection rule logic."""
 
-    for data in controller.textfile:
-
-      if data == new_line():
-        break
-
-      match = re.match(self.regex, data)
-      if not match:
-        raise RuleViolation(
-            rule=self,
-            expected=self.regex.pattern,
-            textfile=controller.textfile,
-        )
-
-      self.matches.append(match)
+    textfile = controller.textfile
+    start = textfile.index
+    comments_skipped = textfile.comments_skipped
+    controller.captures[self] = []
+
+    lines = textfile.read_section()
+    matches = self.match_lines(controller, lines)
+    controller.captures[self] = [match.groups() for match in matches]
+
+    if len(matches) < len(lines):
+      textfile.index = start
+      textfile.comments_skipped = comments_skipped
+      for _ in range(0, len(matches) + 1):
+        next(textfile)
+      raise RuleViolation(
+          rule=self,
+          expected=self.regex.pattern,
+          textfile=textfile,
+      )
+
+  def resynchronize(self, controller: "Controller") -> None:
+    """Skip the remainder of the section this rule did not accept."""
+
+    controller.textfile.read_section()
@@ -1,11 +1,10 @@
 """RuleBase class."""
 
 import abc
-from typing import TYPE_CHECKING, List, Match, Optional
+from typing import TYPE_CHECKING, List, Optional
 
 from text_lint.operations.bases.operation_base import OperationBase
 from text_lint.operations.rules.args.split import AliasYamlSplit, SplitArgs
-from text_lint.results.tree import ResultTree
 
 if TYPE_CHECKING:  # pragma: no cover
   from text_lint.controller import Controller
@@ -15,8 +14,6 @@ if TYPE_CHECKING:  # pragma: no cover
 class RuleBase(OperationBase, abc.ABC):
   """Parser rule base class."""
 
-  matches: List[Match[str]]
-
   def __init__(
       self,
       name: str,
@@ -26,7 +23,6 @@ class RuleBase(OperationBase, abc.ABC):
     self.name = name
     self.splits = SplitArgs.create(splits)
     self.save = save
-    self.matches = []
 
   @abc.abstractmethod
   def apply(
@@ -35,19 +31,20 @@ class RuleBase(OperationBase, abc.ABC):
   ) -> None:
     """Base method for applying a rule."""
 
-  @property
-  def results(self) -> Optional["ResultTree"]:
-    """Cache and return results for this rule after it's been applied."""
-
-    if not self.save:
-      return None
+  def resynchronize(self, controller: "Controller") -> None:
+    """Skip the text file line that this rule did not accept."""
 
-    result = ResultTree(self.save)
+    next(controller.textfile)
 
-    for match in self.matches:
-      result.add_matches(match.groups(), self.splits.as_dict())
+  def save_results(self, controller: "Controller") -> None:
+    """Save the results of this rule after it's been applied."""
 
-    return result
+    if self.save and self.save not in controller.unused_saves:
+      controller.forest.add_captures(
+          self.save,
+          controller.captures.get(self, []),
+          self.splits.as_dict(),
+      )
 
   def schema_validator(
       self,
@@ -2,11 +2,14 @@
 
 import abc
 import re
-from typing import TYPE_CHECKING, Optional
+from itertools import takewhile
+from typing import TYPE_CHECKING, List, Match, Optional, cast
 
 from text_lint.operations.rules.bases.rule_base import RuleBase
+from text_lint.utilities.regex import literal_prefix
 
 if TYPE_CHECKING:  # pragma: no cover
+  from text_lint.controller import Controller
   from text_lint.operations.rules.args.split import AliasYamlSplit
 
 YAML_OPTIONS = """
@@ -18,7 +21,11 @@ optional: 'save' will store the the entire string for validation processing.
 
 
 class RuleRegexBase(RuleBase, abc.ABC):
-  """Parser regex based rule base class."""
+  """Parser regex based rule base class.
+
+  Any literal text that begins every match is extracted when the rule is
+  created, so lines without it are rejected without running the regex.
+  """
 
   __regex_flags = re.DOTALL
 
@@ -30,4 +37,43 @@ class RuleRegexBase(RuleBase, abc.ABC):
       splits: Optional["AliasYamlSplit"] = None,
   ) -> None:
     self.regex = re.compile(regex, self.__regex_flags)
+    self.prefix = literal_prefix(self.regex)
     super().__init__(name, save, splits)
+
+  def match(
+      self,
+      controller: "Controller",
+      data: str,
+  ) -> Optional[Match[str]]:
+    """Match a line of the text file against this rule's regex."""
+
+    match = None
+    rejected = not data.startswith(self.prefix)
+    if not rejected:
+      match = self.regex.match(data)
+    if controller.statistics is not None:
+      controller.statistics.count_match(self.name, match is not None, rejected)
+    return match
+
+  def match_lines(
+      self,
+      controller: "Controller",
+      lines: List[str],
+  ) -> List[Match[str]]:
+    """Match lines of the text file until the first line that does not match.
+
+    The returned list is shorter than the lines only if a line did not match.
+    """
+
+    matches = cast(
+        List[Match[str]],
+        list(takewhile(bool, map(self.regex.match, lines))),
+    )
+    if controller.statistics is not None:
+      failures = 1 if len(matches) < len(lines) else 0
+      controller.statistics.count_matches(
+          self.name,
+          len(matches) + failures,
+          failures,
+      )
+    return matches
@@ -12,11 +12,6 @@ if TYPE_CHECKING:  # pragma: no cover
   from text_lint.controller import Controller
 
 
-@pytest.fixture
-def mocked_result_class() -> mock.Mock:
-  return mock.Mock()
-
-
 @pytest.fixture
 def mocked_implementation() -> mock.Mock:
   return mock.Mock()
@@ -25,14 +20,7 @@ def mocked_implementation() -> mock.Mock:
 @pytest.fixture
 def concrete_rule_base_class(
     mocked_implementation: mock.Mock,
-    mocked_result_class: mock.Mock,
-    monkeypatch: pytest.MonkeyPatch,
 ) -> Type[rule_base.RuleBase]:
-  monkeypatch.setattr(
-      rule_base,
-      "ResultTree",
-      mocked_result_class,
-  )
 
   class ConcreteRule(rule_base.RuleBase):
     """Concrete rule base class."""
@@ -46,7 +34,6 @@ def concrete_rule_base_class(
         controller: "Controller",
     ) -> None:
       mocked_implementation(controller)
-      self.matches.append(mock.Mock())
 
   return ConcreteRule
 
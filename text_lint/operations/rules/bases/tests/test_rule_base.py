@@ -21,7 +21,6 @@ class TestRuleBase:
     attributes: AliasOperationAttributes = {
         "hint": "a concrete hint",
         "internal_use_only": False,
-        "matches": [],
         "name": "concrete name",
         "operation": concrete_rule_base_class.operation,
         "save": None,
@@ -41,7 +40,6 @@ class TestRuleBase:
     attributes: AliasOperationAttributes = {
         "hint": "a concrete hint",
         "internal_use_only": False,
-        "matches": [],
         "name": "concrete name",
         "operation": concrete_rule_base_class.operation,
         "save": "save_id",
@@ -70,44 +68,74 @@ class TestRuleBase:
 
     mocked_implementation.assert_called_once_with(mocked_controller)
 
-  def test_results__no_save_group__returns_none(
+  def test_resynchronize__skips_one_line(
+      self,
+      concrete_rule_base_instance: RuleBase,
+  ) -> None:
+    mocked_controller = mock.MagicMock()
+
+    concrete_rule_base_instance.resynchronize(mocked_controller)
+
+    mocked_controller.textfile.__next__.assert_called_once_with()
+
+  def test_save_results__no_save_group__does_not_add_captures(
       self,
       concrete_rule_base_instance: RuleBase,
   ) -> None:
     concrete_rule_base_instance.save = None
+    mocked_controller = mock.Mock()
+
+    concrete_rule_base_instance.save_results(mocked_controller)
 
-    assert concrete_rule_base_instance.results is None
+    mocked_controller.forest.add_captures.assert_not_called()
 
-  def test_results__with_save_group__creates_result_instance(
+  def test_save_results__with_save_group__adds_captures(
       self,
       concrete_rule_base_instance: RuleBase,
-      mocked_result_class: mock.Mock,
   ) -> None:
-    mocked_results = [mock.Mock(), mock.Mock()]
-    expected_add_matches_calls = [
-        mock.call(result.groups.return_value, {1: None})
-        for result in mocked_results
-    ]
+    mocked_captures = [("one", "two"), ("three", "four")]
     concrete_rule_base_instance.save = "save_group"
-    setattr(concrete_rule_base_instance, "matches", mocked_results)
+    mocked_controller = mock.Mock()
+    mocked_controller.captures = {concrete_rule_base_instance: mocked_captures}
+    mocked_controller.unused_saves = frozenset()
 
-    _ = concrete_rule_base_instance.results
+    concrete_rule_base_instance.save_results(mocked_controller)
 
-    mocked_result_class.assert_called_once_with("save_group")
-    assert mocked_result_class.return_value.add_matches.mock_calls == (
-        expected_add_matches_calls
+    mocked_controller.forest.add_captures.assert_called_once_with(
+        "save_group",
+        mocked_captures,
+        {1: None},
     )
 
-  def test_results__with_save_group__returns_result_instance(
+  def test_save_results__unused_save_group__does_not_add_captures(
       self,
       concrete_rule_base_instance: RuleBase,
-      mocked_result_class: mock.Mock,
   ) -> None:
     concrete_rule_base_instance.save = "save_group"
+    mocked_controller = mock.Mock()
+    mocked_controller.captures = {concrete_rule_base_instance: [("one",)]}
+    mocked_controller.unused_saves = frozenset({"save_group"})
 
-    results = concrete_rule_base_instance.results
+    concrete_rule_base_instance.save_results(mocked_controller)
 
-    assert results == mocked_result_class.return_value
+    mocked_controller.forest.add_captures.assert_not_called()
+
+  def test_save_results__with_save_group__no_captures__adds_no_captures(
+      self,
+      concrete_rule_base_instance: RuleBase,
+  ) -> None:
+    concrete_rule_base_instance.save = "save_group"
+    mocked_controller = mock.Mock()
+    mocked_controller.captures = {}
+    mocked_controller.unused_saves = frozenset()
+
+    concrete_rule_base_instance.save_results(mocked_controller)
+
+    mocked_controller.forest.add_captures.assert_called_once_with(
+        "save_group",
+        [],
+        {1: None},
+    )
 
   def test_schema_validator__is_a_noop(
       self,
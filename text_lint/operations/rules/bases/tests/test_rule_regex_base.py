@@ -1,7 +1,9 @@
 """Test the RuleRegexBase class."""
 
-from typing import Type
+from typing import List, Optional, Type
+from unittest import mock
 
+import pytest
 from text_lint.__helpers__.operations import (
     AliasOperationAttributes,
     assert_operation_inheritance,
@@ -21,9 +23,9 @@ class TestRuleRegexBase:
     attributes: AliasOperationAttributes = {
         "hint": "a concrete regex hint",
         "internal_use_only": False,
-        "matches": [],
         "name": "concrete name",
         "operation": concrete_rule_regex_base_class.operation,
+        "prefix": "",
         "regex": r'(.*).py',
         "save": None,
         "splits": {},
@@ -44,9 +46,9 @@ class TestRuleRegexBase:
     attributes: AliasOperationAttributes = {
         "hint": "a concrete regex hint",
         "internal_use_only": False,
-        "matches": [],
         "name": "concrete name",
         "operation": concrete_rule_regex_base_class.operation,
+        "prefix": "",
         "regex": r'[a-z]+',
         "save": "save_id",
         "splits": {
@@ -65,3 +67,111 @@ class TestRuleRegexBase:
         concrete_rule_regex_base_instance,
         bases=(RuleBase, RuleRegexBase),
     )
+
+  @pytest.mark.parametrize("data,expected", [("abc", "abc"), ("123", None)])
+  def test_match__no_statistics__returns_match(
+      self,
+      concrete_rule_regex_base_instance: RuleRegexBase,
+      data: str,
+      expected: Optional[str],
+  ) -> None:
+    mocked_controller = mock.Mock(statistics=None)
+
+    match = concrete_rule_regex_base_instance.match(mocked_controller, data)
+
+    assert (match and match.group(0)) == expected
+
+  @pytest.mark.parametrize("data,matched", [("abc", True), ("123", False)])
+  def test_match__statistics__counts_match(
+      self,
+      concrete_rule_regex_base_instance: RuleRegexBase,
+      data: str,
+      matched: bool,
+  ) -> None:
+    mocked_controller = mock.Mock()
+
+    concrete_rule_regex_base_instance.match(mocked_controller, data)
+
+    mocked_controller.statistics.count_match.assert_called_once_with(
+        concrete_rule_regex_base_instance.name,
+        matched,
+        False,
+    )
+
+  @pytest.mark.parametrize(
+      "data,expected,rejected", [
+          ("prefix-abc", "prefix-abc", False),
+          ("prefix-123", None, False),
+          ("abc", None, True),
+      ]
+  )
+  def test_match__literal_prefix__prefilters_lines(
+      self,
+      concrete_rule_regex_base_class: Type[RuleRegexBase],
+      data: str,
+      expected: Optional[str],
+      rejected: bool,
+  ) -> None:
+    mocked_controller = mock.Mock()
+    instance = concrete_rule_regex_base_class(
+        name="prefixed rule",
+        regex="^prefix-[a-z]+",
+    )
+
+    match = instance.match(mocked_controller, data)
+
+    assert instance.prefix == "prefix-"
+    assert (match and match.group(0)) == expected
+    mocked_controller.statistics.count_match.assert_called_once_with(
+        instance.name,
+        expected is not None,
+        rejected,
+    )
+
+  @pytest.mark.parametrize(
+      "lines,expected", [
+          (["abc", "def"], ["abc", "def"]),
+          (["abc", "123", "def"], ["abc"]),
+          (["123", "abc"], []),
+          ([], []),
+      ]
+  )
+  def test_match_lines__no_statistics__returns_matches_until_failure(
+      self,
+      concrete_rule_regex_base_instance: RuleRegexBase,
+      lines: List[str],
+      expected: List[str],
+  ) -> None:
+    mocked_controller = mock.Mock(statistics=None)
+
+    matches = concrete_rule_regex_base_instance.match_lines(
+        mocked_controller,
+        lines,
+    )
+
+    assert [match.group(0) for match in matches] == expected
+
+  @pytest.mark.parametrize(
+      "lines,attempts,failures", [
+          (["abc", "def"], 2, 0),
+          (["abc", "123", "def"], 2, 1),
+          (["123", "abc"], 1, 1),
+          ([], 0, 0),
+      ]
+  )
+  def test_match_lines__statistics__counts_matches(
+      self,
+      concrete_rule_regex_base_instance: RuleRegexBase,
+      lines: List[str],
+      attempts: int,
+      failures: int,
+  ) -> None:
+    mocked_controller = mock.Mock()
+
+    concrete_rule_regex_base_instance.match_lines(mocked_controller, lines)
+
+    mocked_controller.statistics.count_matches.assert_called_once_with(
+        concrete_rule_regex_base_instance.name,
+        attempts,
+        failures,
+    )
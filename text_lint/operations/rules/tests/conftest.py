@@ -30,7 +30,9 @@ def mocked_controller(
     mocked_textfile: mock.MagicMock,
 ) -> mock.Mock:
   instance = mock.Mock()
+  instance.captures = {}
   instance.rules = mocked_rule_sequencer
+  instance.statistics = None
   instance.textfile = mocked_textfile
   return instance
 
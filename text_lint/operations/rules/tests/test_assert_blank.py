@@ -28,7 +28,6 @@ class TestAssertBlank:
     attributes: AliasOperationAttributes = {
         "hint": "sections must be separated by blank lines",
         "internal_use_only": False,
-        "matches": [],
         "name": "example assert blank rule",
         "operation": "assert_blank",
         "save": None,
@@ -63,7 +62,7 @@ class TestAssertBlank:
 
     assert_blank_instance.apply(mocked_controller)
 
-    assert assert_blank_instance.matches == []
+    assert assert_blank_instance not in mocked_controller.captures
 
   def test_apply__does_not_match__raises_exception(
       self,
@@ -77,7 +76,7 @@ class TestAssertBlank:
     with pytest.raises(RuleViolation) as exc:
       assert_blank_instance.apply(mocked_controller)
 
-    assert assert_blank_instance.matches == []
+    assert assert_blank_instance not in mocked_controller.captures
     assert_is_rule_violation(
         exc=exc,
         rule=assert_blank_instance,
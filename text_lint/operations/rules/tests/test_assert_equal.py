@@ -1,5 +1,6 @@
 """Test AssertEqual class."""
 
+import contextlib
 from unittest import mock
 
 import pytest
@@ -24,12 +25,13 @@ class TestAssertEqual:
   def test_initialize__defaults__attributes(self) -> None:
     attributes: AliasOperationAttributes = {
         "case_sensitive": True,
+        "comparable_expected": "#!/usr/bin/make -f\n",
         "expected": "#!/usr/bin/make -f\n",
         "hint": "this line must match the expected value",
         "internal_use_only": False,
-        "matches": [],
         "name": "example assert equal rule",
         "operation": "assert_equal",
+        "prefix": "",
         "regex": "(.*)",
         "save": None,
         "splits": {},
@@ -49,12 +51,13 @@ class TestAssertEqual:
   ) -> None:
     attributes: AliasOperationAttributes = {
         "case_sensitive": False,
+        "comparable_expected": "#!/usr/bin/make -f\n",
         "expected": "#!/usr/bin/make -f\n",
         "hint": "this line must match the expected value",
         "internal_use_only": False,
-        "matches": [],
         "name": "example assert equal rule",
         "operation": "assert_equal",
+        "prefix": "",
         "regex": "(.*)",
         "save": "example",
         "splits": {
@@ -99,8 +102,53 @@ class TestAssertEqual:
 
     assert_equal_instance.apply(mocked_controller)
 
-    assert len(assert_equal_instance.matches) == 1
-    assert assert_equal_instance.matches[0].group(1) == scenario.text
+    captures = mocked_controller.captures[assert_equal_instance]
+    assert len(captures) == 1
+    assert captures[0][0] == scenario.text
+
+  @pytest.mark.parametrize(
+      "scenario",
+      [
+          CaseSensitivityScenario(sensitive=False, text="STRASSE\n"),
+          CaseSensitivityScenario(sensitive=True, text="straße\n"),
+      ],
+  )
+  def test_apply__vary_case_sensitivity__casefolded__stores_result(
+      self,
+      mocked_controller: mock.Mock,
+      mocked_textfile: mock.MagicMock,
+      scenario: CaseSensitivityScenario,
+  ) -> None:
+    instance = AssertEqual(
+        name="example assert equal rule",
+        expected="straße\n",
+        case_sensitive=scenario.sensitive,
+    )
+    mocked_textfile.__next__.return_value = scenario.text
+
+    instance.apply(mocked_controller)
+
+    assert mocked_controller.captures[instance] == [(scenario.text,)]
+
+  @pytest.mark.parametrize("text,matched", [("one\n", True), ("two\n", False)])
+  def test_apply__statistics__counts_match(
+      self,
+      mocked_controller: mock.Mock,
+      mocked_textfile: mock.MagicMock,
+      text: str,
+      matched: bool,
+  ) -> None:
+    instance = AssertEqual(name="example assert equal rule", expected="one\n")
+    mocked_controller.statistics = mock.Mock()
+    mocked_textfile.__next__.return_value = text
+
+    with contextlib.suppress(RuleViolation):
+      instance.apply(mocked_controller)
+
+    mocked_controller.statistics.count_match.assert_called_once_with(
+        instance.name,
+        matched,
+    )
 
   @pytest.mark.parametrize(
       "scenario",
@@ -123,7 +171,7 @@ class TestAssertEqual:
     with pytest.raises(RuleViolation) as exc:
       assert_equal_instance.apply(mocked_controller)
 
-    assert len(assert_equal_instance.matches) == 0
+    assert assert_equal_instance not in mocked_controller.captures
     assert_is_rule_violation(
         exc=exc,
         rule=assert_equal_instance,
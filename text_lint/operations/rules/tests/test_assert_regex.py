@@ -25,9 +25,9 @@ class TestAssertRegex:
     attributes: AliasOperationAttributes = {
         "hint": "this line must match the regex",
         "internal_use_only": False,
-        "matches": [],
         "name": "example assert regex rule",
         "operation": "assert_regex",
+        "prefix": "",
         "regex": "^([a-z-]+):\\s.+\n$",
         "save": None,
         "splits": {},
@@ -48,9 +48,9 @@ class TestAssertRegex:
     attributes: AliasOperationAttributes = {
         "hint": "this line must match the regex",
         "internal_use_only": False,
-        "matches": [],
         "name": "example assert regex rule",
         "operation": "assert_regex",
+        "prefix": "",
         "regex": "^([a-z-]+):\\s.+\n$",
         "save": "example",
         "splits": {
@@ -90,8 +90,9 @@ class TestAssertRegex:
 
     assert_regex_instance.apply(mocked_controller)
 
-    assert len(assert_regex_instance.matches) == 1
-    assert assert_regex_instance.matches[0].group(1) == "matching"
+    captures = mocked_controller.captures[assert_regex_instance]
+    assert len(captures) == 1
+    assert captures[0][0] == "matching"
 
   def test_apply__does_not_match__raises_exception(
       self,
@@ -105,7 +106,7 @@ class TestAssertRegex:
     with pytest.raises(RuleViolation) as exc:
       assert_regex_instance.apply(mocked_controller)
 
-    assert len(assert_regex_instance.matches) == 0
+    assert assert_regex_instance not in mocked_controller.captures
     assert_is_rule_violation(
         exc=exc,
         rule=assert_regex_instance,
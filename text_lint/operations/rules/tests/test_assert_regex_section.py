@@ -1,5 +1,6 @@
 """Test AssertRegexSection class."""
 
+from typing import List
 from unittest import mock
 
 import pytest
@@ -15,7 +16,6 @@ from text_lint.__helpers__.translations import assert_is_translated
 from text_lint.exceptions.rules import RuleViolation
 from text_lint.operations.rules.bases.rule_base import RuleBase
 from text_lint.operations.rules.bases.rule_regex_base import RuleRegexBase
-from text_lint.utilities.whitespace import new_line
 from ..assert_regex_section import YAML_EXAMPLE, AssertRegexSection
 
 
@@ -30,9 +30,9 @@ class TestAssertRegexSection:
                 "this regex"
             ),
         "internal_use_only": False,
-        "matches": [],
         "name": "example assert regex section rule",
         "operation": "assert_regex_section",
+        "prefix": "",
         "regex": "^([a-z-]+):\\s(.+)\n$",
         "save": None,
         "splits": {},
@@ -57,9 +57,9 @@ class TestAssertRegexSection:
                 "this regex"
             ),
         "internal_use_only": False,
-        "matches": [],
         "name": "example assert regex section rule",
         "operation": "assert_regex_section",
+        "prefix": "",
         "regex": "^([a-z-]+):\\s(.+)\n$",
         "save": "example",
         "splits": {
@@ -95,15 +95,13 @@ class TestAssertRegexSection:
       mocked_controller: mock.Mock,
       mocked_textfile: mock.MagicMock,
   ) -> None:
-    mocked_textfile.__iter__.return_value = [
-        "matching: string\n",
-        new_line(),
-    ]
+    mocked_textfile.read_section.return_value = ["matching: string\n"]
 
     assert_regex_section_instance.apply(mocked_controller)
 
-    assert len(assert_regex_section_instance.matches) == 1
-    assert assert_regex_section_instance.matches[0].group(1) == "matching"
+    captures = mocked_controller.captures[assert_regex_section_instance]
+    assert len(captures) == 1
+    assert captures[0][0] == "matching"
 
   def test_apply__two_line__matches__stores_result(
       self,
@@ -111,36 +109,80 @@ class TestAssertRegexSection:
       mocked_controller: mock.Mock,
       mocked_textfile: mock.MagicMock,
   ) -> None:
-    mocked_textfile.__iter__.return_value = [
+    mocked_textfile.read_section.return_value = [
         "matching-one: string\n",
         "matching-two: string\n",
-        new_line(),
     ]
 
     assert_regex_section_instance.apply(mocked_controller)
 
-    assert len(assert_regex_section_instance.matches) == 2
-    assert assert_regex_section_instance.matches[0].group(1) == "matching-one"
-    assert assert_regex_section_instance.matches[1].group(1) == "matching-two"
+    captures = mocked_controller.captures[assert_regex_section_instance]
+    assert len(captures) == 2
+    assert captures[0][0] == "matching-one"
+    assert captures[1][0] == "matching-two"
+
+  def test_apply__empty_section__stores_no_result(
+      self,
+      assert_regex_section_instance: AssertRegexSection,
+      mocked_controller: mock.Mock,
+      mocked_textfile: mock.MagicMock,
+  ) -> None:
+    mocked_textfile.read_section.return_value = []
+
+    assert_regex_section_instance.apply(mocked_controller)
+
+    assert mocked_controller.captures[assert_regex_section_instance] == []
 
-  def test_apply__entire_file__matches__stores_result(
+  def test_apply__repeated__stores_only_new_results(
       self,
       assert_regex_section_instance: AssertRegexSection,
       mocked_controller: mock.Mock,
       mocked_textfile: mock.MagicMock,
   ) -> None:
-    mocked_textfile.__iter__.return_value = [
+    mocked_textfile.read_section.side_effect = [
+        ["matching-one: string\n"],
+        ["matching-two: string\n"],
+    ]
+
+    assert_regex_section_instance.apply(mocked_controller)
+    assert_regex_section_instance.apply(mocked_controller)
+
+    captures = mocked_controller.captures[assert_regex_section_instance]
+    assert len(captures) == 1
+    assert captures[0][0] == "matching-two"
+
+  def test_apply__eof__raises_stop_iteration(
+      self,
+      assert_regex_section_instance: AssertRegexSection,
+      mocked_controller: mock.Mock,
+      mocked_textfile: mock.MagicMock,
+  ) -> None:
+    mocked_textfile.read_section.side_effect = StopIteration
+
+    with pytest.raises(StopIteration):
+      assert_regex_section_instance.apply(mocked_controller)
+
+    assert mocked_controller.captures[assert_regex_section_instance] == []
+
+  def test_apply__statistics__counts_matches(
+      self,
+      assert_regex_section_instance: AssertRegexSection,
+      mocked_controller: mock.Mock,
+      mocked_textfile: mock.MagicMock,
+  ) -> None:
+    mocked_controller.statistics = mock.Mock()
+    mocked_textfile.read_section.return_value = [
         "matching-one: string\n",
         "matching-two: string\n",
-        "matching-three: string\n",
     ]
 
     assert_regex_section_instance.apply(mocked_controller)
 
-    assert len(assert_regex_section_instance.matches) == 3
-    assert assert_regex_section_instance.matches[0].group(1) == "matching-one"
-    assert assert_regex_section_instance.matches[1].group(1) == "matching-two"
-    assert assert_regex_section_instance.matches[2].group(1) == "matching-three"
+    mocked_controller.statistics.count_matches.assert_called_once_with(
+        assert_regex_section_instance.name,
+        2,
+        0,
+    )
 
   def test_apply__two_lines__one_matches__one_does_not_match__raises_exception(
       self,
@@ -149,20 +191,64 @@ class TestAssertRegexSection:
       mocked_textfile: mock.MagicMock,
   ) -> None:
     mocked_textfile.index = 1
-    mocked_textfile.__iter__.return_value = [
+    mocked_textfile.read_section.return_value = [
         "matching-one: string\n",
         "matching2: string\n",
-        new_line(),
+        "matching-three: string\n",
     ]
 
     with pytest.raises(RuleViolation) as exc:
       assert_regex_section_instance.apply(mocked_controller)
 
-    assert len(assert_regex_section_instance.matches) == 1
-    assert assert_regex_section_instance.matches[0].group(1) == "matching-one"
+    captures = mocked_controller.captures[assert_regex_section_instance]
+    assert len(captures) == 1
+    assert captures[0][0] == "matching-one"
     assert_is_rule_violation(
         exc=exc,
         rule=assert_regex_section_instance,
         textfile=mocked_textfile,
         expected=assert_regex_section_instance.regex.pattern,
     )
+
+  def test_apply__does_not_match__rewinds_to_failing_line(
+      self,
+      assert_regex_section_instance: AssertRegexSection,
+      mocked_controller: mock.Mock,
+      mocked_textfile: mock.MagicMock,
+  ) -> None:
+    mocked_textfile.index = 1
+    mocked_textfile.comments_skipped = 2
+
+    def read_section() -> List[str]:
+      mocked_textfile.index = 9
+      mocked_textfile.comments_skipped = 4
+      return [
+          "matching-one: string\n",
+          "matching2: string\n",
+          "matching-three: string\n",
+      ]
+
+    def next_line() -> str:
+      mocked_textfile.index += 1
+      return "line"
+
+    mocked_textfile.read_section.side_effect = read_section
+    mocked_textfile.__next__.side_effect = next_line
+
+    with pytest.raises(RuleViolation):
+      assert_regex_section_instance.apply(mocked_controller)
+
+    assert mocked_textfile.__next__.call_count == 2
+    assert mocked_textfile.comments_skipped == 2
+    assert mocked_textfile.index == 2
+
+  def test_resynchronize__skips_remaining_section(
+      self,
+      assert_regex_section_instance: AssertRegexSection,
+      mocked_controller: mock.Mock,
+      mocked_textfile: mock.MagicMock,
+  ) -> None:
+    assert_regex_section_instance.resynchronize(mocked_controller)
+
+    mocked_textfile.read_section.assert_called_once_with()
+    mocked_textfile.__next__.assert_not_called()
@@ -30,7 +30,6 @@ class TestAssertSequenceBegins:
         "count": 2,
         "hint": "identify a repeating sequence of parser rules",
         "internal_use_only": False,
-        "matches": [],
         "name": "example assert sequence begins rule",
         "operation": "assert_sequence_begins",
         "rules": mocked_nested_rules,
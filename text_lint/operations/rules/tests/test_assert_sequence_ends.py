@@ -20,7 +20,6 @@ class TestAssertSequenceEnds:
     attributes: AliasOperationAttributes = {
         "hint": "reserved",
         "internal_use_only": True,
-        "matches": [],
         "name": "example assert sequence ends rule",
         "operation": "assert_sequence_ends",
         "save": None,
@@ -1,5 +1,5 @@
 """Parser result set YAML argument definitions."""
-from typing import Dict, Iterator, List, Optional
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
 
 from text_lint.config import (
     LOOKUP_SENTINEL,
@@ -7,6 +7,10 @@ from text_lint.config import (
     LOOKUP_TRANSFORMATION_PREFIX,
 )
 from text_lint.operations.lookups import lookup_registry
+from text_lint.sequencers.lookups import LookupsSequencer
+
+if TYPE_CHECKING:  # pragma: no cover
+  from text_lint.operations.lookups.bases.lookup_base import LookupBase
 
 AliasYamlResultSet = List[str]
 AliasYamlResultDefinition = Dict[str, "AliasYamlResultDefinition"]
@@ -26,12 +30,16 @@ class ResultSetArg:
     return iter(self._saved_result_set)
 
   @classmethod
-  def create(cls, yaml_input: AliasYamlResultSet) -> "ResultSetArg":
+  def create(
+      cls,
+      yaml_input: AliasYamlResultSet,
+      requesting_operation_name: str,
+  ) -> "ResultSetArg":
     """Create an instance from YAML input."""
 
     created_sets = []
     for yaml_set in yaml_input:
-      created_sets.append(ResultSet(yaml_set))
+      created_sets.append(ResultSet(yaml_set, requesting_operation_name))
     return cls(saved_result_set=created_sets)
 
 
@@ -40,11 +48,13 @@ class ResultSet:
 
   lookups: List[str]
   name: str
+  pipeline: Tuple["LookupBase", ...]
   source: str
 
   def __init__(
       self,
       result_lookup_definition: str,
+      requesting_operation_name: str,
   ) -> None:
     self.name = result_lookup_definition
     self._parsing_container: List[str] = result_lookup_definition.split(
@@ -55,6 +65,10 @@ class ResultSet:
     if len(self.lookups) == 0:
       self.lookups = [LOOKUP_SENTINEL]
     self.validate_lookups()
+    self.pipeline = tuple(LookupsSequencer(
+        self,
+        requesting_operation_name,
+    ))
 
   def validate_lookups(self) -> None:
     found_encoding_lookup = False
@@ -16,12 +16,14 @@ def result_set_instances() -> List[ResultSet]:
               CaptureLookup.operation,
               JsonLookup.operation,
           ]
-      )
+      ),
+      "mocked_requesting_operation_name",
   )
   result_set2 = ResultSet(
       LOOKUP_SEPERATOR.join([
           "source2",
           UpperLookup.operation,
-      ])
+      ]),
+      "mocked_requesting_operation_name",
   )
   return [result_set1, result_set2]
@@ -1,25 +1,52 @@
 """Test the ResultSet class."""
+from typing import List, Type
+
 import pytest
 from text_lint.config import (
     LOOKUP_SENTINEL,
     LOOKUP_SEPERATOR,
     LOOKUP_STATIC_VALUE_MARKER,
 )
-from text_lint.operations.lookups import JsonLookup, NoopLookup, UpperLookup
+from text_lint.operations.lookups import (
+    DefaultLookup,
+    IndexLookup,
+    JsonLookup,
+    NameLookup,
+    NoopLookup,
+    UpperLookup,
+)
+from text_lint.operations.lookups.bases.lookup_base import LookupBase
 from ..result_set import ResultSet
 
 
 class TestResultSet:
   """Test the ResultSet class."""
 
+  def assert_is_pipeline(
+      self,
+      instance: ResultSet,
+      lookup_classes: List[Type[LookupBase]],
+  ) -> None:
+    assert isinstance(instance.pipeline, tuple)
+    assert len(instance.pipeline) == len(lookup_classes)
+    for index, lookup_class in enumerate(lookup_classes):
+      lookup = instance.pipeline[index]
+      assert type(lookup) is lookup_class  # pylint: disable=unidiomatic-typecheck
+      assert lookup.lookup_name == instance.lookups[index]
+      assert lookup.result_set == instance
+      assert lookup.requesting_operation_name == (
+          "mocked_requesting_operation_name"
+      )
+
   def test_initialize__source_only__attributes(self) -> None:
     mock_lookup = "source_name"
 
-    instance = ResultSet(mock_lookup)
+    instance = ResultSet(mock_lookup, "mocked_requesting_operation_name")
 
     assert instance.name == mock_lookup
     assert instance.source == "source_name"
     assert instance.lookups == [LOOKUP_SENTINEL]
+    self.assert_is_pipeline(instance, [NoopLookup])
 
   def test_initialize__valid_lookup__attributes(self) -> None:
     mock_lookup = LOOKUP_SEPERATOR.join(
@@ -30,7 +57,7 @@ class TestResultSet:
         ]
     )
 
-    instance = ResultSet(mock_lookup)
+    instance = ResultSet(mock_lookup, "mocked_requesting_operation_name")
 
     assert instance.name == mock_lookup
     assert instance.source == "source_name"
@@ -38,6 +65,10 @@ class TestResultSet:
         NoopLookup.operation,
         UpperLookup.operation,
     ]
+    self.assert_is_pipeline(
+        instance,
+        [NoopLookup, UpperLookup],
+    )
 
   def test_initialize__valid_lookup_with_index__attributes(self) -> None:
     mock_lookup = LOOKUP_SEPERATOR.join(
@@ -49,7 +80,7 @@ class TestResultSet:
         ]
     )
 
-    instance = ResultSet(mock_lookup)
+    instance = ResultSet(mock_lookup, "mocked_requesting_operation_name")
 
     assert instance.name == mock_lookup
     assert instance.source == "source_name"
@@ -58,6 +89,10 @@ class TestResultSet:
         UpperLookup.operation,
         "1",
     ]
+    self.assert_is_pipeline(
+        instance,
+        [NoopLookup, UpperLookup, IndexLookup],
+    )
 
   def test_initialize__valid_lookup_with_name_marker__attributes(self) -> None:
     mock_lookup = LOOKUP_SEPERATOR.join(
@@ -69,7 +104,7 @@ class TestResultSet:
         ]
     )
 
-    instance = ResultSet(mock_lookup)
+    instance = ResultSet(mock_lookup, "mocked_requesting_operation_name")
 
     assert instance.name == mock_lookup
     assert instance.source == "source_name"
@@ -78,6 +113,10 @@ class TestResultSet:
         UpperLookup.operation,
         LOOKUP_STATIC_VALUE_MARKER + "mock_value",
     ]
+    self.assert_is_pipeline(
+        instance,
+        [NoopLookup, UpperLookup, NameLookup],
+    )
 
   def test_initialize__unknown_lookup__attributes(self) -> None:
     mock_lookup = LOOKUP_SEPERATOR.join(
@@ -89,7 +128,7 @@ class TestResultSet:
         ]
     )
 
-    instance = ResultSet(mock_lookup)
+    instance = ResultSet(mock_lookup, "mocked_requesting_operation_name")
 
     assert instance.name == mock_lookup
     assert instance.source == "source_name"
@@ -98,6 +137,10 @@ class TestResultSet:
         UpperLookup.operation,
         "unknown_lookup",
     ]
+    self.assert_is_pipeline(
+        instance,
+        [NoopLookup, UpperLookup, DefaultLookup],
+    )
 
   def test_initialize__invalid_lookup_sequence__raises_exception(self) -> None:
     mock_lookup = LOOKUP_SEPERATOR.join(
@@ -109,6 +152,6 @@ class TestResultSet:
     )
 
     with pytest.raises(ValueError) as exc:
-      ResultSet(mock_lookup)
+      ResultSet(mock_lookup, "mocked_requesting_operation_name")
 
     assert str(exc.value) == "Transformations belong at the end of the lookup."
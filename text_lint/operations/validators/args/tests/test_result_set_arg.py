@@ -21,6 +21,10 @@ class TestResultSetArg:
     assert instance.name == name
     assert instance.source == source
     assert instance.lookups == lookups
+    for lookup in instance.pipeline:
+      assert lookup.requesting_operation_name == (
+          "mocked_requesting_operation_name"
+      )
 
   def test_intialize__attributes(
       self,
@@ -65,7 +69,7 @@ class TestResultSetArg:
   def test_create__no_yaml_definition__does_not_create_result_sets(
       self
   ) -> None:
-    instance = ResultSetArg.create([])
+    instance = ResultSetArg.create([], "mocked_requesting_operation_name")
 
     results = list(instance)
     assert len(results) == 0
@@ -82,7 +86,8 @@ class TestResultSetArg:
                     JsonLookup.operation,
                 ]
             )
-        ]
+        ],
+        "mocked_requesting_operation_name",
     )
 
     results = list(instance)
@@ -120,7 +125,8 @@ class TestResultSetArg:
                 ]
             ),
             "source3",
-        ]
+        ],
+        "mocked_requesting_operation_name",
     )
 
     results = list(instance)
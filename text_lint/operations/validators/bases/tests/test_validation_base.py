@@ -52,3 +52,10 @@ class TestValidationBase:
     stdout, stderr = capfd.readouterr()
     assert stdout == mocked_message + NEW_LINE
     assert stderr == ""
+
+  def test_requested_results__returns_empty_list(
+      self,
+      concrete_validator_base_instance: ValidationBase,
+  ) -> None:
+    # pylint: disable=use-implicit-booleaness-not-comparison
+    assert concrete_validator_base_instance.requested_results() == []
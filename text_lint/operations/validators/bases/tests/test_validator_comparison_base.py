@@ -87,6 +87,10 @@ class TestValidationComparisonBase:
     )
     assert requested_results[0].name == mocked_result_set_a[0]
     assert requested_results[1].name == mocked_result_set_a[1]
+    for requested_result in requested_results:
+      assert requested_result.pipeline[0].requesting_operation_name == (
+          concrete_validator_comparison_base_instance.name
+      )
 
   def test_initialize__creates_result_set_arg_b_instance(
       self,
@@ -103,6 +107,24 @@ class TestValidationComparisonBase:
     )
     assert requested_results[0].name == mocked_result_set_b[0]
     assert requested_results[1].name == mocked_result_set_b[1]
+    for requested_result in requested_results:
+      assert requested_result.pipeline[0].requesting_operation_name == (
+          concrete_validator_comparison_base_instance.name
+      )
+
+  def test_requested_results__returns_result_sets_a_and_b(
+      self,
+      mocked_result_set_a: List[str],
+      mocked_result_set_b: List[str],
+      concrete_validator_comparison_base_instance: ValidationComparisonBase,
+  ) -> None:
+    requested_results = (
+        concrete_validator_comparison_base_instance.requested_results()
+    )
+
+    assert [
+        requested_result.name for requested_result in requested_results
+    ] == mocked_result_set_a + mocked_result_set_b
 
   def test_apply__valid_lookups__performs_each_expected_a_lookup(
       self,
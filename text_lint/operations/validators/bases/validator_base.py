@@ -2,13 +2,14 @@
 
 import abc
 import sys
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, List
 
 from text_lint.config import NEW_LINE
 from text_lint.operations.bases.operation_base import OperationBase
 
 if TYPE_CHECKING:  # pragma: no cover
   from text_lint.controller import Controller
+  from text_lint.operations.validators.args.result_set import ResultSet
 
 
 class ValidationBase(
@@ -27,6 +28,10 @@ class ValidationBase(
     """Write a message to the console."""
     sys.stdout.write(message + NEW_LINE)
 
+  def requested_results(self) -> List["ResultSet"]:
+    """Return the saved results this validator looks up."""
+    return []
+
   @abc.abstractmethod
   def apply(
       self,
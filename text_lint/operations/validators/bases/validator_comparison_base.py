@@ -1,7 +1,7 @@
 """ValidationComparisonBase class."""
 
 import abc
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, List
 
 from text_lint.exceptions.validators import ValidationFailure
 from text_lint.operations.validators.args.result_set import ResultSetArg
@@ -34,8 +34,12 @@ class ValidationComparisonBase(ValidationBase, abc.ABC):
       saved_b: "AliasYamlResultSet",
   ):
     super().__init__(name)
-    self.saved_results_a = ResultSetArg.create(saved_a)
-    self.saved_results_b = ResultSetArg.create(saved_b)
+    self.saved_results_a = ResultSetArg.create(saved_a, name)
+    self.saved_results_b = ResultSetArg.create(saved_b, name)
+
+  def requested_results(self) -> List["ResultSet"]:
+    """Return the saved results this validator looks up."""
+    return list(self.saved_results_a) + list(self.saved_results_b)
 
   @abc.abstractmethod
   def comparison(
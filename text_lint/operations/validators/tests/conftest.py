@@ -5,6 +5,7 @@ from typing import List
 from unittest import mock
 
 import pytest
+from text_lint.results.arena import ResultArena
 from .. import validate_combine, validate_debug, validate_equal
 
 
@@ -16,6 +17,7 @@ def mocked_combined_result_tree_name() -> str:
 @pytest.fixture
 def mocked_controller() -> mock.Mock:
   instance = mock.Mock()
+  instance.forest.arena = ResultArena()
   return instance
 
 
@@ -66,15 +66,25 @@ class TestValidateCombine:
     assert requested_results[0].name == mocked_result_set_a[0]
     assert requested_results[1].name == mocked_result_set_a[1]
 
-  def test_initialize__creates_empty_result_tree_instance(
+  def test_initialize__stores_new_saved_name(
       self,
       mocked_combined_result_tree_name: str,
       validate_combine_instance: ValidateCombine,
   ) -> None:
-    assert isinstance(validate_combine_instance.new_tree, ResultTree)
-    assert validate_combine_instance.new_tree.value == \
+    assert validate_combine_instance.new_saved == (
         mocked_combined_result_tree_name
-    assert len(validate_combine_instance.new_tree.children) == 0
+    )
+
+  def test_requested_results__returns_result_sets(
+      self,
+      mocked_result_set_a: List[str],
+      validate_combine_instance: ValidateCombine,
+  ) -> None:
+    requested_results = validate_combine_instance.requested_results()
+
+    assert [
+        requested_result.name for requested_result in requested_results
+    ] == mocked_result_set_a
 
   def test_apply__performs_each_expected_lookup(
       self,
@@ -116,10 +126,10 @@ class TestValidateCombine:
 
     validate_combine_instance.apply(mocked_controller)
 
-    assert isinstance(validate_combine_instance.new_tree, ResultTree)
-    assert validate_combine_instance.new_tree.value == \
-        mocked_combined_result_tree_name
-    for index, child in enumerate(validate_combine_instance.new_tree.children):
+    new_tree = mocked_controller.forest.add.call_args[0][0]
+    assert isinstance(new_tree, ResultTree)
+    assert new_tree.value == mocked_combined_result_tree_name
+    for index, child in enumerate(new_tree.children):
       assert isinstance(child, ResultTree)
       assert child.value == "result_{0}".format(index)
 
@@ -136,10 +146,10 @@ class TestValidateCombine:
 
     validate_combine_instance.apply(mocked_controller)
 
-    assert isinstance(validate_combine_instance.new_tree, ResultTree)
-    assert validate_combine_instance.new_tree.value == \
-        mocked_combined_result_tree_name
-    for index, child in enumerate(validate_combine_instance.new_tree.children):
+    new_tree = mocked_controller.forest.add.call_args[0][0]
+    assert isinstance(new_tree, ResultTree)
+    assert new_tree.value == mocked_combined_result_tree_name
+    for index, child in enumerate(new_tree.children):
       assert isinstance(child, ResultTree)
       assert child.value == "result_{0}".format(index)
 
@@ -158,10 +168,10 @@ class TestValidateCombine:
 
     validate_combine_instance.apply(mocked_controller)
 
-    assert isinstance(validate_combine_instance.new_tree, ResultTree)
-    assert validate_combine_instance.new_tree.value == \
-        mocked_combined_result_tree_name
-    for index, child in enumerate(validate_combine_instance.new_tree.children):
+    new_tree = mocked_controller.forest.add.call_args[0][0]
+    assert isinstance(new_tree, ResultTree)
+    assert new_tree.value == mocked_combined_result_tree_name
+    for index, child in enumerate(new_tree.children):
       assert isinstance(child, ResultTree)
       assert child.value == "result_{0}".format(index)
 
@@ -177,10 +187,54 @@ class TestValidateCombine:
 
     validate_combine_instance.apply(mocked_controller)
 
-    mocked_controller.forest.add.assert_called_once_with(
-        validate_combine_instance.new_tree
+    mocked_controller.forest.add.assert_called_once()
+    new_tree = mocked_controller.forest.add.call_args[0][0]
+    assert isinstance(new_tree, ResultTree)
+    assert len(new_tree.children) == 2
+
+  def test_apply__valid_results__stores_result_tree_in_forest_arena(
+      self,
+      mocked_controller: mock.Mock,
+      validate_combine_instance: ValidateCombine,
+  ) -> None:
+    mocked_controller.forest.lookup.side_effect = (
+        "result_0",
+        "result_1",
+    )
+
+    validate_combine_instance.apply(mocked_controller)
+
+    new_tree = mocked_controller.forest.add.call_args[0][0]
+    assert new_tree.arena is mocked_controller.forest.arena
+    assert len(mocked_controller.forest.arena) == 3
+
+  def test_apply__repeated__adds_independent_result_trees_to_forest(
+      self,
+      mocked_controller: mock.Mock,
+      validate_combine_instance: ValidateCombine,
+  ) -> None:
+    mocked_controller.forest.lookup.side_effect = (
+        "result_0",
+        "result_1",
+        "result_2",
+        "result_3",
     )
 
+    validate_combine_instance.apply(mocked_controller)
+    validate_combine_instance.apply(mocked_controller)
+
+    first_tree = mocked_controller.forest.add.call_args_list[0][0][0]
+    second_tree = mocked_controller.forest.add.call_args_list[1][0][0]
+    assert first_tree is not second_tree
+    assert [child.value for child in first_tree.children] == [
+        "result_0",
+        "result_1",
+    ]
+    assert [child.value for child in second_tree.children] == [
+        "result_2",
+        "result_3",
+    ]
+
   def test_apply__valid_results__outputs_expected_lookup_results(
       self,
       method_mocker: "AliasMethodMocker",
@@ -198,7 +252,7 @@ class TestValidateCombine:
       expected_mock_calls.append(
           validate_combine_instance.msg_fmt_combine.format(
               result,
-              validate_combine_instance.new_tree.value,
+              validate_combine_instance.new_saved,
           )
       )
 
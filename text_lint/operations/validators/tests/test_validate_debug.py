@@ -65,6 +65,17 @@ class TestValidateDebug:
     assert requested_results[0].name == mocked_result_set_a[0]
     assert requested_results[1].name == mocked_result_set_a[1]
 
+  def test_requested_results__returns_result_sets(
+      self,
+      mocked_result_set_a: List[str],
+      validate_debug_instance: ValidateDebug,
+  ) -> None:
+    requested_results = validate_debug_instance.requested_results()
+
+    assert [
+        requested_result.name for requested_result in requested_results
+    ] == mocked_result_set_a
+
   def test_apply__valid_lookups__performs_each_expected_lookup(
       self,
       mocked_controller: mock.Mock,
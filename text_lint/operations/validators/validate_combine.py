@@ -9,7 +9,10 @@ from text_lint.utilities.translations import _, f
 
 if TYPE_CHECKING:  # pragma: no cover
   from text_lint.controller import Controller
-  from text_lint.operations.validators.args.result_set import AliasYamlResultSet
+  from text_lint.operations.validators.args.result_set import (
+      AliasYamlResultSet,
+      ResultSet,
+  )
   from text_lint.results.forest import AliasLookupResult
 
 YAML_EXAMPLE = """
@@ -41,12 +44,21 @@ class ValidateCombine(ValidationBase):
       saved: "AliasYamlResultSet",
   ):
     super().__init__(name)
-    self.new_tree = ResultTree.create(value=new_saved)
-    self.saved_results = ResultSetArg.create(saved)
+    self.new_saved = new_saved
+    self.saved_results = ResultSetArg.create(saved, name)
+
+  def requested_results(self) -> List["ResultSet"]:
+    """Return the saved results this validator looks up."""
+    return list(self.saved_results)
 
   def apply(self, controller: "Controller") -> None:
     """Apply the ValidateCombine validator logic."""
 
+    new_tree = ResultTree.create(
+        value=self.new_saved,
+        arena=controller.forest.arena,
+    )
+
     for requested_lookup_to_combine in self.saved_results:
 
       result = controller.forest.lookup(
@@ -55,26 +67,25 @@ class ValidateCombine(ValidationBase):
           self.name,
       )
 
-      self._create_children(result, self.new_tree.children)
+      self._create_children(result, new_tree)
 
       self.print(
           f(
               self.msg_fmt_combine,
               requested_lookup_to_combine.name,
-              self.new_tree.value,
+              new_tree.value,
           )
       )
 
-    controller.forest.add(self.new_tree)
+    controller.forest.add(new_tree)
 
   def _create_children(
       self,
       value: "AliasLookupResult",
-      created: List[ResultTree],
+      created: ResultTree,
   ) -> None:
     if isinstance(value, str):
-      instance = ResultTree.create(value=value)
-      created.append(instance)
+      created.append(ResultTree.create(value=value, arena=created.arena))
     else:
       for element in value:
         self._create_children(element, created)
@@ -1,7 +1,7 @@
 """ValidateDebug class."""
 
 import json
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, List
 
 from text_lint.operations.validators.args.result_set import ResultSetArg
 from text_lint.operations.validators.bases.validator_base import ValidationBase
@@ -9,7 +9,10 @@ from text_lint.utilities.translations import _, f
 
 if TYPE_CHECKING:  # pragma: no cover
   from text_lint.controller import Controller
-  from text_lint.operations.validators.args.result_set import AliasYamlResultSet
+  from text_lint.operations.validators.args.result_set import (
+      AliasYamlResultSet,
+      ResultSet,
+  )
 
 YAML_EXAMPLE = """
 
@@ -33,7 +36,11 @@ class ValidateDebug(ValidationBase):
 
   def __init__(self, name: str, saved: "AliasYamlResultSet"):
     super().__init__(name)
-    self.saved_results = ResultSetArg.create(saved)
+    self.saved_results = ResultSetArg.create(saved, name)
+
+  def requested_results(self) -> List["ResultSet"]:
+    """Return the saved results this validator looks up."""
+    return list(self.saved_results)
 
   def apply(self, controller: "Controller") -> None:
     """Apply the ValidateDebug validator logic."""
@@ -0,0 +1,194 @@
+"""ControllerPool class."""
+
+import multiprocessing
+from contextlib import redirect_stdout
+from io import StringIO
+from typing import Iterator, List, NamedTuple, Optional, Tuple
+
+from text_lint.config import POOL_CHUNKS_PER_JOB
+from text_lint.controller import Controller
+from text_lint.profiler import Profiler
+from text_lint.schema import Schema
+from text_lint.sequencers.textfile import TextFileSequencer
+from text_lint.statistics import Statistics
+
+
+class ControllerResult(NamedTuple):
+  """The outcome of linting a single text file."""
+
+  file_path: str
+  output: str
+  error: Optional[str]
+  profiler: Optional[Profiler] = None
+  statistics: Optional[Statistics] = None
+
+
+class ControllerWorker:
+  """Lints text files inside a worker process, reusing one loaded schema."""
+
+  collect_statistics = False
+  error: Optional[str] = None
+  max_errors = 1
+  profile = False
+  schema: Optional[Schema] = None
+  textfile_mode = TextFileSequencer.mode
+
+  @classmethod
+  def initialize(
+      cls,
+      schema_path: str,
+      textfile_mode: str,
+      profile: bool = False,
+      collect_statistics: bool = False,
+      max_errors: int = 1,
+  ) -> None:
+    """Load the schema once for this worker process.
+
+    Any failure is stored and reported for each text file, as an exception
+    raised here would cause the worker process to be endlessly replaced.
+    """
+
+    cls.collect_statistics = collect_statistics
+    cls.max_errors = max_errors
+    cls.profile = profile
+    cls.textfile_mode = textfile_mode
+    try:
+      cls.schema = cls.load_schema(schema_path)
+    except Exception as exc:  # pylint: disable=broad-exception-caught
+      cls.error = cls.describe(exc)
+
+  @classmethod
+  def lint(cls, file_path: str) -> ControllerResult:
+    """Lint a text file with the worker's schema."""
+
+    if cls.schema is None:
+      return ControllerResult(file_path=file_path, output="", error=cls.error)
+    return cls.run(
+        file_path,
+        cls.schema,
+        cls.textfile_mode,
+        cls.profile,
+        cls.collect_statistics,
+        max_errors=cls.max_errors,
+    )
+
+  @staticmethod
+  def describe(exc: Exception) -> str:
+    """Return a one line description of an exception."""
+
+    return "{0}: {1}".format(exc.__class__.__name__, exc)
+
+  @staticmethod
+  def load_schema(schema_path: str) -> Schema:
+    """Load a schema, and create all its operations to validate it."""
+
+    schema = Schema(schema_path)
+    schema.load_rules()
+    schema.load_validators()
+    return schema
+
+  @classmethod
+  def run(
+      cls,
+      file_path: str,
+      schema: Schema,
+      textfile_mode: str,
+      profile: bool = False,
+      collect_statistics: bool = False,
+      *,
+      max_errors: int = 1,
+  ) -> ControllerResult:
+    """Lint a text file, capturing its output, any failure and any metrics."""
+
+    output = StringIO()
+    error: Optional[str] = None
+    profiler = Profiler() if profile else None
+    statistics = Statistics() if collect_statistics else None
+
+    with redirect_stdout(output):
+      try:
+        controller = Controller(
+            file_path,
+            schema,
+            textfile_mode,
+            profiler,
+            statistics,
+            max_errors=max_errors,
+        )
+        controller.start()
+      except Exception as exc:  # pylint: disable=broad-exception-caught
+        error = cls.describe(exc)
+
+    return ControllerResult(
+        file_path=file_path,
+        output=output.getvalue(),
+        error=error,
+        profiler=profiler,
+        statistics=statistics,
+    )
+
+
+class ControllerPool:
+  """Lints text files, using a pool of worker processes for multiple jobs.
+
+  The schema is always loaded in the calling process first, so an invalid
+  schema fails once before any text files are linted.  The schema's unused
+  saved results are then available to report once for all text files.
+  """
+
+  def __init__(
+      self,
+      schema_path: str,
+      textfile_mode: str,
+      jobs: int,
+      profile: bool = False,
+      collect_statistics: bool = False,
+      *,
+      max_errors: int = 1,
+  ) -> None:
+    self.schema_path = schema_path
+    self.textfile_mode = textfile_mode
+    self.jobs = jobs
+    self.profile = profile
+    self.collect_statistics = collect_statistics
+    self.max_errors = max_errors
+    self.unused_saves: Tuple[str, ...] = ()
+
+  def start(self, file_paths: List[str]) -> Iterator[ControllerResult]:
+    """Lint the text files, yielding each result in the order requested."""
+
+    schema = ControllerWorker.load_schema(self.schema_path)
+    self.unused_saves = schema.load_unused_saves()
+    processes = max(1, min(self.jobs, len(file_paths)))
+
+    if processes == 1:
+      for file_path in file_paths:
+        yield ControllerWorker.run(
+            file_path,
+            schema,
+            self.textfile_mode,
+            self.profile,
+            self.collect_statistics,
+            max_errors=self.max_errors,
+        )
+      return
+
+    with multiprocessing.Pool(
+        processes=processes,
+        initializer=ControllerWorker.initialize,
+        initargs=(
+            self.schema_path,
+            self.textfile_mode,
+            self.profile,
+            self.collect_statistics,
+            self.max_errors,
+        ),
+    ) as pool:
+      yield from pool.imap(
+          ControllerWorker.lint,
+          file_paths,
+          chunksize=max(
+              1,
+              len(file_paths) // (processes * POOL_CHUNKS_PER_JOB)
+          ),
+      )
@@ -0,0 +1,99 @@
+"""Profiler class."""
+
+import time
+from typing import TYPE_CHECKING, Dict, List, Tuple
+
+from text_lint.config import NEW_LINE
+from text_lint.utilities.translations import _, f
+
+if TYPE_CHECKING:  # pragma: no cover
+  from text_lint.controller import Controller
+  from text_lint.operations.bases.operation_base import OperationBase
+
+AliasProfileKey = Tuple[str, str, str]
+
+
+class Profiler:
+  """Records the calls to, and the time spent applying, schema operations.
+
+  Operations are keyed by their schema section, schema name and operation.
+  Lookups are keyed by the name of the validator requesting them.  Times are
+  inclusive, so a validator's time includes the lookups it performs.
+  """
+
+  section_lookup = "lookup"
+  section_rule = "rule"
+  section_validator = "validator"
+
+  msg_fmt_column_calls = _("calls")
+  msg_fmt_column_mean = _("mean (ms)")
+  msg_fmt_column_name = _("name")
+  msg_fmt_column_operation = _("operation")
+  msg_fmt_column_section = _("section")
+  msg_fmt_column_total = _("total (s)")
+  msg_fmt_row = "{0:<10} {1:<40} {2:<24} {3:>10} {4:>10} {5:>10}"
+
+  def __init__(self) -> None:
+    self.calls: Dict[AliasProfileKey, int] = {}
+    self.seconds: Dict[AliasProfileKey, float] = {}
+
+  def apply(
+      self,
+      section: str,
+      name: str,
+      operation: "OperationBase",
+      controller: "Controller",
+  ) -> None:
+    """Apply an operation, recording the time spent."""
+
+    start = time.perf_counter()
+    try:
+      operation.apply(controller)
+    finally:
+      self.record(
+          (section, name, operation.operation),
+          calls=1,
+          seconds=time.perf_counter() - start,
+      )
+
+  def record(self, key: AliasProfileKey, calls: int, seconds: float) -> None:
+    """Add calls and time to the recorded totals for an operation."""
+
+    self.calls[key] = self.calls.get(key, 0) + calls
+    self.seconds[key] = self.seconds.get(key, 0.0) + seconds
+
+  def merge(self, profiler: "Profiler") -> None:
+    """Add the totals recorded by another profiler to this profiler."""
+
+    for key, calls in profiler.calls.items():
+      self.record(key, calls=calls, seconds=profiler.seconds[key])
+
+  def sorted_keys(self) -> List[AliasProfileKey]:
+    """Return the recorded operations, with the most time spent first."""
+
+    return sorted(self.calls, key=lambda key: (-self.seconds[key], key))
+
+  def report(self) -> str:
+    """Return a table of the recorded operations."""
+
+    report = f(
+        self.msg_fmt_row,
+        self.msg_fmt_column_section,
+        self.msg_fmt_column_name,
+        self.msg_fmt_column_operation,
+        self.msg_fmt_column_calls,
+        self.msg_fmt_column_total,
+        self.msg_fmt_column_mean,
+        nl=1,
+    )
+    for key in self.sorted_keys():
+      section, name, operation = key
+      report += self.msg_fmt_row.format(
+          section,
+          name,
+          operation,
+          self.calls[key],
+          "{0:.4f}".format(self.seconds[key]),
+          "{0:.4f}".format(self.seconds[key] / self.calls[key] * 1000),
+      ) + NEW_LINE
+    return report
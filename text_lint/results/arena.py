@@ -0,0 +1,114 @@
+"""ResultArena class."""
+
+from array import array
+from typing import Dict, List
+
+NO_NODE = -1
+
+
+class ResultArena:
+  """Compact storage for the nodes of ResultTree instances.
+
+  Each node is an offset into parallel arrays of string ids, parents, first
+  and last children and next siblings, with each distinct value stored once
+  in a string table.  Sibling chains are only modified while trees are being
+  created, so nodes may be copied into a new chain while sharing their own
+  children with the original node.
+  """
+
+  __slots__ = (
+      "first_children",
+      "last_children",
+      "next_siblings",
+      "parents",
+      "string_ids",
+      "strings",
+      "values",
+  )
+
+  def __init__(self) -> None:
+    self.strings: List[str] = []
+    self.string_ids: Dict[str, int] = {}
+    self.values = array("I")
+    self.parents = array("i")
+    self.first_children = array("i")
+    self.last_children = array("i")
+    self.next_siblings = array("i")
+
+  def __len__(self) -> int:
+    return len(self.values)
+
+  def create(self, value: str) -> int:
+    """Create a node without a parent, and return its offset."""
+
+    string_id = self.string_ids.get(value)
+    if string_id is None:
+      string_id = len(self.strings)
+      self.string_ids[value] = string_id
+      self.strings.append(value)
+    return self._create(string_id, NO_NODE, NO_NODE)
+
+  def copy(self, node: int) -> int:
+    """Create a node without a parent, sharing the children of another node."""
+
+    return self._create(
+        self.values[node],
+        self.first_children[node],
+        self.last_children[node],
+    )
+
+  def append(self, parent: int, child: int) -> None:
+    """Add a node without a parent as the last child of another node."""
+
+    self.parents[child] = parent
+    last_child = self.last_children[parent]
+    if last_child == NO_NODE:
+      self.first_children[parent] = child
+    else:
+      self.next_siblings[last_child] = child
+    self.last_children[parent] = child
+
+  def children(self, parent: int) -> List[int]:
+    """Return the offsets of the children of a node."""
+
+    children: List[int] = []
+    next_siblings = self.next_siblings
+    child = self.first_children[parent]
+    while child != NO_NODE:
+      children.append(child)
+      child = next_siblings[child]
+    return children
+
+  def clear(self, parent: int) -> None:
+    """Remove all children from a node."""
+
+    self.first_children[parent] = NO_NODE
+    self.last_children[parent] = NO_NODE
+
+  def move(self, source: int, parent: int) -> None:
+    """Move all children of one node to the end of another node's children."""
+
+    for child in self.children(source):
+      self.parents[child] = parent
+    first_child = self.first_children[source]
+    if first_child != NO_NODE:
+      last_child = self.last_children[parent]
+      if last_child == NO_NODE:
+        self.first_children[parent] = first_child
+      else:
+        self.next_siblings[last_child] = first_child
+      self.last_children[parent] = self.last_children[source]
+      self.clear(source)
+
+  def value(self, node: int) -> str:
+    """Return the value of a node."""
+
+    return self.strings[self.values[node]]
+
+  def _create(self, string_id: int, first_child: int, last_child: int) -> int:
+    self.values.append(string_id)
+    self.parents.append(NO_NODE)
+    self.first_children.append(first_child)
+    self.last_children.append(last_child)
+    self.next_siblings.append(NO_NODE)
+    return len(self.values) - 1
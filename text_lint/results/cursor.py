@@ -1,9 +1,8 @@
 """ResultTreeCursor class."""
 
-from typing import TYPE_CHECKING, List, Union
+from typing import TYPE_CHECKING, List, Set, Union
 
 from text_lint.results.tree import ResultTree
-from text_lint.utilities.collections import unique_list
 
 if TYPE_CHECKING:  # pragma: no cover
   from .tree import ResultTree
@@ -17,24 +16,6 @@ class ResultTreeCursor:
   def __init__(self) -> None:
     self._location: "AliasResultForestCursor" = []
 
-  def clone(self) -> "ResultTreeCursor":
-    """Create a nested copy of all trees at the specified location."""
-    cloned_result_tree = ResultTreeCursor()
-    cloned_result_tree.location = self._cloned_location(self.location, [])
-    return cloned_result_tree
-
-  def _cloned_location(
-      self,
-      location: "AliasResultForestCursor",
-      cloned_location: "AliasResultForestCursor",
-  ) -> "AliasResultForestCursor":
-    for selected_location in location:
-      if isinstance(selected_location, ResultTree):
-        cloned_location.append(selected_location.clone())
-      if isinstance(selected_location, list):
-        cloned_location.append(self._cloned_location(selected_location, []))
-    return cloned_location
-
   @property
   def location(self) -> "AliasResultForestCursor":
     """Return the current location within the ResultForest instance."""
@@ -77,26 +58,20 @@ class ResultTreeCursor:
 
   def unique(self) -> None:
     """Select the first unique value for each tree at the current location."""
-    unique_location: "AliasResultForestCursor" = []
-    for selected_location in self._location:
-      self._unique_location(selected_location, unique_location)
-    self._location = unique_location
+    self._location = self._unique_location(self._location)
 
   def _unique_location(
       self,
-      location: "Union[ResultTree, AliasResultForestCursor]",
-      unique_location: "AliasResultForestCursor",
+      location: "AliasResultForestCursor",
   ) -> "AliasResultForestCursor":
-    if isinstance(location, ResultTree):
-      location.children = unique_list(location.children)
-      if location not in unique_location:
-        unique_location.append(location)
-    else:
-      nested_unique_location: "AliasResultForestCursor" = []
-      for selected_nested_location in location:
-        self._unique_location(
-            selected_nested_location,
-            nested_unique_location,
-        )
-      unique_location.append(nested_unique_location)
+    unique_location: "AliasResultForestCursor" = []
+    selected_trees: Set["ResultTree"] = set()
+    for selected_location in location:
+      if isinstance(selected_location, ResultTree):
+        unique_tree = selected_location.unique()
+        if unique_tree not in selected_trees:
+          selected_trees.add(unique_tree)
+          unique_location.append(unique_tree)
+      else:
+        unique_location.append(self._unique_location(selected_location))
     return unique_location
@@ -1,19 +1,21 @@
 """ResultForest class."""
 
-from typing import TYPE_CHECKING, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
 
 from text_lint.config import LOOKUP_STATIC_VALUE_MARKER
 from text_lint.exceptions.results import ResultDoesNotExist
-from text_lint.sequencers.lookups import LookupsSequencer
 from text_lint.utilities.translations import _
+from .arena import ResultArena
 from .cursor import ResultTreeCursor
+from .tree import ResultTree
 
 if TYPE_CHECKING:  # pragma: no cover
   from text_lint.controller import Controller
   from text_lint.operations.validators.args.result_set import ResultSet
   from text_lint.results.tree import AliasRecursiveTreeResult
-  from .tree import ResultTree
 
+AliasCaptures = List[Tuple[str, ...]]
+AliasSplits = Dict[int, Optional[str]]
 AliasNestedStrings = Union[str, List[str], List[List[str]]]
 AliasLookupResult = Union[
     "AliasNestedStrings",
@@ -21,26 +23,65 @@ AliasLookupResult = Union[
 ]
 
 
-class ResultForest:
-  """A composite of TreeResult instances."""
+class ResultForest:  # pylint: disable=too-many-instance-attributes
+  """A composite of TreeResult instances, stored in a shared ResultArena.
+
+  Captured values are kept until the first lookup of their saved result needs
+  them as a tree.  Lookup results are cached by result set name until the
+  next tree is added, and should be treated as read-only by their consumers.
+  """
 
   msg_fmt_does_not_exist_hint = _(
       'results are created when applying the "rules" section of the schema'
   )
 
   def __init__(self) -> None:
+    self.arena = ResultArena()
     self.trees: Dict[str, "ResultTree"] = {}
+    self.captures: Dict[str, List[Tuple["AliasSplits", "AliasCaptures"]]] = {}
     self.cursor = ResultTreeCursor()
+    self.cursor_locations = 0
     self.lookup_results: AliasLookupResult = []
+    self.lookup_cache: Dict[str, "AliasLookupResult"] = {}
+    self.lookup_cache_hits = 0
+    self.lookup_cache_misses = 0
 
   def add(self, tree: Optional["ResultTree"]) -> None:
     """Add a TreeResult instance to the ForestResults."""
 
     if tree is not None:
-      if tree.value in self.trees:
-        self.trees[tree.value].children += tree.children
-      else:
-        self.trees[tree.value] = tree
+      self.lookup_cache.clear()
+      self._add_tree(tree)
+
+  def add_captures(
+      self,
+      name: str,
+      captures: "AliasCaptures",
+      splits: "AliasSplits",
+  ) -> None:
+    """Add regex capture groups, to be saved as a TreeResult instance."""
+
+    self.lookup_cache.clear()
+    saved_captures = self.captures.setdefault(name, [])
+    if saved_captures and saved_captures[-1][0] == splits:
+      saved_captures[-1][1].extend(captures)
+    else:
+      saved_captures.append((splits, list(captures)))
+
+  def _add_tree(self, tree: "ResultTree") -> None:
+    self._create_tree(tree.value)
+    if tree.value in self.trees:
+      self.trees[tree.value].merge(tree)
+    else:
+      self.trees[tree.value] = tree
+
+  def _create_tree(self, name: str) -> None:
+    if name in self.captures:
+      tree = ResultTree.create(value=name, arena=self.arena)
+      for splits, captures in self.captures.pop(name):
+        for capture_groups in captures:
+          tree.add_matches(capture_groups, splits)
+      self._add_tree(tree)
 
   def lookup(
       self,
@@ -54,19 +95,35 @@ class ResultForest:
       self.lookup_results = requested_result.source[1:]
       return self.lookup_results
 
+    self._create_tree(requested_result.source)
+
     if requested_result.source not in self.trees:
       raise ResultDoesNotExist(
           result_set=requested_result,
           requesting_operation_name=requesting_operation_name,
       )
 
+    if requested_result.name in self.lookup_cache:
+      self.lookup_cache_hits += 1
+      self.lookup_results = self.lookup_cache[requested_result.name]
+      return self.lookup_results
+
+    self.lookup_cache_misses += 1
     self.cursor.location = [self.trees[requested_result.source]]
-    self.cursor = self.cursor.clone()
     self.lookup_results = [[requested_result.source]]
 
-    lookups = LookupsSequencer(requested_result, requesting_operation_name)
-
-    for operation in lookups:
-      operation.apply(controller)
-
+    if controller.profiler is None:
+      for operation in requested_result.pipeline:
+        operation.apply(controller)
+    else:
+      for operation in requested_result.pipeline:
+        controller.profiler.apply(
+            controller.profiler.section_lookup,
+            requesting_operation_name,
+            operation,
+            controller,
+        )
+
+    self.cursor_locations += len(self.cursor.location)
+    self.lookup_cache[requested_result.name] = self.lookup_results
     return self.lookup_results
@@ -5,12 +5,14 @@ from typing import List
 from unittest import mock
 
 import pytest
-from .. import cursor, forest, tree
+from .. import arena, cursor, forest, tree
 
 
 @pytest.fixture
 def mocked_controller() -> mock.Mock:
-  return mock.Mock()
+  instance = mock.Mock()
+  instance.profiler = None
+  return instance
 
 
 @pytest.fixture
@@ -18,7 +20,6 @@ def mocked_existing_tree(
     result_forest_instance: forest.ResultForest,
 ) -> mock.Mock:
   instance = mock.Mock()
-  instance.children = [mock.Mock()]
   instance.value = "maple"
   result_forest_instance.trees["maple"] = instance
   return instance
@@ -32,19 +33,14 @@ def mocked_lookup_operations() -> List[mock.Mock]:
   return instances
 
 
-@pytest.fixture
-def mocked_lookup_sequence() -> mock.Mock:
-  return mock.Mock()
-
-
 @pytest.fixture
 def mocked_tree() -> mock.Mock:
   return mock.Mock()
 
 
 @pytest.fixture
-def mocked_woods() -> List[mock.Mock]:
-  return [mock.Mock(), mock.Mock(), mock.Mock()]
+def result_arena_instance() -> arena.ResultArena:
+  return arena.ResultArena()
 
 
 @pytest.fixture
@@ -53,17 +49,7 @@ def result_tree_cursor_instance() -> cursor.ResultTreeCursor:
 
 
 @pytest.fixture
-def result_forest_instance(
-    mocked_lookup_operations: mock.Mock,
-    mocked_lookup_sequence: mock.Mock,
-    monkeypatch: pytest.MonkeyPatch,
-) -> forest.ResultForest:
-  mocked_lookup_sequence.return_value = mocked_lookup_operations
-  monkeypatch.setattr(
-      forest,
-      "LookupsSequencer",
-      mocked_lookup_sequence,
-  )
+def result_forest_instance() -> forest.ResultForest:
   return forest.ResultForest()
 
 
@@ -0,0 +1,144 @@
+"""Test the ResultArena class."""
+
+from array import array
+
+from ..arena import NO_NODE, ResultArena
+
+
+class TestResultArena:
+  """Test the ResultArena class."""
+
+  def test_initialize__attributes(
+      self,
+      result_arena_instance: ResultArena,
+  ) -> None:
+    assert result_arena_instance.strings == []
+    assert result_arena_instance.string_ids == {}
+    for nodes in (
+        result_arena_instance.values,
+        result_arena_instance.parents,
+        result_arena_instance.first_children,
+        result_arena_instance.last_children,
+        result_arena_instance.next_siblings,
+    ):
+      assert isinstance(nodes, array)
+      assert len(nodes) == 0
+    assert len(result_arena_instance) == 0
+
+  def test_initialize__slots(
+      self,
+      result_arena_instance: ResultArena,
+  ) -> None:
+    assert not hasattr(result_arena_instance, "__dict__")
+
+  def test_create__new_value__creates_node(
+      self,
+      result_arena_instance: ResultArena,
+  ) -> None:
+    node = result_arena_instance.create("A")
+
+    assert node == 0
+    assert len(result_arena_instance) == 1
+    assert result_arena_instance.value(node) == "A"
+    assert result_arena_instance.parents[node] == NO_NODE
+    assert result_arena_instance.children(node) == []
+
+  def test_create__repeated_value__stores_value_once(
+      self,
+      result_arena_instance: ResultArena,
+  ) -> None:
+    nodes = [result_arena_instance.create(value) for value in "ABA"]
+
+    assert nodes == [0, 1, 2]
+    assert result_arena_instance.strings == ["A", "B"]
+    assert list(result_arena_instance.values) == [0, 1, 0]
+    assert [result_arena_instance.value(node) for node in nodes] == [
+        "A",
+        "B",
+        "A",
+    ]
+
+  def test_append__multiple_children__links_children_in_order(
+      self,
+      result_arena_instance: ResultArena,
+  ) -> None:
+    parent = result_arena_instance.create("A")
+    children = [result_arena_instance.create(value) for value in "BCD"]
+
+    for child in children:
+      result_arena_instance.append(parent, child)
+
+    assert result_arena_instance.children(parent) == children
+    for child in children:
+      assert result_arena_instance.parents[child] == parent
+
+  def test_copy__linked_node__shares_children(
+      self,
+      result_arena_instance: ResultArena,
+  ) -> None:
+    parent = result_arena_instance.create("A")
+    child = result_arena_instance.create("B")
+    result_arena_instance.append(parent, child)
+
+    copied = result_arena_instance.copy(parent)
+
+    assert copied != parent
+    assert result_arena_instance.value(copied) == "A"
+    assert result_arena_instance.parents[copied] == NO_NODE
+    assert result_arena_instance.children(copied) == [child]
+
+  def test_clear__with_children__removes_children(
+      self,
+      result_arena_instance: ResultArena,
+  ) -> None:
+    parent = result_arena_instance.create("A")
+    result_arena_instance.append(parent, result_arena_instance.create("B"))
+
+    result_arena_instance.clear(parent)
+
+    assert result_arena_instance.children(parent) == []
+
+  def test_move__with_children__moves_children_to_end(
+      self,
+      result_arena_instance: ResultArena,
+  ) -> None:
+    parent = result_arena_instance.create("A")
+    source = result_arena_instance.create("A")
+    children = [result_arena_instance.create(value) for value in "BCD"]
+    result_arena_instance.append(parent, children[0])
+    result_arena_instance.append(source, children[1])
+    result_arena_instance.append(source, children[2])
+
+    result_arena_instance.move(source, parent)
+
+    assert result_arena_instance.children(parent) == children
+    assert result_arena_instance.children(source) == []
+    for child in children:
+      assert result_arena_instance.parents[child] == parent
+
+  def test_move__no_parent_children__moves_children(
+      self,
+      result_arena_instance: ResultArena,
+  ) -> None:
+    parent = result_arena_instance.create("A")
+    source = result_arena_instance.create("A")
+    child = result_arena_instance.create("B")
+    result_arena_instance.append(source, child)
+
+    result_arena_instance.move(source, parent)
+
+    assert result_arena_instance.children(parent) == [child]
+    assert result_arena_instance.children(source) == []
+
+  def test_move__no_source_children__does_not_modify_parent(
+      self,
+      result_arena_instance: ResultArena,
+  ) -> None:
+    parent = result_arena_instance.create("A")
+    source = result_arena_instance.create("A")
+    child = result_arena_instance.create("B")
+    result_arena_instance.append(parent, child)
+
+    result_arena_instance.move(source, parent)
+
+    assert result_arena_instance.children(parent) == [child]
@@ -44,80 +44,6 @@ class TestResultTreeCursor:
   ) -> None:
     assert result_tree_cursor_instance.location == []
 
-  def test_clone__single_tree__single_group__creates_independent_copy(
-      self,
-      result_tree_cursor_instance: ResultTreeCursor,
-  ) -> None:
-    mocked_tree = ResultTree(value="A")
-    mocked_tree.children = [ResultTree(value="B"), ResultTree(value="B")]
-    result_tree_cursor_instance.location.append(mocked_tree)
-
-    cloned_cursor = result_tree_cursor_instance.clone()
-
-    self.assert_cursor_length(cloned_cursor, length=1)
-    cloned_tree, cloned_children = self.select_asserted_result_tree(
-        cloned_cursor.location[0],
-        value="A",
-        child_values=["B", "B"],
-    )
-    assert cloned_tree is not mocked_tree
-    assert cloned_children[0] is not mocked_tree.children[0]
-    assert cloned_children[0] is not mocked_tree.children[1]
-    assert cloned_children[1] is not mocked_tree.children[0]
-    assert cloned_children[1] is not mocked_tree.children[1]
-
-  def test_clone__two_trees__two_groups__creates_independent_copy(
-      self,
-      result_tree_cursor_instance: ResultTreeCursor,
-  ) -> None:
-    mocked_tree1 = ResultTree(value="A")
-    mocked_tree1.children = [ResultTree(value="B"), ResultTree(value="B")]
-    mocked_tree2 = ResultTree(value="C")
-    mocked_tree2.children = [ResultTree(value="D"), ResultTree(value="D")]
-    result_tree_cursor_instance.location.append([mocked_tree1])
-    result_tree_cursor_instance.location.append([mocked_tree2])
-
-    cloned_cursor = result_tree_cursor_instance.clone()
-
-    self.assert_cursor_length(cloned_cursor, length=2)
-    selected_list1 = self.select_asserted_list_of_result_trees(
-        cloned_cursor.location[0],
-        length=1,
-    )
-
-    cloned_tree1, cloned_children1 = self.select_asserted_result_tree(
-        selected_list1[0],
-        value="A",
-        child_values=["B", "B"],
-    )
-    assert cloned_tree1 is not mocked_tree1
-    assert (
-        cloned_children1[0] is not mocked_tree1.children[0]
-        or mocked_tree1.children[1]
-    )
-    assert (
-        cloned_children1[1] is not mocked_tree1.children[0]
-        or mocked_tree1.children[1]
-    )
-
-    selected_list2 = self.select_asserted_list_of_result_trees(
-        cloned_cursor.location[1], length=1
-    )
-    cloned_tree2, cloned_children2 = self.select_asserted_result_tree(
-        selected_list2[0],
-        value="C",
-        child_values=["D", "D"],
-    )
-    assert cloned_tree2 is not mocked_tree2
-    assert (
-        cloned_children2[0] is not mocked_tree2.children[0]
-        or mocked_tree2.children[1]
-    )
-    assert (
-        cloned_children2[1] is not mocked_tree2.children[0]
-        or mocked_tree2.children[1]
-    )
-
   def test_flatten__single_tree__single_group__merges_location(
       self,
       result_tree_cursor_instance: ResultTreeCursor,
@@ -307,3 +233,53 @@ class TestResultTreeCursor:
         value="C",
         child_values=["D"],
     )
+
+  def test_unique__single_tree__duplicate_children__does_not_modify_tree(
+      self,
+      result_tree_cursor_instance: ResultTreeCursor,
+  ) -> None:
+    mocked_tree = ResultTree(value="A")
+    mocked_tree.children = [ResultTree(value="B"), ResultTree(value="B")]
+    mocked_nodes = [child.node for child in mocked_tree.children]
+    result_tree_cursor_instance.location.append(mocked_tree)
+
+    result_tree_cursor_instance.unique()
+
+    assert result_tree_cursor_instance.location[0] is not mocked_tree
+    assert [child.node for child in mocked_tree.children] == mocked_nodes
+
+  def test_unique__single_tree__unique_children__selects_same_tree(
+      self,
+      result_tree_cursor_instance: ResultTreeCursor,
+  ) -> None:
+    mocked_tree = ResultTree(value="A")
+    mocked_tree.children = [ResultTree(value="B"), ResultTree(value="C")]
+    result_tree_cursor_instance.location.append(mocked_tree)
+
+    result_tree_cursor_instance.unique()
+
+    assert result_tree_cursor_instance.location[0] is mocked_tree
+
+  def test_unique__duplicate_trees__mixed_location__selects_location(
+      self,
+      result_tree_cursor_instance: ResultTreeCursor,
+  ) -> None:
+    mocked_tree1 = ResultTree(value="A")
+    mocked_tree2 = ResultTree(value="A")
+    mocked_tree3 = ResultTree(value="B")
+    result_tree_cursor_instance.location.extend(
+        [
+            mocked_tree1,
+            [mocked_tree2, mocked_tree3, mocked_tree3],
+            mocked_tree2,
+        ]
+    )
+
+    result_tree_cursor_instance.unique()
+
+    self.assert_cursor_length(result_tree_cursor_instance, length=2)
+    assert result_tree_cursor_instance.location[0] is mocked_tree1
+    assert result_tree_cursor_instance.location[1] == [
+        mocked_tree2,
+        mocked_tree3,
+    ]
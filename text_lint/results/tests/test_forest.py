@@ -1,15 +1,20 @@
 """Test the ResultForest class."""
 
-from typing import List
+from typing import List, Tuple
 from unittest import mock
 
 import pytest
-from text_lint.__helpers__.results import assert_is_result_does_not_exist
+from text_lint.__helpers__.results import (
+    assert_is_result_does_not_exist,
+    assert_result_tree,
+)
 from text_lint.__helpers__.translations import assert_is_translated
 from text_lint.config import LOOKUP_STATIC_VALUE_MARKER
 from text_lint.exceptions.results import ResultDoesNotExist
+from ..arena import ResultArena
 from ..cursor import ResultTreeCursor
 from ..forest import ResultForest
+from ..tree import ResultTree
 
 
 class TestResultForest:
@@ -19,11 +24,18 @@ class TestResultForest:
       self,
       result_forest_instance: ResultForest,
   ) -> None:
+    assert isinstance(result_forest_instance.arena, ResultArena)
+    assert len(result_forest_instance.arena) == 0
     assert isinstance(result_forest_instance.trees, dict)
+    assert result_forest_instance.captures == {}
     assert len(result_forest_instance.trees) == 0
     assert isinstance(result_forest_instance.lookup_results, list)
     assert len(result_forest_instance.lookup_results) == 0
     assert isinstance(result_forest_instance.cursor, ResultTreeCursor)
+    assert result_forest_instance.cursor_locations == 0
+    assert result_forest_instance.lookup_cache == {}
+    assert result_forest_instance.lookup_cache_hits == 0
+    assert result_forest_instance.lookup_cache_misses == 0
 
   def test_initialize__translations(
       self,
@@ -57,31 +69,150 @@ class TestResultForest:
       result_forest_instance: ResultForest,
       mocked_existing_tree: mock.Mock,
       mocked_tree: mock.Mock,
-      mocked_woods: mock.Mock,
   ) -> None:
     mocked_tree.value = mocked_existing_tree.value
-    mocked_tree.children = mocked_woods
-    existing_child_tree = mocked_existing_tree.children[0]
 
     result_forest_instance.add(mocked_tree)
 
     assert len(result_forest_instance.trees) == 1
     assert result_forest_instance.\
         trees[mocked_tree.value] == mocked_existing_tree
-    assert result_forest_instance.\
-        trees[mocked_tree.value].children == (
-            [existing_child_tree] + mocked_woods
-        )
+    mocked_existing_tree.merge.assert_called_once_with(mocked_tree)
+
+  def test_add__tree__clears_lookup_cache(
+      self,
+      result_forest_instance: ResultForest,
+      mocked_tree: mock.Mock,
+  ) -> None:
+    result_forest_instance.lookup_cache["mocked_name"] = ["cached"]
+
+    result_forest_instance.add(mocked_tree)
+
+    assert result_forest_instance.lookup_cache == {}
+
+  def test_add__no_tree__keeps_lookup_cache(
+      self,
+      result_forest_instance: ResultForest,
+  ) -> None:
+    result_forest_instance.lookup_cache["mocked_name"] = ["cached"]
+
+    result_forest_instance.add(None)
+
+    assert result_forest_instance.lookup_cache == {"mocked_name": ["cached"]}
+
+  def test_add__existing_captures__creates_tree_before_merging(
+      self,
+      result_forest_instance: ResultForest,
+  ) -> None:
+    result_forest_instance.add_captures("maple", [("one",)], {})
+    mocked_tree = ResultTree.create("maple", arena=result_forest_instance.arena)
+    mocked_tree.add_matches(("two",), {})
+
+    result_forest_instance.add(mocked_tree)
+
+    assert result_forest_instance.captures == {}
+    assert_result_tree(
+        result_forest_instance.trees["maple"],
+        "maple",
+        ["one", "two"],
+    )
+
+  def test_add_captures__no_existing__stores_captures(
+      self,
+      result_forest_instance: ResultForest,
+  ) -> None:
+    mocked_captures: List[Tuple[str, ...]] = [("one", "two")]
+
+    result_forest_instance.add_captures("maple", mocked_captures, {1: None})
+
+    assert result_forest_instance.captures == {
+        "maple": [({
+            1: None
+        }, mocked_captures)]
+    }
+    assert result_forest_instance.captures["maple"][0][1] is not (
+        mocked_captures
+    )
+    assert len(result_forest_instance.arena) == 0
+    assert len(result_forest_instance.trees) == 0
+
+  def test_add_captures__existing__same_splits__extends_captures(
+      self,
+      result_forest_instance: ResultForest,
+  ) -> None:
+    result_forest_instance.add_captures("maple", [("one",)], {1: None})
 
-  def test_lookup__uses_cloned_cursor(
+    result_forest_instance.add_captures("maple", [("two",)], {1: None})
+
+    assert result_forest_instance.captures == {
+        "maple": [({
+            1: None
+        }, [("one",), ("two",)])]
+    }
+
+  def test_add_captures__existing__different_splits__stores_captures(
+      self,
+      result_forest_instance: ResultForest,
+  ) -> None:
+    result_forest_instance.add_captures("maple", [("one",)], {1: None})
+
+    result_forest_instance.add_captures("maple", [("two",)], {})
+
+    assert result_forest_instance.captures == {
+        "maple": [({
+            1: None
+        }, [("one",)]), ({}, [("two",)])]
+    }
+
+  def test_add_captures__clears_lookup_cache(
+      self,
+      result_forest_instance: ResultForest,
+  ) -> None:
+    result_forest_instance.lookup_cache["mocked_name"] = ["cached"]
+
+    result_forest_instance.add_captures("maple", [], {})
+
+    assert result_forest_instance.lookup_cache == {}
+
+  def test_lookup__existing_captures__creates_saved_tree(
+      self,
+      result_forest_instance: ResultForest,
+      mocked_controller: mock.Mock,
+  ) -> None:
+    result_forest_instance.add_captures(
+        "maple",
+        [("one two", "three"), ("four five", "six")],
+        {1: " "},
+    )
+    result_forest_instance.add_captures("maple", [("seven",)], {})
+    mocked_requested_result = mock.Mock(pipeline=[])
+    mocked_requested_result.source = "maple"
+
+    result_forest_instance.lookup(
+        mocked_controller,
+        mocked_requested_result,
+        "mocked_requesting_operation",
+    )
+
+    assert result_forest_instance.captures == {}
+    tree = result_forest_instance.trees["maple"]
+    assert tree.arena is result_forest_instance.arena
+    assert_result_tree(
+        tree,
+        "maple",
+        ["one", "two", "three", "four", "five", "six", "seven"],
+    )
+
+  def test_lookup__positions_cursor_on_saved_tree(
       self,
       result_forest_instance: ResultForest,
       mocked_controller: mock.Mock,
       mocked_existing_tree: mock.Mock,
+      mocked_lookup_operations: List[mock.Mock],
   ) -> None:
     mocked_cursor = mock.Mock()
     result_forest_instance.cursor = mocked_cursor
-    mocked_requested_result = mock.Mock()
+    mocked_requested_result = mock.Mock(pipeline=mocked_lookup_operations)
     mocked_requested_result.source = mocked_existing_tree.value
     mocked_requesting_operation = "mocked_requesting_operation"
 
@@ -91,17 +222,18 @@ class TestResultForest:
         mocked_requesting_operation,
     )
 
-    mocked_cursor.clone.assert_called_once_with()
-    assert result_forest_instance.cursor == mocked_cursor.clone.return_value
+    mocked_cursor.clone.assert_not_called()
+    assert result_forest_instance.cursor == mocked_cursor
+    assert mocked_cursor.location == [mocked_existing_tree]
 
-  def test_lookup__creates_lookup_sequence(
+  def test_lookup__valid_operations__calls_all_lookup_operations(
       self,
       result_forest_instance: ResultForest,
       mocked_controller: mock.Mock,
       mocked_existing_tree: mock.Mock,
-      mocked_lookup_sequence: mock.Mock,
+      mocked_lookup_operations: List[mock.Mock],
   ) -> None:
-    mocked_requested_result = mock.Mock()
+    mocked_requested_result = mock.Mock(pipeline=mocked_lookup_operations)
     mocked_requested_result.source = mocked_existing_tree.value
     mocked_requesting_operation = "mocked_requesting_operation"
 
@@ -111,19 +243,18 @@ class TestResultForest:
         mocked_requesting_operation,
     )
 
-    mocked_lookup_sequence.assert_called_once_with(
-        mocked_requested_result,
-        mocked_requesting_operation,
-    )
+    for mock_operation in mocked_lookup_operations:
+      mock_operation.apply.assert_called_once_with(mocked_controller)
 
-  def test_lookup__valid_operations__calls_all_lookup_operations(
+  def test_lookup__profiler__profiles_all_lookup_operations(
       self,
       result_forest_instance: ResultForest,
       mocked_controller: mock.Mock,
       mocked_existing_tree: mock.Mock,
       mocked_lookup_operations: List[mock.Mock],
   ) -> None:
-    mocked_requested_result = mock.Mock()
+    mocked_controller.profiler = mock.Mock()
+    mocked_requested_result = mock.Mock(pipeline=mocked_lookup_operations)
     mocked_requested_result.source = mocked_existing_tree.value
     mocked_requesting_operation = "mocked_requesting_operation"
 
@@ -133,16 +264,25 @@ class TestResultForest:
         mocked_requesting_operation,
     )
 
+    assert mocked_controller.profiler.apply.mock_calls == [
+        mock.call(
+            mocked_controller.profiler.section_lookup,
+            mocked_requesting_operation,
+            mock_operation,
+            mocked_controller,
+        ) for mock_operation in mocked_lookup_operations
+    ]
     for mock_operation in mocked_lookup_operations:
-      mock_operation.apply.assert_called_once_with(mocked_controller)
+      mock_operation.apply.assert_not_called()
 
   def test_lookup__valid_source__returns_correct_results(
       self,
       result_forest_instance: ResultForest,
       mocked_controller: mock.Mock,
       mocked_existing_tree: mock.Mock,
+      mocked_lookup_operations: List[mock.Mock],
   ) -> None:
-    mocked_requested_result = mock.Mock()
+    mocked_requested_result = mock.Mock(pipeline=mocked_lookup_operations)
     mocked_requested_result.source = mocked_existing_tree.value
     mocked_requesting_operation = "mocked_requesting_operation"
 
@@ -154,12 +294,117 @@ class TestResultForest:
 
     assert lookup_results == [[mocked_requested_result.source]]
 
+  def test_lookup__valid_source__caches_results(
+      self,
+      result_forest_instance: ResultForest,
+      mocked_controller: mock.Mock,
+      mocked_existing_tree: mock.Mock,
+      mocked_lookup_operations: List[mock.Mock],
+  ) -> None:
+    mocked_requested_result = mock.Mock(pipeline=mocked_lookup_operations)
+    mocked_requested_result.source = mocked_existing_tree.value
+    mocked_requesting_operation = "mocked_requesting_operation"
+
+    lookup_results = result_forest_instance.lookup(
+        mocked_controller,
+        mocked_requested_result,
+        mocked_requesting_operation,
+    )
+
+    assert result_forest_instance.lookup_cache == {
+        mocked_requested_result.name: lookup_results
+    }
+    assert result_forest_instance.lookup_cache_hits == 0
+    assert result_forest_instance.lookup_cache_misses == 1
+
+  def test_lookup__valid_source__counts_cursor_locations(
+      self,
+      result_forest_instance: ResultForest,
+      mocked_controller: mock.Mock,
+      mocked_existing_tree: mock.Mock,
+  ) -> None:
+    mocked_lookup_operation = mock.Mock()
+    mocked_lookup_operation.apply.side_effect = lambda _: setattr(
+        result_forest_instance.cursor,
+        "location",
+        [mocked_existing_tree, mocked_existing_tree],
+    )
+    mocked_requested_result = mock.Mock(pipeline=[mocked_lookup_operation])
+    mocked_requested_result.source = mocked_existing_tree.value
+
+    for _ in range(2):
+      result_forest_instance.lookup_cache.clear()
+      result_forest_instance.lookup(
+          mocked_controller,
+          mocked_requested_result,
+          "mocked_requesting_operation",
+      )
+
+    assert result_forest_instance.cursor_locations == 4
+
+  def test_lookup__repeated_name__returns_cached_results(
+      self,
+      result_forest_instance: ResultForest,
+      mocked_controller: mock.Mock,
+      mocked_existing_tree: mock.Mock,
+      mocked_lookup_operations: List[mock.Mock],
+  ) -> None:
+    mocked_requested_result = mock.Mock(pipeline=mocked_lookup_operations)
+    mocked_requested_result.source = mocked_existing_tree.value
+    mocked_requesting_operation = "mocked_requesting_operation"
+
+    lookup_results = [
+        result_forest_instance.lookup(
+            mocked_controller,
+            mocked_requested_result,
+            mocked_requesting_operation,
+        ) for _ in range(0, 3)
+    ]
+
+    for mock_operation in mocked_lookup_operations:
+      mock_operation.apply.assert_called_once_with(mocked_controller)
+    assert lookup_results[1] is lookup_results[0]
+    assert lookup_results[2] is lookup_results[0]
+    assert result_forest_instance.lookup_results is lookup_results[0]
+    assert result_forest_instance.lookup_cache_hits == 2
+    assert result_forest_instance.lookup_cache_misses == 1
+
+  def test_lookup__repeated_name__after_add__repeats_lookup(
+      self,
+      result_forest_instance: ResultForest,
+      mocked_controller: mock.Mock,
+      mocked_existing_tree: mock.Mock,
+      mocked_tree: mock.Mock,
+      mocked_lookup_operations: List[mock.Mock],
+  ) -> None:
+    mocked_requested_result = mock.Mock(pipeline=mocked_lookup_operations)
+    mocked_requested_result.source = mocked_existing_tree.value
+    mocked_requesting_operation = "mocked_requesting_operation"
+
+    result_forest_instance.lookup(
+        mocked_controller,
+        mocked_requested_result,
+        mocked_requesting_operation,
+    )
+    result_forest_instance.add(mocked_tree)
+    result_forest_instance.lookup(
+        mocked_controller,
+        mocked_requested_result,
+        mocked_requesting_operation,
+    )
+
+    for mock_operation in mocked_lookup_operations:
+      assert mock_operation.apply.call_count == 2
+    assert result_forest_instance.lookup_cache_hits == 0
+    assert result_forest_instance.lookup_cache_misses == 2
+
   def test_lookup__invalid_source__raises_does_not_exist(
       self,
       result_forest_instance: ResultForest,
       mocked_controller: mock.Mock,
+      mocked_lookup_operations: List[mock.Mock],
   ) -> None:
-    mocked_requested_result = mock.Mock()
+    mocked_requested_result = mock.Mock(pipeline=mocked_lookup_operations)
     mocked_requested_result.source = "non_existing_source"
     mocked_requesting_operation = "mocked_requesting_operation"
 
@@ -181,8 +426,9 @@ class TestResultForest:
       self,
       result_forest_instance: ResultForest,
       mocked_controller: mock.Mock,
+      mocked_lookup_operations: List[mock.Mock],
   ) -> None:
-    mocked_requested_result = mock.Mock()
+    mocked_requested_result = mock.Mock(pipeline=mocked_lookup_operations)
     mocked_requested_result.source = LOOKUP_STATIC_VALUE_MARKER + "static value"
     mocked_requesting_operation = "mocked_requesting_operation"
 
@@ -193,3 +439,4 @@ class TestResultForest:
     )
 
     assert lookup_results == mocked_requested_result.source[1:]
+    assert result_forest_instance.lookup_cache == {}
@@ -3,6 +3,7 @@
 from typing import List, Optional
 
 from text_lint.__helpers__.results import assert_result_tree
+from ..arena import ResultArena
 from ..tree import ResultTree
 
 
@@ -16,14 +17,138 @@ class TestResultTree:
     assert isinstance(instance.children, list)
     assert len(instance.children) == 0
 
+  def test_create__with_arena__creates_node_in_arena(
+      self,
+      result_arena_instance: ResultArena,
+  ) -> None:
+    instance = ResultTree.create(
+        value="mocked_created_tree",
+        arena=result_arena_instance,
+    )
+
+    assert instance.arena is result_arena_instance
+    assert instance.node == 0
+    assert instance.value == "mocked_created_tree"
+
   def test_initialize__attributes(
       self,
       result_tree_instance: ResultTree,
   ) -> None:
+    assert isinstance(result_tree_instance.arena, ResultArena)
+    assert result_tree_instance.node == 0
     assert result_tree_instance.value == "mocked_value"
     assert isinstance(result_tree_instance.children, list)
     assert len(result_tree_instance.children) == 0
 
+  def test_initialize__slots(
+      self,
+      result_tree_instance: ResultTree,
+  ) -> None:
+    assert not hasattr(result_tree_instance, "__dict__")
+
+  def test_view__existing_node__returns_instance(
+      self,
+      result_tree_instance: ResultTree,
+  ) -> None:
+    instance = ResultTree.view(
+        result_tree_instance.arena,
+        result_tree_instance.node,
+    )
+
+    assert instance is not result_tree_instance
+    assert instance.arena is result_tree_instance.arena
+    assert instance.node == result_tree_instance.node
+    assert instance.value == result_tree_instance.value
+
+  def test_children__returns_new_list(
+      self,
+      result_tree_instance: ResultTree,
+  ) -> None:
+    result_tree_instance.add_matches(("one",), {})
+
+    children = result_tree_instance.children
+    children.append(ResultTree("two"))
+
+    assert_result_tree(result_tree_instance, "mocked_value", ["one"])
+
+  def test_children__set__replaces_children(
+      self,
+      result_tree_instance: ResultTree,
+  ) -> None:
+    result_tree_instance.add_matches(("one",), {})
+
+    result_tree_instance.children = [ResultTree("two"), ResultTree("three")]
+
+    assert_result_tree(result_tree_instance, "mocked_value", ["two", "three"])
+
+  def test_append__same_arena_new_tree__links_tree(
+      self,
+      result_tree_instance: ResultTree,
+  ) -> None:
+    child = ResultTree.create("one", arena=result_tree_instance.arena)
+
+    result_tree_instance.append(child)
+
+    assert result_tree_instance.children[0].node == child.node
+
+  def test_append__same_arena_linked_tree__links_copy(
+      self,
+      result_tree_instance: ResultTree,
+  ) -> None:
+    result_tree_instance.add_matches(("one", "two"), {})
+    child = result_tree_instance.children[0]
+    other_tree = ResultTree.create("other", arena=result_tree_instance.arena)
+
+    other_tree.append(child)
+
+    assert other_tree.children[0].node != child.node
+    assert_result_tree(other_tree.children[0], "one", ["two"])
+    assert_result_tree(result_tree_instance, "mocked_value", ["one"])
+    assert other_tree.children[0].children[0].node == child.children[0].node
+
+  def test_append__other_arena__imports_tree(
+      self,
+      result_tree_instance: ResultTree,
+  ) -> None:
+    child = ResultTree("one")
+    child.add_matches(("two", "three"), {})
+
+    result_tree_instance.append(child)
+
+    imported = result_tree_instance.children[0]
+    assert imported.arena is result_tree_instance.arena
+    assert_result_tree(imported, "one", ["two"])
+    assert_result_tree(imported.children[0], "two", ["three"])
+
+  def test_merge__same_arena__moves_children(
+      self,
+      result_tree_instance: ResultTree,
+  ) -> None:
+    result_tree_instance.add_matches(("one",), {})
+    other_tree = ResultTree.create(
+        result_tree_instance.value,
+        arena=result_tree_instance.arena,
+    )
+    other_tree.add_matches(("two",), {})
+    arena_size = len(result_tree_instance.arena)
+
+    result_tree_instance.merge(other_tree)
+
+    assert_result_tree(result_tree_instance, "mocked_value", ["one", "two"])
+    assert len(result_tree_instance.arena) == arena_size
+
+  def test_merge__other_arena__imports_children(
+      self,
+      result_tree_instance: ResultTree,
+  ) -> None:
+    result_tree_instance.add_matches(("one",), {})
+    other_tree = ResultTree(result_tree_instance.value)
+    other_tree.add_matches(("two",), {})
+
+    result_tree_instance.merge(other_tree)
+
+    assert_result_tree(result_tree_instance, "mocked_value", ["one", "two"])
+
   def test_add_matches__no_splits__creates_child_instances(
       self,
       result_tree_instance: ResultTree,
@@ -67,6 +192,46 @@ class TestResultTree:
   ) -> None:
     assert hash(result_tree_instance) == hash((result_tree_instance.value,))
 
+  def test_unique__unique_children__returns_same_instance(
+      self,
+      result_tree_instance: ResultTree,
+  ) -> None:
+    result_tree_instance.children = [ResultTree("a"), ResultTree("b")]
+
+    instance = result_tree_instance.unique()
+
+    assert instance is result_tree_instance
+
+  def test_unique__duplicate_children__returns_new_instance(
+      self,
+      result_tree_instance: ResultTree,
+  ) -> None:
+    for capture_groups in (("a", "1"), ("b", "2"), ("a", "3")):
+      result_tree_instance.add_matches(capture_groups, {})
+    original_children = result_tree_instance.children
+
+    instance = result_tree_instance.unique()
+
+    assert instance is not result_tree_instance
+    assert instance.arena is result_tree_instance.arena
+    assert instance.value == result_tree_instance.value
+    assert instance.children == original_children[:2]
+    for index in range(0, 2):
+      assert instance.children[index].children[0].node == (
+          original_children[index].children[0].node
+      )
+
+  def test_unique__duplicate_children__does_not_modify_original(
+      self,
+      result_tree_instance: ResultTree,
+  ) -> None:
+    original_children = [ResultTree("a"), ResultTree("b"), ResultTree("a")]
+    result_tree_instance.children = list(original_children)
+
+    result_tree_instance.unique()
+
+    assert result_tree_instance.children == original_children
+
   def test_add_matches__no_splits__creates_nested_child_instances(
       self,
       result_tree_instance: ResultTree,
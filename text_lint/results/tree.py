@@ -2,6 +2,9 @@
 
 from typing import Dict, List, Optional, Tuple, Union
 
+from text_lint.utilities.collections import unique_list
+from .arena import NO_NODE, ResultArena
+
 AliasRecursiveTreeResult = Dict[
     str,
     Union[str, Tuple["AliasRecursiveTreeResult", ...]],
@@ -9,15 +12,58 @@ AliasRecursiveTreeResult = Dict[
 
 
 class ResultTree:
-  """Nested parsing results represented as tree."""
+  """Nested parsing results represented as tree.
+
+  Each instance is a view of a node stored in a ResultArena, which is shared
+  by all the trees of a ResultForest.  Once added to a ResultForest, trees are
+  treated as immutable: lookups derive new trees from them instead of
+  modifying them in place.
+  """
+
+  __slots__ = ("arena", "node")
 
-  def __init__(self, value: str) -> None:
-    self.value = value
-    self.children: List["ResultTree"] = []
+  def __init__(
+      self,
+      value: str,
+      arena: Optional[ResultArena] = None,
+  ) -> None:
+    self.arena = arena if arena is not None else ResultArena()
+    self.node = self.arena.create(value)
 
   @classmethod
-  def create(cls, value: str) -> "ResultTree":
-    return cls(value=value)
+  def create(
+      cls,
+      value: str,
+      arena: Optional[ResultArena] = None,
+  ) -> "ResultTree":
+    return cls(value=value, arena=arena)
+
+  @classmethod
+  def view(cls, arena: ResultArena, node: int) -> "ResultTree":
+    """Return a ResultTree instance for an existing node."""
+
+    instance = cls.__new__(cls)
+    instance.arena = arena
+    instance.node = node
+    return instance
+
+  @property
+  def value(self) -> str:
+    """Return the value of this tree's root node."""
+    return self.arena.value(self.node)
+
+  @property
+  def children(self) -> List["ResultTree"]:
+    """Return a new list of this tree's children."""
+    arena = self.arena
+    return [self.view(arena, child) for child in arena.children(self.node)]
+
+  @children.setter
+  def children(self, children: List["ResultTree"]) -> None:
+    """Replace this tree's children."""
+    self.arena.clear(self.node)
+    for child in children:
+      self.append(child)
 
   def __key(self) -> Tuple[str]:
     return (self.value,)
@@ -30,6 +76,37 @@ class ResultTree:
       return self.value == other.value
     return NotImplemented
 
+  def append(self, child: "ResultTree") -> None:
+    """Add a tree as the last child of this tree.
+
+    Trees that are already children of another tree are copied, sharing their
+    own children with the original tree.
+    """
+
+    arena = self.arena
+    if child.arena is not arena:
+      node = self._import(child)
+    elif arena.parents[child.node] != NO_NODE:
+      node = arena.copy(child.node)
+    else:
+      node = child.node
+    arena.append(self.node, node)
+
+  def merge(self, tree: "ResultTree") -> None:
+    """Move the children of another tree to this tree."""
+
+    if tree.arena is self.arena:
+      self.arena.move(tree.node, self.node)
+    else:
+      for child in tree.children:
+        self.append(child)
+
+  def _import(self, tree: "ResultTree") -> int:
+    node = self.arena.create(tree.value)
+    for child in tree.children:
+      self.arena.append(node, self._import(child))
+    return node
+
   def add_matches(
       self,
       capture_groups: Tuple[str, ...],
@@ -51,8 +128,9 @@ class ResultTree:
       capture_group: str,
       separator: Optional[str],
   ) -> None:
+    arena = self.arena
     for split_group in capture_group.split(separator):
-      self.children.append(self.create(value=split_group))
+      arena.append(self.node, arena.create(split_group))
 
   def _add_matches_recursive(
       self,
@@ -60,14 +138,20 @@ class ResultTree:
       splits: Dict[int, Optional[str]],
       index: int,
   ) -> None:
-    nested_result = self.create(value=capture_groups[index])
-    self.children.append(nested_result)
+    nested_result = self.create(value=capture_groups[index], arena=self.arena)
+    self.arena.append(self.node, nested_result.node)
     nested_result.add_matches(capture_groups, splits, index + 1)
 
-  def clone(self) -> "ResultTree":
-    clone = ResultTree.create(self.value)
-    clone.children = [child.clone() for child in self.children]
-    return clone
+  def unique(self) -> "ResultTree":
+    """Return a tree with unique children, sharing nodes with this tree."""
+
+    children = self.children
+    unique_children = unique_list(children)
+    if len(unique_children) == len(children):
+      return self
+    unique_tree = self.create(value=self.value, arena=self.arena)
+    unique_tree.children = unique_children
+    return unique_tree
 
   def representation(self) -> "AliasRecursiveTreeResult":
     """Return a dictionary representation of the nested tree structure."""
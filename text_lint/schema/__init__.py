@@ -1,13 +1,17 @@
 """Schema class."""
 
 import re
-from typing import TYPE_CHECKING, List, Optional, Tuple
+import threading
+from copy import deepcopy
+from typing import TYPE_CHECKING, Iterator, List, Optional, Tuple
 
 import yaml
 from text_lint.exceptions.schema import SchemaError
+from text_lint.operations.rules import AssertSequenceBegins
 from text_lint.schema.rules import SchemaRules
 from text_lint.schema.settings import SchemaSettings
 from text_lint.schema.validators import SchemaValidators
+from text_lint.utilities.collections import unique_list
 from text_lint.utilities.translations import _, f
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -18,7 +22,7 @@ if TYPE_CHECKING:  # pragma: no cover
   from text_lint.schema.bases.section_base import AliasYamlOperation
 
 
-class Schema:
+class Schema:  # pylint: disable=too-many-instance-attributes
   """A text file schema file."""
 
   msg_fmt_no_rules = _("no rules found in schema")
@@ -35,10 +39,23 @@ class Schema:
     self.settings = self._parse_schema_settings()
     self._rules = SchemaRules(self)
     self._validators = SchemaValidators(self)
+    self._compile_lock = threading.Lock()
+    self._compiled_rules: Optional[Tuple["RuleBase", ...]] = None
+    self._compiled_validators: Optional[Tuple["ValidationBase", ...]] = None
+    self._unused_saves: Optional[Tuple[str, ...]] = None
 
   def load_rules(self) -> List["RuleBase"]:
-    """Create and return the text file parser rule operation instances."""
-    return self._rules.load(self._parse_schema_rules())
+    """Return the text file parser rule operation instances.
+
+    The rule operations are created once, and then shared by every text file
+    that is linted with this schema.
+    """
+    with self._compile_lock:
+      if self._compiled_rules is None:
+        self._compiled_rules = tuple(
+            self._rules.load(deepcopy(self._parse_schema_rules()))
+        )
+    return list(self._compiled_rules)
 
   def _parse_schema_rules(self) -> List["AliasYamlOperation"]:
     try:
@@ -52,8 +69,17 @@ class Schema:
       ) from exc
 
   def load_validators(self) -> List["ValidationBase"]:
-    """Create and return the text file parser validation instances."""
-    return self._validators.load(self._parse_schema_validators())
+    """Return the text file parser validation instances.
+
+    The validation operations are created once, and then shared by every text
+    file that is linted with this schema.
+    """
+    with self._compile_lock:
+      if self._compiled_validators is None:
+        self._compiled_validators = tuple(
+            self._validators.load(deepcopy(self._parse_schema_validators()))
+        )
+    return list(self._compiled_validators)
 
   def _parse_schema_validators(self) -> List["AliasYamlOperation"]:
     try:
@@ -65,6 +91,37 @@ class Schema:
           description=f(self.msg_fmt_no_validators, nl=1),
       ) from exc
 
+  def load_unused_saves(self) -> Tuple[str, ...]:
+    """Return the names of saved rule results that no validator looks up.
+
+    Rules do not keep the results for these names, as nothing can use them.
+    """
+    rules = self.load_rules()
+    validators = self.load_validators()
+    with self._compile_lock:
+      if self._unused_saves is None:
+        requested_sources = {
+            result_set.source
+            for validator in validators
+            for result_set in validator.requested_results()
+        }
+        self._unused_saves = tuple(
+            unique_list(
+                [
+                    save for save in self._find_saves(rules)
+                    if save not in requested_sources
+                ]
+            )
+        )
+    return self._unused_saves
+
+  def _find_saves(self, rules: List["RuleBase"]) -> Iterator[str]:
+    for rule in rules:
+      if rule.save:
+        yield rule.save
+      if isinstance(rule, AssertSequenceBegins):
+        yield from self._find_saves(rule.rules)
+
   def _parse_schema_settings(self) -> SchemaSettings:
     if "settings" in self._content:
       try:
@@ -1,14 +1,17 @@
 """Test the Schema class."""
 
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from io import StringIO
-from typing import Any, Dict, Type
+from typing import Any, Dict, List, Type
 from unittest import mock
 
 import pytest
 from text_lint.__helpers__.schema import assert_is_schema_error
 from text_lint.__helpers__.translations import assert_is_translated
 from text_lint.exceptions.schema import SchemaError
+from text_lint.operations.rules import AssertSequenceBegins
 from .. import Schema
 from ..settings import SchemaSettings
 from .fixtures import schemas
@@ -189,6 +192,10 @@ class TestSchema:
     mocked_file_handle.write(json.dumps(schemas.one_simple_rule))
     mocked_file_handle.seek(0)
     instance = schema_class(mocked_schema_file)
+    mocked_schema_rules_section.return_value.load.return_value = [
+        mock.Mock(),
+        mock.Mock(),
+    ]
 
     created_rules = instance.load_rules()
 
@@ -232,6 +239,10 @@ class TestSchema:
     mocked_file_handle.write(json.dumps(schemas.one_simple_rule))
     mocked_file_handle.seek(0)
     instance = schema_class(mocked_schema_file)
+    mocked_schema_validators_section.return_value.load.return_value = [
+        mock.Mock(),
+        mock.Mock(),
+    ]
 
     created_validators = instance.load_validators()
 
@@ -241,3 +252,174 @@ class TestSchema:
     mocked_schema_validators_section.return_value.load.assert_called_once_with(
         schemas.one_simple_rule["validators"]
     )
+
+  def test_load_rules__repeated__creates_operations_once(
+      self,
+      schema_class: Type[Schema],
+      mocked_file_handle: StringIO,
+      mocked_schema_file: str,
+      mocked_schema_rules_section: mock.Mock,
+  ) -> None:
+    mocked_file_handle.write(json.dumps(schemas.one_simple_rule))
+    mocked_file_handle.seek(0)
+    instance = schema_class(mocked_schema_file)
+    mocked_schema_rules_section.return_value.load.return_value = [
+        mock.Mock(),
+        mock.Mock(),
+    ]
+
+    created_rules_1 = instance.load_rules()
+    created_rules_2 = instance.load_rules()
+
+    assert created_rules_1 == created_rules_2
+    assert created_rules_1 is not created_rules_2
+    mocked_schema_rules_section.return_value.load.assert_called_once_with(
+        schemas.one_simple_rule["rules"]
+    )
+
+  def test_load_validators__repeated__creates_operations_once(
+      self,
+      schema_class: Type[Schema],
+      mocked_file_handle: StringIO,
+      mocked_schema_file: str,
+      mocked_schema_validators_section: mock.Mock,
+  ) -> None:
+    mocked_file_handle.write(json.dumps(schemas.one_simple_rule))
+    mocked_file_handle.seek(0)
+    instance = schema_class(mocked_schema_file)
+    mocked_schema_validators_section.return_value.load.return_value = [
+        mock.Mock(),
+        mock.Mock(),
+    ]
+
+    created_validators_1 = instance.load_validators()
+    created_validators_2 = instance.load_validators()
+
+    assert created_validators_1 == created_validators_2
+    assert created_validators_1 is not created_validators_2
+    mocked_schema_validators_section.return_value.load.assert_called_once_with(
+        schemas.one_simple_rule["validators"]
+    )
+
+  def test_load_rules__concurrent__creates_operations_once(
+      self,
+      schema_class: Type[Schema],
+      mocked_file_handle: StringIO,
+      mocked_schema_file: str,
+      mocked_schema_rules_section: mock.Mock,
+  ) -> None:
+    mocked_file_handle.write(json.dumps(schemas.one_simple_rule))
+    mocked_file_handle.seek(0)
+    instance = schema_class(mocked_schema_file)
+
+    def load(_: Any) -> List[mock.Mock]:
+      time.sleep(0.01)
+      return [mock.Mock()]
+
+    mocked_schema_rules_section.return_value.load.side_effect = load
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+      created_rules = list(
+          executor.map(lambda _: instance.load_rules(), range(4))
+      )
+
+    assert all(created == created_rules[0] for created in created_rules)
+    mocked_schema_rules_section.return_value.load.assert_called_once_with(
+        schemas.one_simple_rule["rules"]
+    )
+
+  def test_load_validators__concurrent__creates_operations_once(
+      self,
+      schema_class: Type[Schema],
+      mocked_file_handle: StringIO,
+      mocked_schema_file: str,
+      mocked_schema_validators_section: mock.Mock,
+  ) -> None:
+    mocked_file_handle.write(json.dumps(schemas.one_simple_rule))
+    mocked_file_handle.seek(0)
+    instance = schema_class(mocked_schema_file)
+
+    def load(_: Any) -> List[mock.Mock]:
+      time.sleep(0.01)
+      return [mock.Mock()]
+
+    mocked_schema_validators_section.return_value.load.side_effect = load
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+      created_validators = list(
+          executor.map(lambda _: instance.load_validators(), range(4))
+      )
+
+    assert all(
+        created == created_validators[0] for created in created_validators
+    )
+    mocked_schema_validators_section.return_value.load.assert_called_once_with(
+        schemas.one_simple_rule["validators"]
+    )
+
+  def test_load_unused_saves__returns_saves_without_validator_lookups(
+      self,
+      schema_class: Type[Schema],
+      mocked_file_handle: StringIO,
+      mocked_schema_file: str,
+      mocked_schema_rules_section: mock.Mock,
+      mocked_schema_validators_section: mock.Mock,
+  ) -> None:
+    mocked_file_handle.write(json.dumps(schemas.one_simple_rule))
+    mocked_file_handle.seek(0)
+    instance = schema_class(mocked_schema_file)
+    mocked_schema_rules_section.return_value.load.return_value = [
+        mock.Mock(save="used"),
+        mock.Mock(save=None),
+        mock.Mock(save="unused"),
+        AssertSequenceBegins(
+            name="mocked_sequence",
+            rules=[
+                mock.Mock(save="nested_used"),
+                mock.Mock(save="unused"),
+                mock.Mock(save="nested_unused"),
+            ],
+            count=1,
+        ),
+    ]
+    mocked_schema_validators_section.return_value.load.return_value = [
+        mock.Mock(
+            requested_results=mock.Mock(
+                return_value=[mock.Mock(source="used")]
+            )
+        ),
+        mock.Mock(
+            requested_results=mock.Mock(
+                return_value=[
+                    mock.Mock(source="nested_used"),
+                    mock.Mock(source="~static"),
+                ]
+            )
+        ),
+    ]
+
+    unused_saves = instance.load_unused_saves()
+
+    assert unused_saves == ("unused", "nested_unused")
+
+  def test_load_unused_saves__repeated__analyzes_schema_once(
+      self,
+      schema_class: Type[Schema],
+      mocked_file_handle: StringIO,
+      mocked_schema_file: str,
+      mocked_schema_rules_section: mock.Mock,
+      mocked_schema_validators_section: mock.Mock,
+  ) -> None:
+    mocked_file_handle.write(json.dumps(schemas.one_simple_rule))
+    mocked_file_handle.seek(0)
+    instance = schema_class(mocked_schema_file)
+    mocked_rule = mock.Mock(save="unused")
+    mocked_schema_rules_section.return_value.load.return_value = [mocked_rule]
+    mocked_schema_validators_section.return_value.load.return_value = []
+
+    unused_saves_1 = instance.load_unused_saves()
+    mocked_rule.save = "changed"
+    unused_saves_2 = instance.load_unused_saves()
+
+    assert unused_saves_1 == ("unused",)
+    assert unused_saves_2 is unused_saves_1
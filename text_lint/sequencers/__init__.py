@@ -0,0 +1,13 @@
+"""Sequencers for text_lint."""
+
+from typing import Dict, Type
+
+from .textfile import TextFileSequencer
+from .textfile_mmap import MappedTextFileSequencer
+from .textfile_stream import StreamingTextFileSequencer
+
+textfile_registry: Dict[str, Type[TextFileSequencer]] = {
+    MappedTextFileSequencer.mode: MappedTextFileSequencer,
+    StreamingTextFileSequencer.mode: StreamingTextFileSequencer,
+    TextFileSequencer.mode: TextFileSequencer,
+}
@@ -1,42 +1,70 @@
 """OperatorBase class."""
 
-from typing import TYPE_CHECKING, List, TypeVar
+from typing import TYPE_CHECKING, List, Tuple, TypeVar
 
 from text_lint.config import LOOP_COUNT
 from text_lint.sequencers.patterns.loop import LinearLoopPattern
+from text_lint.sequencers.patterns.repeat import LinearRepeatPattern
 from .sequencer_base import SequencerBase
 
 if TYPE_CHECKING:  # pragma: no cover
   from text_lint.operations.bases.operation_base import OperationBase
+  from text_lint.sequencers.patterns.bases.pattern_base import (
+      SequencerPatternBase,
+  )
 
 TypeOperation = TypeVar("TypeOperation", bound="OperationBase")
 
+AliasOperatorFrame = Tuple[List[TypeOperation], int, "SequencerPatternBase"]
+
 
 class OperatorBase(SequencerBase[TypeOperation]):
-  """A base class for iterating over discrete operations."""
+  """A base class for iterating over discrete operations.
+
+  Inserted operations are iterated as a new frame, and the interrupted
+  sequence is resumed once that frame's pattern is exhausted.
+  """
 
   _entities: List["TypeOperation"]
 
   def __init__(self, operations: List["TypeOperation"]) -> None:
     super().__init__(operations)
+    self.frames: List[AliasOperatorFrame[TypeOperation]] = []
+
+  @property
+  def looping(self) -> bool:
+    """Return True if any active frame repeats until the eof is reached."""
+
+    return isinstance(self.pattern, LinearLoopPattern) or any(
+        isinstance(pattern, LinearLoopPattern) for _, _, pattern in self.frames
+    )
 
   def insert(self, entities: "List[TypeOperation]", count: int) -> None:
     """Insert a sequence of operations at the current index."""
 
+    self.frames.append((self._entities, self.index, self.pattern))
+    self._entities = entities
+    self.index = 0
     if count == LOOP_COUNT:
-      self.pattern = LinearLoopPattern(
-          start=self.index,
-          end=self.index + len(entities),
-      )
+      self.pattern = LinearLoopPattern(start=0, end=len(entities))
     else:
-      self.pattern.adjust(len(entities))
-      entities = entities * count
+      self.pattern = LinearRepeatPattern(count)
 
-    self._entities = (
-        self._entities[:self.index] + entities + self._entities[self.index:]
-    )
+  def skip_iteration(self) -> None:
+    """Skip the remaining operations in this iteration of the inserted frame."""
+
+    if self.frames:
+      self.index = len(self._entities) - 1
+      self.pattern.increment(self)
 
   def __next__(self) -> "TypeOperation":
-    previous_index = self.index
-    self.next()
-    return self._entities[previous_index]
+    while True:
+      previous_index = self.index
+      try:
+        self.next()
+      except StopIteration:
+        if not self.frames:
+          raise
+        self._entities, self.index, self.pattern = self.frames.pop()
+      else:
+        return self._entities[previous_index]
@@ -9,6 +9,7 @@ from text_lint.sequencers.bases.operator_base import OperatorBase
 from text_lint.sequencers.bases.sequencer_base import SequencerBase
 from text_lint.sequencers.patterns.linear import LinearPattern
 from text_lint.sequencers.patterns.loop import LinearLoopPattern
+from text_lint.sequencers.patterns.repeat import LinearRepeatPattern
 
 
 class TestOperatorBase:
@@ -21,6 +22,7 @@ class TestOperatorBase:
   ) -> None:
     instance = concrete_operator_class(mocked_operations)
 
+    assert instance.frames == []
     assert instance.index == 0
     assert isinstance(instance.pattern, LinearPattern)
 
@@ -44,44 +46,64 @@ class TestOperatorBase:
 
     assert len(instance) == count
 
-  @pytest.mark.parametrize("count", [2, 4, 6])
+  @pytest.mark.parametrize("count", [1, 2, 4, 6])
   def test_insert__vary_bounded_count__inserts_rules_correctly(
       self,
       concrete_operator_class: Type["OperatorBase[mock.Mock]"],
       mocked_operations: List["mock.Mock"],
       count: int,
   ) -> None:
-    mocked_new_rules = [mock.Mock()]
+    mocked_new_rules = [mock.Mock(), mock.Mock()]
     instance = concrete_operator_class(mocked_operations)
-    instance.index = 1
+    rules = [next(instance)]
 
     instance.insert(mocked_new_rules, count)
 
-    instance.index = 0
-    rules = list(instance)
+    rules += list(instance)
     assert rules == (
         mocked_operations[:1] + mocked_new_rules * count + mocked_operations[1:]
     )
 
-  @pytest.mark.parametrize("entity_count", [2, 4, 6])
-  def test_insert__vary_entity_count__bounded__calls_pattern_adjust_method(
+  def test_insert__nested_bounded_count__inserts_rules_correctly(
       self,
       concrete_operator_class: Type["OperatorBase[mock.Mock]"],
       mocked_operations: List["mock.Mock"],
-      monkeypatch: pytest.MonkeyPatch,
-      entity_count: int,
   ) -> None:
-    mocked_pattern = mock.Mock()
+    mocked_outer_rules = [mock.Mock(), mock.Mock()]
+    mocked_inner_rules = [mock.Mock()]
     instance = concrete_operator_class(mocked_operations)
-    monkeypatch.setattr(
-        instance,
-        "pattern",
-        mocked_pattern,
+    rules = [next(instance)]
+    instance.insert(mocked_outer_rules, 2)
+    rules += [next(instance)]
+
+    instance.insert(mocked_inner_rules, 3)
+
+    rules += list(instance)
+    assert rules == (
+        mocked_operations[:1] + mocked_outer_rules[:1] +
+        mocked_inner_rules * 3 + mocked_outer_rules[1:] + mocked_outer_rules +
+        mocked_operations[1:]
     )
 
-    instance.insert([mock.Mock()] * entity_count, 1)
+  @pytest.mark.parametrize("count", [2, 4, 6])
+  def test_insert__vary_bounded_count__does_not_copy_rules(
+      self,
+      concrete_operator_class: Type["OperatorBase[mock.Mock]"],
+      mocked_operations: List["mock.Mock"],
+      count: int,
+  ) -> None:
+    mocked_new_rules = [mock.Mock()]
+    instance = concrete_operator_class(mocked_operations)
+    next(instance)
+
+    instance.insert(mocked_new_rules, count)
 
-    mocked_pattern.adjust.assert_called_once_with(entity_count)
+    assert instance.frames == [
+        (mocked_operations, 1, mock.ANY),
+    ]
+    assert len(instance) == len(mocked_new_rules)
+    assert isinstance(instance.pattern, LinearRepeatPattern)
+    assert instance.pattern.remaining == count
 
   def test_insert__infinite_count__inserts_rules_correctly(
       self,
@@ -90,15 +112,33 @@ class TestOperatorBase:
   ) -> None:
     mocked_new_rules = [mock.Mock(), mock.Mock(), mock.Mock()]
     instance = concrete_operator_class(mocked_operations)
-    instance.index = 1
+    rules = [next(instance)]
 
     instance.insert(mocked_new_rules, LOOP_COUNT)
 
-    instance.index = 0
-
-    rules = [next(instance) for _ in range(0, 100)]
+    rules += [next(instance) for _ in range(0, 99)]
     assert rules == mocked_operations[:1] + mocked_new_rules * 33
 
+  def test_insert__infinite_count__nested_bounded_count__inserts_rules(
+      self,
+      concrete_operator_class: Type["OperatorBase[mock.Mock]"],
+      mocked_operations: List["mock.Mock"],
+  ) -> None:
+    mocked_loop_rules = [mock.Mock(), mock.Mock()]
+    mocked_nested_rules = [mock.Mock()]
+    instance = concrete_operator_class(mocked_operations)
+    instance.insert(mocked_loop_rules, LOOP_COUNT)
+    rules = []
+
+    for _ in range(0, 3):
+      rules += [next(instance)]
+      instance.insert(mocked_nested_rules, 2)
+      rules += [next(instance) for _ in range(0, 3)]
+
+    assert rules == (
+        mocked_loop_rules[:1] + mocked_nested_rules * 2 + mocked_loop_rules[1:]
+    ) * 3
+
   @pytest.mark.parametrize("entity_count", [2, 4, 6])
   def test_insert__vary_entity_count__infinite__assigns_loop_pattern(
       self,
@@ -107,14 +147,102 @@ class TestOperatorBase:
       entity_count: int,
   ) -> None:
     instance = concrete_operator_class(mocked_operations)
-    expected_start = instance.index
-    expected_end = instance.index + entity_count
 
     instance.insert([mock.Mock()] * entity_count, LOOP_COUNT)
 
     assert isinstance(instance.pattern, LinearLoopPattern)
-    assert instance.pattern.start == expected_start
-    assert instance.pattern.end == expected_end
+    assert instance.pattern.start == 0
+    assert instance.pattern.end == entity_count
+
+  def test_looping__no_frames__linear_pattern__returns_false(
+      self,
+      concrete_operator_class: Type["OperatorBase[mock.Mock]"],
+      mocked_operations: List["mock.Mock"],
+  ) -> None:
+    instance = concrete_operator_class(mocked_operations)
+
+    assert instance.looping is False
+
+  def test_looping__bounded_frame__returns_false(
+      self,
+      concrete_operator_class: Type["OperatorBase[mock.Mock]"],
+      mocked_operations: List["mock.Mock"],
+  ) -> None:
+    instance = concrete_operator_class(mocked_operations)
+
+    instance.insert([mock.Mock()], 2)
+
+    assert instance.looping is False
+
+  def test_looping__infinite_frame__returns_true(
+      self,
+      concrete_operator_class: Type["OperatorBase[mock.Mock]"],
+      mocked_operations: List["mock.Mock"],
+  ) -> None:
+    instance = concrete_operator_class(mocked_operations)
+
+    instance.insert([mock.Mock()], LOOP_COUNT)
+
+    assert instance.looping is True
+
+  def test_looping__bounded_frame_inside_infinite_frame__returns_true(
+      self,
+      concrete_operator_class: Type["OperatorBase[mock.Mock]"],
+      mocked_operations: List["mock.Mock"],
+  ) -> None:
+    instance = concrete_operator_class(mocked_operations)
+    instance.insert([mock.Mock()], LOOP_COUNT)
+
+    instance.insert([mock.Mock()], 2)
+
+    assert instance.looping is True
+
+  def test_skip_iteration__no_frames__does_not_skip(
+      self,
+      concrete_operator_class: Type["OperatorBase[mock.Mock]"],
+      mocked_operations: List["mock.Mock"],
+  ) -> None:
+    instance = concrete_operator_class(mocked_operations)
+    next(instance)
+
+    instance.skip_iteration()
+
+    assert next(instance) == mocked_operations[1]
+
+  def test_skip_iteration__infinite_frame__restarts_iteration(
+      self,
+      concrete_operator_class: Type["OperatorBase[mock.Mock]"],
+      mocked_operations: List["mock.Mock"],
+  ) -> None:
+    mocked_loop_rules = [mock.Mock(), mock.Mock(), mock.Mock()]
+    instance = concrete_operator_class(mocked_operations)
+    instance.insert(mocked_loop_rules, LOOP_COUNT)
+    rules = [next(instance)]
+
+    instance.skip_iteration()
+
+    rules += [next(instance) for _ in range(0, 3)]
+    assert rules == mocked_loop_rules[:1] + mocked_loop_rules
+
+  @pytest.mark.parametrize("count", [1, 2])
+  def test_skip_iteration__vary_bounded_count__skips_one_iteration(
+      self,
+      concrete_operator_class: Type["OperatorBase[mock.Mock]"],
+      mocked_operations: List["mock.Mock"],
+      count: int,
+  ) -> None:
+    mocked_new_rules = [mock.Mock(), mock.Mock()]
+    instance = concrete_operator_class(mocked_operations)
+    instance.insert(mocked_new_rules, count)
+    rules = [next(instance)]
+
+    instance.skip_iteration()
+
+    rules += list(instance)
+    assert rules == (
+        mocked_new_rules[:1] + mocked_new_rules * (count - 1) +
+        mocked_operations
+    )
 
   def test_iter__returns_iterator(
       self,
@@ -149,3 +277,18 @@ class TestOperatorBase:
 
     with pytest.raises(StopIteration):
       next(instance)
+
+  def test_next__frame_exhausted__resumes_interrupted_sequence(
+      self,
+      concrete_operator_class: Type["OperatorBase[mock.Mock]"],
+      mocked_operations: List["mock.Mock"],
+  ) -> None:
+    instance = concrete_operator_class(mocked_operations)
+    next(instance)
+    instance.insert([mock.Mock()], 1)
+    next(instance)
+
+    received = next(instance)
+
+    assert received == mocked_operations[1]
+    assert instance.frames == []
@@ -2,7 +2,7 @@
 
 from typing import TYPE_CHECKING
 
-from text_lint.operations.lookups import lookup_registry
+from text_lint.operations.lookups import DefaultLookup, lookup_registry
 from .bases.operator_base import OperatorBase
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -11,7 +11,11 @@ if TYPE_CHECKING:  # pragma: no cover
 
 
 class LookupsSequencer(OperatorBase["LookupBase"]):
-  """Iterator that returns ResultForest lookups in the correct sequence."""
+  """Iterator that returns ResultForest lookups in the correct sequence.
+
+  Unregistered lookups are resolved by the DefaultLookup class when the
+  sequence is created, so the returned lookups can be applied directly.
+  """
 
   def __init__(
       self,
@@ -19,7 +23,7 @@ class LookupsSequencer(OperatorBase["LookupBase"]):
       requesting_operation_name: str,
   ) -> None:
     instances = [
-        lookup_registry[lookup](
+        lookup_registry.get(lookup, DefaultLookup.create)(
             lookup,
             result_set,
             requesting_operation_name,
@@ -19,11 +19,6 @@ class LinearLoopPattern(LinearPattern):
     self.start = start
     self.end = end
 
-  def adjust(self, offset: int) -> None:
-    """Adjust the pattern based on inserted data."""
-
-    self.end += offset
-
   def increment(self, sequencer: "SequencerBase[Any]") -> None:
     """Advance the index for the given sequencer instance."""
 
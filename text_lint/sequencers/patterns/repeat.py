@@ -0,0 +1,24 @@
+"""LinearRepeatPattern class."""
+
+from typing import TYPE_CHECKING, Any
+
+from .linear import LinearPattern
+
+if TYPE_CHECKING:  # pragma: no cover
+  from text_lint.sequencers.bases.sequencer_base import SequencerBase
+
+
+class LinearRepeatPattern(LinearPattern):
+  """Linear repeating pattern for SequencerBase instances."""
+
+  def __init__(self, count: int) -> None:
+    self.remaining = count
+
+  def increment(self, sequencer: "SequencerBase[Any]") -> None:
+    """Advance the index for the given sequencer instance."""
+
+    if sequencer.index + 1 >= len(sequencer) and self.remaining > 1:
+      self.remaining -= 1
+      sequencer.index = 0
+    else:
+      super().increment(sequencer)
@@ -6,6 +6,7 @@ from unittest import mock
 import pytest
 from ..linear import LinearPattern
 from ..loop import LinearLoopPattern
+from ..repeat import LinearRepeatPattern
 
 
 @pytest.fixture
@@ -13,6 +14,11 @@ def mocked_end_point() -> int:
   return 9
 
 
+@pytest.fixture
+def mocked_repeat_count() -> int:
+  return 3
+
+
 @pytest.fixture
 def mocked_sequencer() -> mock.MagicMock:
   return mock.MagicMock()
@@ -37,3 +43,8 @@ def loop_pattern_instance(
       start=mocked_start_point,
       end=mocked_end_point,
   )
+
+
+@pytest.fixture
+def repeat_pattern_instance(mocked_repeat_count: int) -> LinearRepeatPattern:
+  return LinearRepeatPattern(count=mocked_repeat_count)
@@ -19,14 +19,6 @@ class TestLinearPattern:
     assert isinstance(linear_pattern_instance, SequencerPatternBase)
     assert isinstance(linear_pattern_instance, LinearPattern)
 
-  @pytest.mark.parametrize("offset", [2, 4, 6])
-  def test_adjust__is_a_noop(
-      self,
-      linear_pattern_instance: LinearPattern,
-      offset: int,
-  ) -> None:
-    linear_pattern_instance.adjust(offset)
-
   @pytest.mark.parametrize("index", [2, 4, 6])
   def test_increment__vary_index__valid_index__increments_index_by_1(
       self,
@@ -28,17 +28,6 @@ class TestLinearLoopPattern:
     assert isinstance(loop_pattern_instance, SequencerPatternBase)
     assert isinstance(loop_pattern_instance, LinearLoopPattern)
 
-  @pytest.mark.parametrize("offset", [2, 4, 6])
-  def test_adjust__changes_loop_end(
-      self,
-      mocked_end_point: int,
-      loop_pattern_instance: LinearLoopPattern,
-      offset: int,
-  ) -> None:
-    loop_pattern_instance.adjust(offset)
-
-    assert loop_pattern_instance.end == mocked_end_point + offset
-
   @pytest.mark.parametrize("index", [2, 4, 6])
   def test_increment__vary_valid_index__inside_loop__increments_index_by_1(
       self,
@@ -0,0 +1,85 @@
+"""Test the LinearRepeatPattern class."""
+
+from unittest import mock
+
+import pytest
+from text_lint.sequencers.patterns.bases.pattern_base import (
+    SequencerPatternBase,
+)
+from ..linear import LinearPattern
+from ..repeat import LinearRepeatPattern
+
+
+class TestLinearRepeatPattern:
+  """Test the LinearRepeatPattern class."""
+
+  def test_initialize__attributes(
+      self,
+      mocked_repeat_count: int,
+      repeat_pattern_instance: LinearRepeatPattern,
+  ) -> None:
+    assert repeat_pattern_instance.remaining == mocked_repeat_count
+
+  def test_initialize__inheritance(
+      self,
+      repeat_pattern_instance: LinearRepeatPattern,
+  ) -> None:
+    assert isinstance(repeat_pattern_instance, SequencerPatternBase)
+    assert isinstance(repeat_pattern_instance, LinearPattern)
+    assert isinstance(repeat_pattern_instance, LinearRepeatPattern)
+
+  @pytest.mark.parametrize("index", [0, 1, 2])
+  def test_increment__vary_valid_index__inside_sequence__increments_index_by_1(
+      self,
+      mocked_repeat_count: int,
+      mocked_sequencer: mock.MagicMock,
+      repeat_pattern_instance: LinearRepeatPattern,
+      index: int,
+  ) -> None:
+    mocked_sequencer.__len__.return_value = 4
+    mocked_sequencer.index = index
+
+    repeat_pattern_instance.increment(mocked_sequencer)
+
+    assert mocked_sequencer.index == index + 1
+    assert repeat_pattern_instance.remaining == mocked_repeat_count
+
+  def test_increment__end_of_sequence__repeats_remaining__resets_index(
+      self,
+      mocked_repeat_count: int,
+      mocked_sequencer: mock.MagicMock,
+      repeat_pattern_instance: LinearRepeatPattern,
+  ) -> None:
+    mocked_sequencer.__len__.return_value = 4
+    mocked_sequencer.index = 3
+
+    repeat_pattern_instance.increment(mocked_sequencer)
+
+    assert mocked_sequencer.index == 0
+    assert repeat_pattern_instance.remaining == mocked_repeat_count - 1
+
+  def test_increment__end_of_sequence__last_repeat__increments_index_by_1(
+      self,
+      mocked_sequencer: mock.MagicMock,
+      repeat_pattern_instance: LinearRepeatPattern,
+  ) -> None:
+    mocked_sequencer.__len__.return_value = 4
+    mocked_sequencer.index = 3
+    repeat_pattern_instance.remaining = 1
+
+    repeat_pattern_instance.increment(mocked_sequencer)
+
+    assert mocked_sequencer.index == 4
+    assert repeat_pattern_instance.remaining == 1
+
+  def test_increment__past_end_of_sequence__last_repeat__raises_exception(
+      self,
+      mocked_sequencer: mock.MagicMock,
+      repeat_pattern_instance: LinearRepeatPattern,
+  ) -> None:
+    mocked_sequencer.__len__.return_value = 4
+    mocked_sequencer.index = 4
+    repeat_pattern_instance.remaining = 1
+
+    with pytest.raises(StopIteration):
+      repeat_pattern_instance.increment(mocked_sequencer)
@@ -2,11 +2,19 @@
 # pylint: disable=redefined-outer-name
 
 from io import StringIO
-from typing import Dict, List, Type
+from pathlib import Path
+from typing import Callable, Dict, List, Type
 from unittest import mock
 
 import pytest
-from text_lint.sequencers import lookups, rules, textfile, validators
+from text_lint.sequencers import (
+    lookups,
+    rules,
+    textfile,
+    textfile_mmap,
+    textfile_stream,
+    validators,
+)
 
 
 @pytest.fixture
@@ -29,6 +37,54 @@ def mocked_file_content_with_comments(
   return mocked_content
 
 
+@pytest.fixture
+def mocked_file_content_with_comment_block(
+    mocked_file_handle: StringIO,
+) -> List[str]:
+  mocked_content = [
+      "# license header line %s\n" % line for line in range(0, 5000)
+  ]
+  mocked_content += ["line %s\n" % line for line in range(0, 2)]
+  mocked_content += ["# trailing comment\n"]
+  mocked_file_handle.write("".join(mocked_content))
+  mocked_file_handle.seek(0)
+  return mocked_content
+
+
+@pytest.fixture
+def mocked_file_content_with_sections(
+    mocked_file_handle: StringIO,
+) -> List[str]:
+  mocked_content = [
+      "# This is a comment\n",
+      "line 1\n",
+      "line 2\n",
+      "\n",
+      "# This is also comment\n",
+      "\n",
+      "line 3\n",
+  ]
+  mocked_file_handle.write("".join(mocked_content))
+  mocked_file_handle.seek(0)
+  return mocked_content
+
+
+@pytest.fixture
+def mocked_mapped_file_path(tmp_path: Path) -> str:
+  return str(tmp_path / "mapped.txt")
+
+
+@pytest.fixture
+def create_mapped_file(mocked_mapped_file_path: str) -> Callable[[bytes], str]:
+
+  def setup(content: bytes) -> str:
+    with open(mocked_mapped_file_path, "wb") as fh:
+      fh.write(content)
+    return mocked_mapped_file_path
+
+  return setup
+
+
 @pytest.fixture
 def mocked_file_handle() -> StringIO:
   return StringIO()
@@ -81,6 +137,12 @@ def lookups_sequencer_class(
   return lookups.LookupsSequencer
 
 
+@pytest.fixture
+def mapped_textfile_sequencer_class(
+) -> Type[textfile_mmap.MappedTextFileSequencer]:
+  return textfile_mmap.MappedTextFileSequencer
+
+
 @pytest.fixture
 def rule_sequencer_class() -> Type[rules.RuleSequencer]:
   return rules.RuleSequencer
@@ -100,6 +162,25 @@ def textfile_sequencer_class(
   return textfile.TextFileSequencer
 
 
+@pytest.fixture
+def streaming_textfile_sequencer_class(
+    mocked_file_handle: StringIO,
+    mocked_open: mock.MagicMock,
+    monkeypatch: pytest.MonkeyPatch,
+) -> Type[textfile_stream.StreamingTextFileSequencer]:
+  monkeypatch.setattr(
+      "builtins.open",
+      mocked_open,
+  )
+  monkeypatch.setattr(
+      textfile_stream,
+      "TEXTFILE_STREAM_WINDOW",
+      3,
+  )
+  mocked_open.return_value = mocked_file_handle
+  return textfile_stream.StreamingTextFileSequencer
+
+
 @pytest.fixture
 def validator_sequencer_class() -> Type[validators.ValidatorSequencer]:
   return validators.ValidatorSequencer
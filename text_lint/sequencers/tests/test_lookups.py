@@ -3,6 +3,8 @@
 from typing import Dict, Type
 from unittest import mock
 
+import pytest
+from text_lint.sequencers import lookups
 from text_lint.sequencers.bases.operator_base import OperatorBase
 from text_lint.sequencers.bases.sequencer_base import SequencerBase
 from text_lint.sequencers.lookups import LookupsSequencer
@@ -72,3 +74,28 @@ class TestLookupsSequencer:
         mocked_lookup_registry[lookup].return_value
         for lookup in mocked_lookup_registry.keys()
     ]
+
+  def test_initialize__unknown_lookup__creates_default_lookup_selection(
+      self,
+      lookups_sequencer_class: Type[LookupsSequencer],
+      mocked_lookup_registry: Dict[str, mock.Mock],
+      mocked_result_set: mock.Mock,
+      monkeypatch: pytest.MonkeyPatch,
+  ) -> None:
+    mocked_default_lookup = mock.Mock()
+    monkeypatch.setattr(lookups, "DefaultLookup", mocked_default_lookup)
+    registered_lookups = dict(mocked_lookup_registry)
+    mocked_result_set.lookups = ["unknown"]
+
+    instance = lookups_sequencer_class(
+        mocked_result_set,
+        "mocked_requesting_operation_name",
+    )
+
+    assert list(instance) == [mocked_default_lookup.create.return_value]
+    mocked_default_lookup.create.assert_called_once_with(
+        "unknown",
+        mocked_result_set,
+        "mocked_requesting_operation_name",
+    )
+    assert mocked_lookup_registry == registered_lookups
@@ -0,0 +1,19 @@
+"""Test the textfile_registry dictionary."""
+
+from .. import (
+    MappedTextFileSequencer,
+    StreamingTextFileSequencer,
+    TextFileSequencer,
+    textfile_registry,
+)
+
+
+class TestTextFileRegistry:
+  """Test the textfile_registry dictionary."""
+
+  def test_vary_mode__returns_correct_value(self) -> None:
+    assert textfile_registry == {
+        "memory": TextFileSequencer,
+        "mmap": MappedTextFileSequencer,
+        "stream": StreamingTextFileSequencer,
+    }
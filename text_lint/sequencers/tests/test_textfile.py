@@ -3,6 +3,7 @@
 from typing import List, Type
 from unittest import mock
 
+import pytest
 from text_lint.schema.settings import SchemaSettings
 from text_lint.sequencers.bases.sequencer_base import SequencerBase
 from text_lint.sequencers.textfile import TextFileSequencer
@@ -19,6 +20,7 @@ class TestTextFileSequencer:
     instance = textfile_sequencer_class(mocked_textfile)
 
     assert instance.path == mocked_textfile
+    assert instance.comments_skipped == 0
     assert instance.index == 0
 
   def test_initialize__reads_specified_file(
@@ -92,6 +94,7 @@ class TestTextFileSequencer:
     received_lines = list(instance)
 
     assert received_lines == mocked_file_content_with_comments
+    assert instance.comments_skipped == 0
 
   def test_configure__comment_regex__lines_and_comments__next_skips_comments(
       self,
@@ -112,6 +115,41 @@ class TestTextFileSequencer:
         mocked_file_content_with_comments[1:3] +
         mocked_file_content_with_comments[4:]
     )
+    assert instance.comments_skipped == 2
+
+  def test_configure__comment_regex__comment_block__next_skips_comments(
+      self,
+      textfile_sequencer_class: Type[TextFileSequencer],
+      mocked_file_content_with_comment_block: List[str],
+      mocked_textfile: str,
+  ) -> None:
+    mocked_schema = mock.Mock()
+    mocked_schema.settings = SchemaSettings(comment_regex="^#")
+
+    instance = textfile_sequencer_class(mocked_textfile)
+
+    instance.configure(mocked_schema)
+    received_lines = list(instance)
+
+    assert received_lines == mocked_file_content_with_comment_block[5000:5002]
+    assert instance.comments_skipped == 5001
+
+  def test_configure__comment_regex__comment_block__next_keeps_line_number(
+      self,
+      textfile_sequencer_class: Type[TextFileSequencer],
+      mocked_file_content_with_comment_block: List[str],
+      mocked_textfile: str,
+  ) -> None:
+    mocked_schema = mock.Mock()
+    mocked_schema.settings = SchemaSettings(comment_regex="^#")
+
+    instance = textfile_sequencer_class(mocked_textfile)
+
+    instance.configure(mocked_schema)
+    received_line = next(instance)
+
+    assert received_line == mocked_file_content_with_comment_block[5000]
+    assert instance.index == 5001
 
   def test_configure__no_comment_regex__lines_and_comments__next_all_lines(
       self,
@@ -128,3 +166,96 @@ class TestTextFileSequencer:
     received_lines = list(instance)
 
     assert received_lines == mocked_file_content_with_comments
+    assert instance.comments_skipped == 0
+
+  def test_read_section__no_comment_regex__returns_each_section(
+      self,
+      textfile_sequencer_class: Type[TextFileSequencer],
+      mocked_file_content_with_sections: List[str],
+      mocked_textfile: str,
+  ) -> None:
+    instance = textfile_sequencer_class(mocked_textfile)
+
+    received_sections = [instance.read_section() for _ in range(0, 3)]
+
+    assert received_sections == [
+        mocked_file_content_with_sections[0:3],
+        mocked_file_content_with_sections[4:5],
+        mocked_file_content_with_sections[6:],
+    ]
+    assert instance.index == len(mocked_file_content_with_sections)
+    with pytest.raises(StopIteration):
+      instance.read_section()
+
+  def test_read_section__comment_regex__returns_each_section(
+      self,
+      textfile_sequencer_class: Type[TextFileSequencer],
+      mocked_file_content_with_sections: List[str],
+      mocked_textfile: str,
+  ) -> None:
+    mocked_schema = mock.Mock()
+    mocked_schema.settings = SchemaSettings(comment_regex="^#")
+    instance = textfile_sequencer_class(mocked_textfile)
+
+    instance.configure(mocked_schema)
+    received_sections = [instance.read_section() for _ in range(0, 3)]
+
+    assert received_sections == [
+        mocked_file_content_with_sections[1:3],
+        [],
+        mocked_file_content_with_sections[6:],
+    ]
+    assert instance.comments_skipped == 2
+    with pytest.raises(StopIteration):
+      instance.read_section()
+
+  def test_read_section__comment_regex__blank_comments__returns_one_section(
+      self,
+      textfile_sequencer_class: Type[TextFileSequencer],
+      mocked_file_content_with_sections: List[str],
+      mocked_textfile: str,
+  ) -> None:
+    mocked_schema = mock.Mock()
+    mocked_schema.settings = SchemaSettings(comment_regex="^(#|\n)")
+    instance = textfile_sequencer_class(mocked_textfile)
+
+    instance.configure(mocked_schema)
+    received_section = instance.read_section()
+
+    assert received_section == (
+        mocked_file_content_with_sections[1:3] +
+        mocked_file_content_with_sections[6:]
+    )
+    assert instance.comments_skipped == 4
+    assert instance.index == len(mocked_file_content_with_sections)
+
+  def test_read_section__comment_regex__comment_block__skips_comments(
+      self,
+      textfile_sequencer_class: Type[TextFileSequencer],
+      mocked_file_content_with_comment_block: List[str],
+      mocked_textfile: str,
+  ) -> None:
+    mocked_schema = mock.Mock()
+    mocked_schema.settings = SchemaSettings(comment_regex="^#")
+    instance = textfile_sequencer_class(mocked_textfile)
+
+    instance.configure(mocked_schema)
+    received_section = instance.read_section()
+
+    assert received_section == mocked_file_content_with_comment_block[5000:5002]
+    assert instance.comments_skipped == 5001
+    with pytest.raises(StopIteration):
+      instance.read_section()
+
+  def test_close__does_not_modify_lines(
+      self,
+      textfile_sequencer_class: Type[TextFileSequencer],
+      mocked_file_content: List[str],
+      mocked_textfile: str,
+  ) -> None:
+    instance = textfile_sequencer_class(mocked_textfile)
+
+    instance.close()
+    received_lines = list(instance)
+
+    assert received_lines == mocked_file_content
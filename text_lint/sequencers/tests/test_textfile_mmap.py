@@ -0,0 +1,342 @@
+"""Test MappedTextFileSequencer class."""
+
+from array import array
+from typing import Callable, List, Type
+from unittest import mock
+
+import pytest
+from text_lint.__helpers__.translations import assert_is_translated
+from text_lint.schema.settings import SchemaSettings
+from text_lint.sequencers import textfile_mmap
+from text_lint.sequencers.bases.sequencer_base import SequencerBase
+from text_lint.sequencers.textfile import TextFileSequencer
+from text_lint.sequencers.textfile_mmap import MappedTextFileSequencer
+
+AliasMappedFileCreator = Callable[[bytes], str]
+
+
+class TestMappedTextFileSequencer:
+  """Test the MappedTextFileSequencer class."""
+
+  def encode(self, lines: List[str]) -> bytes:
+    return "".join(lines).encode("utf-8")
+
+  def test_initialize__attributes(
+      self,
+      mapped_textfile_sequencer_class: Type[MappedTextFileSequencer],
+      create_mapped_file: AliasMappedFileCreator,
+  ) -> None:
+    mocked_path = create_mapped_file(b"line 1\n")
+
+    instance = mapped_textfile_sequencer_class(mocked_path)
+
+    assert instance.path == mocked_path
+    assert instance.index == 0
+    assert instance.mode == "mmap"
+
+  def test_initialize__translations(
+      self,
+      mapped_textfile_sequencer_class: Type[MappedTextFileSequencer],
+      create_mapped_file: AliasMappedFileCreator,
+  ) -> None:
+    instance = mapped_textfile_sequencer_class(create_mapped_file(b""))
+
+    assert_is_translated(instance.msg_fmt_invalid_encoding)
+
+  def test_initialize__inheritance(
+      self,
+      mapped_textfile_sequencer_class: Type[MappedTextFileSequencer],
+      create_mapped_file: AliasMappedFileCreator,
+  ) -> None:
+    instance = mapped_textfile_sequencer_class(create_mapped_file(b""))
+
+    assert isinstance(instance, MappedTextFileSequencer)
+    assert isinstance(instance, TextFileSequencer)
+    assert isinstance(instance, SequencerBase)
+
+  def test_initialize__builds_line_offset_index(
+      self,
+      mapped_textfile_sequencer_class: Type[MappedTextFileSequencer],
+      create_mapped_file: AliasMappedFileCreator,
+  ) -> None:
+    instance = mapped_textfile_sequencer_class(
+        create_mapped_file(b"one\ntwo\n\nthree")
+    )
+
+    offsets = getattr(instance, "_offsets")
+    assert isinstance(offsets, array)
+    assert offsets.typecode == "Q"
+    assert list(offsets) == [0, 4, 8, 9, 14]
+
+  def test_initialize__does_not_decode_lines(
+      self,
+      mapped_textfile_sequencer_class: Type[MappedTextFileSequencer],
+      create_mapped_file: AliasMappedFileCreator,
+      mocked_file_content: List[str],
+  ) -> None:
+    instance = mapped_textfile_sequencer_class(
+        create_mapped_file(self.encode(mocked_file_content))
+    )
+
+    assert getattr(instance, "_entities") == []
+
+  @pytest.mark.parametrize(
+      "content,expected_length",
+      [
+          [b"", 0],
+          [b"one", 1],
+          [b"one\n", 1],
+          [b"one\ntwo", 2],
+          [b"one\n\n\n", 3],
+      ],
+  )
+  def test_len__vary_content__returns_line_count(
+      self,
+      mapped_textfile_sequencer_class: Type[MappedTextFileSequencer],
+      create_mapped_file: AliasMappedFileCreator,
+      content: bytes,
+      expected_length: int,
+  ) -> None:
+    instance = mapped_textfile_sequencer_class(create_mapped_file(content))
+
+    assert len(instance) == expected_length
+
+  def test_current__lines__returns_line_at_index(
+      self,
+      mapped_textfile_sequencer_class: Type[MappedTextFileSequencer],
+      create_mapped_file: AliasMappedFileCreator,
+      mocked_file_content: List[str],
+  ) -> None:
+    instance = mapped_textfile_sequencer_class(
+        create_mapped_file(self.encode(mocked_file_content))
+    )
+
+    received_content: List[str] = []
+    for line in reversed(range(0, 10)):
+      instance.index = line
+      received_content.insert(0, instance.current)
+
+    assert received_content == mocked_file_content
+
+  def test_current__windows_line_endings__returns_normalized_line(
+      self,
+      mapped_textfile_sequencer_class: Type[MappedTextFileSequencer],
+      create_mapped_file: AliasMappedFileCreator,
+  ) -> None:
+    instance = mapped_textfile_sequencer_class(
+        create_mapped_file(b"one\r\ntwo\r\n")
+    )
+
+    received_lines = list(instance)
+
+    assert received_lines == ["one\n", "two\n"]
+
+  @pytest.mark.parametrize(
+      "content",
+      [
+          b"a\rb\nc\r\n",
+          b"a\r\r\nb",
+          b"\r",
+          b"x\n\n\ry\r",
+      ],
+  )
+  def test_current__vary_line_endings__matches_text_mode_reads(
+      self,
+      mapped_textfile_sequencer_class: Type[MappedTextFileSequencer],
+      create_mapped_file: AliasMappedFileCreator,
+      content: bytes,
+  ) -> None:
+    mocked_path = create_mapped_file(content)
+    instance = mapped_textfile_sequencer_class(mocked_path)
+
+    received_lines = list(instance)
+
+    assert received_lines == list(TextFileSequencer(mocked_path))
+
+  def test_current__unicode_content__returns_decoded_line(
+      self,
+      mapped_textfile_sequencer_class: Type[MappedTextFileSequencer],
+      create_mapped_file: AliasMappedFileCreator,
+  ) -> None:
+    instance = mapped_textfile_sequencer_class(
+        create_mapped_file("ünïcödé\n".encode("utf-8"))
+    )
+
+    assert instance.current == "ünïcödé\n"
+
+  @pytest.mark.parametrize("chunk_size", [1, 3, 1024])
+  def test_initialize__invalid_encoding__raises_exception(
+      self,
+      mapped_textfile_sequencer_class: Type[MappedTextFileSequencer],
+      create_mapped_file: AliasMappedFileCreator,
+      chunk_size: int,
+      monkeypatch: pytest.MonkeyPatch,
+  ) -> None:
+    monkeypatch.setattr(
+        textfile_mmap,
+        "TEXTFILE_MMAP_DECODE_CHUNK",
+        chunk_size,
+    )
+    mocked_path = create_mapped_file("ab\nü\nc".encode("utf-8") + b"\xff\n")
+
+    with pytest.raises(UnicodeDecodeError) as exc:
+      mapped_textfile_sequencer_class(mocked_path)
+
+    assert exc.value.reason == (
+        MappedTextFileSequencer.msg_fmt_invalid_encoding.format(
+            "invalid start byte",
+            3,
+            mocked_path,
+        )
+    )
+
+  def test_initialize__invalid_encoding__releases_mapping(
+      self,
+      mapped_textfile_sequencer_class: Type[MappedTextFileSequencer],
+      create_mapped_file: AliasMappedFileCreator,
+  ) -> None:
+    with mock.patch.object(
+        mapped_textfile_sequencer_class,
+        "close",
+    ) as mocked_close:
+      with pytest.raises(UnicodeDecodeError):
+        mapped_textfile_sequencer_class(create_mapped_file(b"\xff\n"))
+
+    mocked_close.assert_called_once_with()
+
+  @pytest.mark.parametrize("index", [-1, 10])
+  def test_current__vary_invalid_index__raises_exception(
+      self,
+      mapped_textfile_sequencer_class: Type[MappedTextFileSequencer],
+      create_mapped_file: AliasMappedFileCreator,
+      mocked_file_content: List[str],
+      index: int,
+  ) -> None:
+    instance = mapped_textfile_sequencer_class(
+        create_mapped_file(self.encode(mocked_file_content))
+    )
+    instance.index = index
+
+    with pytest.raises(IndexError):
+      _ = instance.current
+
+  def test_current__empty_file__raises_exception(
+      self,
+      mapped_textfile_sequencer_class: Type[MappedTextFileSequencer],
+      create_mapped_file: AliasMappedFileCreator,
+  ) -> None:
+    instance = mapped_textfile_sequencer_class(create_mapped_file(b""))
+
+    with pytest.raises(IndexError):
+      _ = instance.current
+
+  def test_current__rewound_index__returns_previous_line(
+      self,
+      mapped_textfile_sequencer_class: Type[MappedTextFileSequencer],
+      create_mapped_file: AliasMappedFileCreator,
+      mocked_file_content: List[str],
+  ) -> None:
+    instance = mapped_textfile_sequencer_class(
+        create_mapped_file(self.encode(mocked_file_content))
+    )
+    for _ in range(0, 5):
+      next(instance)
+
+    instance.index -= 1
+
+    assert instance.current == mocked_file_content[4]
+
+  def test_next__lines__iterates_over_all_lines(
+      self,
+      mapped_textfile_sequencer_class: Type[MappedTextFileSequencer],
+      create_mapped_file: AliasMappedFileCreator,
+      mocked_file_content: List[str],
+  ) -> None:
+    instance = mapped_textfile_sequencer_class(
+        create_mapped_file(self.encode(mocked_file_content))
+    )
+
+    received_lines = list(instance)
+
+    assert received_lines == mocked_file_content
+
+  def test_next__empty_file__raises_stop_iteration(
+      self,
+      mapped_textfile_sequencer_class: Type[MappedTextFileSequencer],
+      create_mapped_file: AliasMappedFileCreator,
+  ) -> None:
+    instance = mapped_textfile_sequencer_class(create_mapped_file(b""))
+
+    with pytest.raises(StopIteration):
+      next(instance)
+
+  def test_configure__comment_regex__lines_and_comments__next_skips_comments(
+      self,
+      mapped_textfile_sequencer_class: Type[MappedTextFileSequencer],
+      create_mapped_file: AliasMappedFileCreator,
+      mocked_file_content_with_comments: List[str],
+  ) -> None:
+    mocked_schema = mock.Mock()
+    mocked_schema.settings = SchemaSettings(comment_regex="^#")
+    instance = mapped_textfile_sequencer_class(
+        create_mapped_file(self.encode(mocked_file_content_with_comments))
+    )
+
+    instance.configure(mocked_schema)
+    received_lines = list(instance)
+
+    assert received_lines == (
+        mocked_file_content_with_comments[1:3] +
+        mocked_file_content_with_comments[4:]
+    )
+
+  def test_close__mapped_file__releases_mapping(
+      self,
+      mapped_textfile_sequencer_class: Type[MappedTextFileSequencer],
+      create_mapped_file: AliasMappedFileCreator,
+      mocked_file_content: List[str],
+  ) -> None:
+    instance = mapped_textfile_sequencer_class(
+        create_mapped_file(self.encode(mocked_file_content))
+    )
+    mapped_file = getattr(instance, "_map")
+
+    instance.close()
+
+    assert mapped_file.closed
+    assert getattr(instance, "_map") is None
+    assert len(instance) == 0
+
+  def test_close__closed_file__does_not_raise_exception(
+      self,
+      mapped_textfile_sequencer_class: Type[MappedTextFileSequencer],
+      create_mapped_file: AliasMappedFileCreator,
+  ) -> None:
+    instance = mapped_textfile_sequencer_class(create_mapped_file(b"one\n"))
+
+    instance.close()
+    instance.close()
+
+  def test_read_section__comment_regex__returns_each_section(
+      self,
+      mapped_textfile_sequencer_class: Type[MappedTextFileSequencer],
+      create_mapped_file: AliasMappedFileCreator,
+      mocked_file_content_with_sections: List[str],
+  ) -> None:
+    mocked_schema = mock.Mock()
+    mocked_schema.settings = SchemaSettings(comment_regex="^#")
+    instance = mapped_textfile_sequencer_class(
+        create_mapped_file(self.encode(mocked_file_content_with_sections))
+    )
+
+    instance.configure(mocked_schema)
+    received_sections = []
+    with pytest.raises(StopIteration):
+      while True:
+        received_sections.append(instance.read_section())
+
+    assert len(received_sections) == 3
+    assert received_sections[0] == mocked_file_content_with_sections[1:3]
+    assert not received_sections[1]
+    assert received_sections[2] == mocked_file_content_with_sections[6:]
+    assert instance.comments_skipped == 2
@@ -0,0 +1,281 @@
+"""Test StreamingTextFileSequencer class."""
+
+from io import StringIO
+from typing import List, Type
+from unittest import mock
+
+import pytest
+from text_lint.__helpers__.translations import (
+    as_translation,
+    assert_is_translated,
+)
+from text_lint.schema.settings import SchemaSettings
+from text_lint.sequencers.bases.sequencer_base import SequencerBase
+from text_lint.sequencers.textfile import TextFileSequencer
+from text_lint.sequencers.textfile_stream import StreamingTextFileSequencer
+
+
+class TestStreamingTextFileSequencer:
+  """Test the StreamingTextFileSequencer class."""
+
+  def test_initialize__attributes(
+      self,
+      streaming_textfile_sequencer_class: Type[StreamingTextFileSequencer],
+      mocked_textfile: str,
+  ) -> None:
+    instance = streaming_textfile_sequencer_class(mocked_textfile)
+
+    assert instance.path == mocked_textfile
+    assert instance.index == 0
+    assert instance.mode == "stream"
+    assert instance.msg_fmt_line_not_buffered == as_translation(
+        "line {0} is not buffered"
+    )
+
+  def test_initialize__translations(
+      self,
+      streaming_textfile_sequencer_class: Type[StreamingTextFileSequencer],
+      mocked_textfile: str,
+  ) -> None:
+    instance = streaming_textfile_sequencer_class(mocked_textfile)
+
+    assert_is_translated(instance.msg_fmt_line_not_buffered)
+
+  def test_initialize__opens_specified_file(
+      self,
+      streaming_textfile_sequencer_class: Type[StreamingTextFileSequencer],
+      mocked_open: mock.MagicMock,
+      mocked_textfile: str,
+  ) -> None:
+    streaming_textfile_sequencer_class(mocked_textfile)
+
+    mocked_open.assert_called_once_with(
+        mocked_textfile,
+        "r",
+        encoding="utf-8",
+    )
+
+  def test_initialize__does_not_read_file(
+      self,
+      streaming_textfile_sequencer_class: Type[StreamingTextFileSequencer],
+      mocked_file_content: List[str],
+      mocked_file_handle: StringIO,
+      mocked_textfile: str,
+  ) -> None:
+    instance = streaming_textfile_sequencer_class(mocked_textfile)
+
+    assert len(instance) == 0
+    assert mocked_file_handle.tell() == 0
+    assert len(mocked_file_content) > 0
+
+  def test_initialize__inheritance(
+      self,
+      streaming_textfile_sequencer_class: Type[StreamingTextFileSequencer],
+      mocked_textfile: str,
+  ) -> None:
+    instance = streaming_textfile_sequencer_class(mocked_textfile)
+
+    assert isinstance(instance, StreamingTextFileSequencer)
+    assert isinstance(instance, TextFileSequencer)
+    assert isinstance(instance, SequencerBase)
+
+  def test_len__partially_read__returns_lines_read(
+      self,
+      streaming_textfile_sequencer_class: Type[StreamingTextFileSequencer],
+      mocked_file_content: List[str],
+      mocked_textfile: str,
+  ) -> None:
+    instance = streaming_textfile_sequencer_class(mocked_textfile)
+
+    next(instance)
+    next(instance)
+
+    assert len(instance) == 2
+    assert len(mocked_file_content) > 2
+
+  def test_current__lines__returns_line_at_index(
+      self,
+      streaming_textfile_sequencer_class: Type[StreamingTextFileSequencer],
+      mocked_file_content: List[str],
+      mocked_textfile: str,
+  ) -> None:
+    instance = streaming_textfile_sequencer_class(mocked_textfile)
+
+    received_content = []
+    for line in range(0, 10):
+      instance.index = line
+      received_content.append(instance.current)
+
+    assert received_content == mocked_file_content
+
+  def test_current__rewound_index__returns_previous_line(
+      self,
+      streaming_textfile_sequencer_class: Type[StreamingTextFileSequencer],
+      mocked_file_content: List[str],
+      mocked_textfile: str,
+  ) -> None:
+    instance = streaming_textfile_sequencer_class(mocked_textfile)
+    for _ in range(0, 5):
+      next(instance)
+
+    instance.index -= 1
+
+    assert instance.current == mocked_file_content[4]
+    assert instance.index + 1 == 5
+
+  def test_current__index_outside_window__raises_exception(
+      self,
+      streaming_textfile_sequencer_class: Type[StreamingTextFileSequencer],
+      mocked_file_content: List[str],
+      mocked_textfile: str,
+  ) -> None:
+    instance = streaming_textfile_sequencer_class(mocked_textfile)
+    for _ in range(0, 5):
+      next(instance)
+
+    instance.index = 1
+
+    with pytest.raises(IndexError) as exc:
+      _ = instance.current
+
+    assert str(exc.value) == instance.msg_fmt_line_not_buffered.format(2)
+    assert len(mocked_file_content) > 5
+
+  def test_current__index_beyond_eof__raises_exception(
+      self,
+      streaming_textfile_sequencer_class: Type[StreamingTextFileSequencer],
+      mocked_file_content: List[str],
+      mocked_textfile: str,
+  ) -> None:
+    instance = streaming_textfile_sequencer_class(mocked_textfile)
+
+    instance.index = len(mocked_file_content)
+
+    with pytest.raises(IndexError) as exc:
+      _ = instance.current
+
+    assert str(exc.value) == instance.msg_fmt_line_not_buffered.format(
+        len(mocked_file_content) + 1
+    )
+
+  def test_next__iter__returns_iterator(
+      self,
+      streaming_textfile_sequencer_class: Type[StreamingTextFileSequencer],
+      mocked_textfile: str,
+  ) -> None:
+    instance = streaming_textfile_sequencer_class(mocked_textfile)
+
+    iter_instance = iter(instance)
+
+    assert iter_instance == instance
+
+  def test_next__lines__iterates_over_all_lines(
+      self,
+      streaming_textfile_sequencer_class: Type[StreamingTextFileSequencer],
+      mocked_file_content: List[str],
+      mocked_textfile: str,
+  ) -> None:
+    instance = streaming_textfile_sequencer_class(mocked_textfile)
+
+    received_lines = list(instance)
+
+    assert received_lines == mocked_file_content
+
+  def test_next__lines__retains_bounded_window(
+      self,
+      streaming_textfile_sequencer_class: Type[StreamingTextFileSequencer],
+      mocked_file_content: List[str],
+      mocked_textfile: str,
+  ) -> None:
+    instance = streaming_textfile_sequencer_class(mocked_textfile)
+
+    list(instance)
+
+    assert list(getattr(instance, "_window")) == mocked_file_content[-3:]
+
+  def test_next__lines__closes_file_at_eof(
+      self,
+      streaming_textfile_sequencer_class: Type[StreamingTextFileSequencer],
+      mocked_file_content: List[str],
+      mocked_file_handle: StringIO,
+      mocked_textfile: str,
+  ) -> None:
+    instance = streaming_textfile_sequencer_class(mocked_textfile)
+
+    list(instance)
+
+    assert mocked_file_handle.closed
+    assert len(instance) == len(mocked_file_content)
+
+  def test_configure__comment_regex__lines_and_comments__next_skips_comments(
+      self,
+      streaming_textfile_sequencer_class: Type[StreamingTextFileSequencer],
+      mocked_file_content_with_comments: List[str],
+      mocked_textfile: str,
+  ) -> None:
+    mocked_schema = mock.Mock()
+    mocked_schema.settings = SchemaSettings(comment_regex="^#")
+    instance = streaming_textfile_sequencer_class(mocked_textfile)
+
+    instance.configure(mocked_schema)
+    received_lines = list(instance)
+
+    assert received_lines == (
+        mocked_file_content_with_comments[1:3] +
+        mocked_file_content_with_comments[4:]
+    )
+
+  def test_read_section__comment_regex__returns_each_section(
+      self,
+      streaming_textfile_sequencer_class: Type[StreamingTextFileSequencer],
+      mocked_file_content_with_sections: List[str],
+      mocked_textfile: str,
+  ) -> None:
+    mocked_schema = mock.Mock()
+    mocked_schema.settings = SchemaSettings(comment_regex="^#")
+    instance = streaming_textfile_sequencer_class(mocked_textfile)
+
+    instance.configure(mocked_schema)
+
+    assert instance.read_section() == mocked_file_content_with_sections[1:3]
+    assert not instance.read_section()
+    assert instance.read_section() == mocked_file_content_with_sections[6:]
+    with pytest.raises(StopIteration):
+      instance.read_section()
+    assert instance.comments_skipped == 2
+
+  def test_close__open_file__closes_file(
+      self,
+      streaming_textfile_sequencer_class: Type[StreamingTextFileSequencer],
+      mocked_file_handle: StringIO,
+      mocked_textfile: str,
+  ) -> None:
+    instance = streaming_textfile_sequencer_class(mocked_textfile)
+
+    instance.close()
+
+    assert mocked_file_handle.closed
+
+  def test_close__closed_file__does_not_raise_exception(
+      self,
+      streaming_textfile_sequencer_class: Type[StreamingTextFileSequencer],
+      mocked_textfile: str,
+  ) -> None:
+    instance = streaming_textfile_sequencer_class(mocked_textfile)
+
+    instance.close()
+    instance.close()
+
+  def test_next__closed_file__raises_stop_iteration(
+      self,
+      streaming_textfile_sequencer_class: Type[StreamingTextFileSequencer],
+      mocked_file_content: List[str],
+      mocked_textfile: str,
+  ) -> None:
+    instance = streaming_textfile_sequencer_class(mocked_textfile)
+
+    instance.close()
+
+    with pytest.raises(StopIteration):
+      next(instance)
+    assert len(mocked_file_content) > 0
@@ -1,8 +1,9 @@
 """TextfileSequencer class."""
 
 import re
-from typing import TYPE_CHECKING, Optional, Pattern
+from typing import TYPE_CHECKING, List, Optional, Pattern
 
+from text_lint.utilities.whitespace import new_line
 from .bases.sequencer_base import SequencerBase
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -13,28 +14,76 @@ class TextFileSequencer(SequencerBase[str]):
   """Iterator that returns the lines of a generic text file."""
 
   _comment_regex: Optional[Pattern[str]] = None
+  mode = "memory"
 
   def __init__(self, makefile_path: str) -> None:
-    with open(makefile_path, "r", encoding='utf-8') as fh:
-      super().__init__(fh.readlines())
-
+    super().__init__(self._load(makefile_path))
+    self.comments_skipped = 0
     self.path = makefile_path
 
+  def _load(self, makefile_path: str) -> List[str]:
+    with open(makefile_path, "r", encoding='utf-8') as fh:
+      return fh.readlines()
+
   def configure(self, schema: "Schema") -> None:
     """Apply schema configuration to the text file."""
     if schema.settings.comment_regex:
       self._comment_regex = re.compile(schema.settings.comment_regex, re.DOTALL)
 
+  def close(self) -> None:
+    """Release any resources held by the text file."""
+
+  def read_section(self) -> List[str]:
+    """Read the lines preceding the next blank line, and the blank line itself.
+
+    The section is located and sliced from the loaded lines in bulk, and its
+    comments are skipped.  StopIteration is raised if no lines remain.
+    """
+
+    start = self.index
+    end = len(self._entities)
+    if not self._is_comment(new_line()):
+      try:
+        end = self._entities.index(new_line(), start)
+      except ValueError:
+        pass
+
+    lines = self._entities[start:end]
+    if self._comment_regex:
+      match = self._comment_regex.match
+      uncommented = [line for line in lines if match(line) is None]
+      self.comments_skipped += len(lines) - len(uncommented)
+      lines = uncommented
+
+    self.index = min(end + 1, len(self._entities))
+    if not lines and end == len(self._entities):
+      raise StopIteration
+    return lines
+
+  def _read_section_lines(self) -> List[str]:
+    lines: List[str] = []
+    line = next(self)
+    while line != new_line():
+      lines.append(line)
+      try:
+        line = next(self)
+      except StopIteration:
+        break
+    return lines
+
   def __next__(self) -> str:
-    if self.index < len(self._entities):
+    while self._is_available(self.index):
       next_line = self.current
       self.index += 1
-      if self._is_comment(next_line):
-        return self.__next__()
-      return next_line
+      if not self._is_comment(next_line):
+        return next_line
+      self.comments_skipped += 1
     raise StopIteration
 
+  def _is_available(self, index: int) -> bool:
+    return index < len(self._entities)
+
   def _is_comment(self, next_line: str) -> bool:
     if self._comment_regex:
-      return re.match(self._comment_regex, next_line) is not None
+      return self._comment_regex.match(next_line) is not None
     return False
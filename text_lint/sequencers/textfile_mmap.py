@@ -0,0 +1,112 @@
+"""MappedTextFileSequencer class."""
+
+import codecs
+import mmap
+import os
+import re
+from array import array
+from bisect import bisect_right
+from typing import List, Optional
+
+from text_lint.config import TEXTFILE_MMAP_DECODE_CHUNK
+from text_lint.utilities.translations import _, f
+from .textfile import TextFileSequencer
+
+LINE_ENDING_REGEX = re.compile(rb"\r\n?|\n")
+
+
+class MappedTextFileSequencer(TextFileSequencer):
+  """Iterator that returns the lines of a memory-mapped generic text file.
+
+  A compact index of line offsets is built in a single pass, and each line is
+  decoded on demand from the mapped file.  Lines are split on "\n", "\r\n" and
+  "\r", and their endings are normalized to match text mode file reads.
+  """
+
+  mode = "mmap"
+
+  msg_fmt_invalid_encoding = _("{0} (line {1} of {2})")
+
+  def __init__(self, makefile_path: str) -> None:
+    self._map: Optional[mmap.mmap] = None
+    self._offsets = array("Q", [0])
+    super().__init__(makefile_path)
+
+  def _load(self, makefile_path: str) -> List[str]:
+    with open(makefile_path, "rb") as fh:
+      if os.fstat(fh.fileno()).st_size > 0:
+        self._map = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        self._offsets = self._index(self._map)
+        self._validate_encoding(self._map, makefile_path)
+    return []
+
+  def _index(self, mapped_file: mmap.mmap) -> "array[int]":
+    offsets = array("Q", [0])
+    offsets.extend(
+        line_ending.end()
+        for line_ending in LINE_ENDING_REGEX.finditer(mapped_file)
+    )
+    if offsets[-1] < len(mapped_file):
+      offsets.append(len(mapped_file))
+    return offsets
+
+  def _validate_encoding(
+      self,
+      mapped_file: mmap.mmap,
+      makefile_path: str,
+  ) -> None:
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    for start in range(0, len(mapped_file), TEXTFILE_MMAP_DECODE_CHUNK):
+      buffered = len(decoder.getstate()[0])
+      try:
+        decoder.decode(
+            mapped_file[start:start + TEXTFILE_MMAP_DECODE_CHUNK],
+            final=start + TEXTFILE_MMAP_DECODE_CHUNK >= len(mapped_file),
+        )
+      except UnicodeDecodeError as exc:
+        position = start - buffered + exc.start
+        line_number = bisect_right(self._offsets, position)
+        self.close()
+        raise UnicodeDecodeError(
+            exc.encoding,
+            exc.object,
+            exc.start,
+            exc.end,
+            f(
+                self.msg_fmt_invalid_encoding, exc.reason, line_number,
+                makefile_path
+            ),
+        ) from exc
+
+  def __len__(self) -> int:
+    return len(self._offsets) - 1
+
+  @property
+  def current(self) -> str:
+    if self._map is None or not 0 <= self.index < len(self):
+      raise IndexError(self.index)
+    line = self._map[self._offsets[self.index]:self._offsets[self.index + 1]]
+    if line.endswith(b"\r\n"):
+      line = line[:-2] + b"\n"
+    elif line.endswith(b"\r"):
+      line = line[:-1] + b"\n"
+    return line.decode("utf-8")
+
+  def read_section(self) -> List[str]:
+    """Read the lines preceding the next blank line, and the blank line itself.
+
+    Lines are read one at a time, as they are not loaded in advance.
+    """
+
+    return self._read_section_lines()
+
+  def _is_available(self, index: int) -> bool:
+    return index < len(self)
+
+  def close(self) -> None:
+    """Release the memory-mapped file."""
+
+    if self._map is not None:
+      self._map.close()
+      self._map = None
+      self._offsets = array("Q", [0])
@@ -0,0 +1,67 @@
+"""StreamingTextFileSequencer class."""
+
+from collections import deque
+from typing import Deque, List, Optional, TextIO
+
+from text_lint.config import TEXTFILE_STREAM_WINDOW
+from text_lint.utilities.translations import _, f
+from .textfile import TextFileSequencer
+
+
+class StreamingTextFileSequencer(TextFileSequencer):
+  """Iterator that lazily streams the lines of a generic text file.
+
+  Only a small window of the most recently read lines is retained, so memory
+  usage remains constant regardless of the size of the text file.
+  """
+
+  mode = "stream"
+
+  msg_fmt_line_not_buffered = _("line {0} is not buffered")
+
+  def __init__(self, makefile_path: str) -> None:
+    self._file_handle: Optional[TextIO] = None
+    self._lines_read = 0
+    self._window: Deque[str] = deque(maxlen=TEXTFILE_STREAM_WINDOW)
+    super().__init__(makefile_path)
+
+  def _load(self, makefile_path: str) -> List[str]:
+    # pylint: disable=consider-using-with
+    self._file_handle = open(makefile_path, "r", encoding='utf-8')
+    return []
+
+  def __len__(self) -> int:
+    return self._lines_read
+
+  @property
+  def current(self) -> str:
+    self._is_available(self.index)
+    offset = self.index - (self._lines_read - len(self._window))
+    if offset < 0 or offset >= len(self._window):
+      raise IndexError(f(self.msg_fmt_line_not_buffered, self.index + 1))
+    return self._window[offset]
+
+  def read_section(self) -> List[str]:
+    """Read the lines preceding the next blank line, and the blank line itself.
+
+    Lines are read one at a time, as they are not loaded in advance.
+    """
+
+    return self._read_section_lines()
+
+  def _is_available(self, index: int) -> bool:
+    while self._lines_read <= index and self._file_handle is not None:
+      line = self._file_handle.readline()
+      if not line:
+        self.close()
+        break
+      self._window.append(line)
+      self._lines_read += 1
+    return index < self._lines_read
+
+  def close(self) -> None:
+    """Close the underlying file handle."""
+
+    if self._file_handle is not None:
+      self._file_handle.close()
+      self._file_handle = None
@@ -0,0 +1,108 @@
+"""Statistics class."""
+
+from typing import TYPE_CHECKING, Dict, Union
+
+if TYPE_CHECKING:  # pragma: no cover
+  from text_lint.controller import Controller
+
+AliasStatistics = Dict[str, Union[Dict[str, int], Dict[str, Dict[str, int]]]]
+
+
+class Statistics:
+  """Counters describing the work done while linting text files.
+
+  Most counters are read from the Controller once linting has finished, so
+  only regex matches are counted while the rules are being applied.
+  """
+
+  counter_comment_lines_skipped = "comment_lines_skipped"
+  counter_cursor_locations = "cursor_locations"
+  counter_lines_read = "lines_read"
+  counter_lookup_cache_hits = "lookup_cache_hits"
+  counter_lookup_cache_misses = "lookup_cache_misses"
+  counter_lookups = "lookups"
+  counter_match_attempts = "match_attempts"
+  counter_match_failures = "match_failures"
+  counter_prefilter_rejections = "prefilter_rejections"
+  counter_result_tree_nodes = "result_tree_nodes"
+
+  def __init__(self) -> None:
+    self.counters: Dict[str, int] = {}
+    self.rules: Dict[str, Dict[str, int]] = {}
+
+  def collect(self, controller: "Controller") -> None:
+    """Add the counters from a Controller that has finished linting."""
+
+    forest = controller.forest
+    textfile = controller.textfile
+    self.count(self.counter_comment_lines_skipped, textfile.comments_skipped)
+    self.count(self.counter_cursor_locations, forest.cursor_locations)
+    self.count(self.counter_lines_read, textfile.index)
+    self.count(self.counter_lookup_cache_hits, forest.lookup_cache_hits)
+    self.count(self.counter_lookup_cache_misses, forest.lookup_cache_misses)
+    self.count(
+        self.counter_lookups,
+        forest.lookup_cache_hits + forest.lookup_cache_misses,
+    )
+    self.count(self.counter_result_tree_nodes, len(forest.arena))
+
+  def count(self, counter: str, value: int) -> None:
+    """Add a value to a counter."""
+
+    self.counters[counter] = self.counters.get(counter, 0) + value
+
+  def count_match(
+      self,
+      rule_name: str,
+      matched: bool,
+      rejected: bool = False,
+  ) -> None:
+    """Count a regex match attempt made by a rule.
+
+    Attempts rejected by the rule's literal prefix are also counted as
+    failures, so the prefilter's hit rate is rejections over failures.
+    """
+
+    self.count_matches(rule_name, 1, 0 if matched else 1, 1 if rejected else 0)
+
+  def count_matches(
+      self,
+      rule_name: str,
+      attempts: int,
+      failures: int,
+      rejections: int = 0,
+  ) -> None:
+    """Count a batch of regex match attempts made by a rule."""
+
+    rule_counters = self.rules.get(rule_name)
+    if rule_counters is None:
+      rule_counters = self.rules[rule_name] = {
+          self.counter_match_attempts: 0,
+          self.counter_match_failures: 0,
+          self.counter_prefilter_rejections: 0,
+      }
+    rule_counters[self.counter_match_attempts] += attempts
+    rule_counters[self.counter_match_failures] += failures
+    rule_counters[self.counter_prefilter_rejections] += rejections
+
+  def merge(self, statistics: "Statistics") -> None:
+    """Add the counters from another Statistics instance to this instance."""
+
+    for counter, value in statistics.counters.items():
+      self.count(counter, value)
+    for rule_name, rule_counters in statistics.rules.items():
+      merged_counters = self.rules.setdefault(rule_name, {})
+      for counter, value in rule_counters.items():
+        merged_counters[counter] = merged_counters.get(counter, 0) + value
+
+  def as_dict(self) -> AliasStatistics:
+    """Return the counters as a JSON serializable dictionary."""
+
+    return {
+        "counters": dict(sorted(self.counters.items())),
+        "rules":
+            {
+                rule_name: dict(rule_counters)
+                for rule_name, rule_counters in sorted(self.rules.items())
+            },
+    }
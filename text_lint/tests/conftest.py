@@ -6,7 +6,9 @@ from unittest import mock
 
 import pytest
 from text_lint import controller
-from text_lint.sequencers.patterns.linear import LinearPattern
+from text_lint.exceptions.rules import RuleExceptionBase
+from text_lint.exceptions.validators import ValidationExceptionBase
+from text_lint.sequencers.textfile import TextFileSequencer
 
 
 @pytest.fixture
@@ -14,6 +16,11 @@ def mocked_file_path() -> str:
   return "mocked_file_path"
 
 
+@pytest.fixture
+def mocked_profiler() -> mock.Mock:
+  return mock.Mock()
+
+
 @pytest.fixture
 def mocked_result_forest() -> mock.Mock:
   return mock.Mock()
@@ -22,18 +29,16 @@ def mocked_result_forest() -> mock.Mock:
 @pytest.fixture
 def mocked_rule_sequencer() -> mock.MagicMock:
   instance = mock.MagicMock()
-  instance.return_value.pattern = LinearPattern()
+  instance.return_value.frames = []
+  instance.return_value.looping = False
   return instance
 
 
 @pytest.fixture
 def mocked_schema() -> mock.Mock:
-  return mock.Mock()
-
-
-@pytest.fixture
-def mocked_schema_path() -> str:
-  return "mocked_schema_path"
+  instance = mock.Mock()
+  instance.load_unused_saves.return_value = ("mocked_unused_save",)
+  return instance
 
 
 @pytest.fixture
@@ -49,6 +54,29 @@ def mocked_interrupted_rule_sequence(
   return mocked_sequence
 
 
+@pytest.fixture
+def mocked_violated_rule_sequence(
+    mocked_sequence: List[mock.Mock],
+) -> List[mock.Mock]:
+  mocked_sequence[1].apply.side_effect = RuleExceptionBase("mocked_violation")
+  return mocked_sequence
+
+
+@pytest.fixture
+def mocked_failed_validator_sequence(
+    mocked_sequence: List[mock.Mock],
+) -> List[mock.Mock]:
+  mocked_sequence[0].apply.side_effect = ValidationExceptionBase(
+      "mocked_failure"
+  )
+  return mocked_sequence
+
+
+@pytest.fixture
+def mocked_statistics() -> mock.Mock:
+  return mock.Mock()
+
+
 @pytest.fixture
 def mocked_text_file_sequencer() -> mock.MagicMock:
   return mock.MagicMock()
@@ -61,7 +89,6 @@ def mocked_validator_sequencer() -> mock.MagicMock:
 
 @pytest.fixture
 def setup_controller_mocks(
-    mocked_schema: mock.Mock,
     mocked_rule_sequencer: mock.MagicMock,
     mocked_result_forest: mock.Mock,
     mocked_text_file_sequencer: mock.MagicMock,
@@ -82,13 +109,8 @@ def setup_controller_mocks(
     )
     monkeypatch.setattr(
         controller,
-        "Schema",
-        mocked_schema,
-    )
-    monkeypatch.setattr(
-        controller,
-        "TextFileSequencer",
-        mocked_text_file_sequencer,
+        "textfile_registry",
+        {TextFileSequencer.mode: mocked_text_file_sequencer},
     )
     monkeypatch.setattr(
         controller,
@@ -102,11 +124,55 @@ def setup_controller_mocks(
 @pytest.fixture
 def controller_instance(
     mocked_file_path: str,
-    mocked_schema_path: str,
+    mocked_schema: mock.Mock,
+    setup_controller_mocks: Callable[[], None],
+) -> controller.Controller:
+  setup_controller_mocks()
+  return controller.Controller(
+      file_path=mocked_file_path,
+      schema=mocked_schema,
+  )
+
+
+@pytest.fixture
+def collecting_controller_instance(
+    mocked_file_path: str,
+    mocked_schema: mock.Mock,
+    setup_controller_mocks: Callable[[], None],
+) -> controller.Controller:
+  setup_controller_mocks()
+  return controller.Controller(
+      file_path=mocked_file_path,
+      schema=mocked_schema,
+      max_errors=3,
+  )
+
+
+@pytest.fixture
+def profiled_controller_instance(
+    mocked_file_path: str,
+    mocked_profiler: mock.Mock,
+    mocked_schema: mock.Mock,
+    setup_controller_mocks: Callable[[], None],
+) -> controller.Controller:
+  setup_controller_mocks()
+  return controller.Controller(
+      file_path=mocked_file_path,
+      schema=mocked_schema,
+      profiler=mocked_profiler,
+  )
+
+
+@pytest.fixture
+def statistics_controller_instance(
+    mocked_file_path: str,
+    mocked_schema: mock.Mock,
+    mocked_statistics: mock.Mock,
     setup_controller_mocks: Callable[[], None],
 ) -> controller.Controller:
   setup_controller_mocks()
   return controller.Controller(
       file_path=mocked_file_path,
-      schema_path=mocked_schema_path,
+      schema=mocked_schema,
+      statistics=mocked_statistics,
   )
@@ -1,12 +1,15 @@
 """Test the Controller class."""
 
-from typing import List
+from typing import Callable, List, cast
 from unittest import mock
 
 import pytest
+from text_lint.__helpers__.controller import assert_is_collected_errors
 from text_lint.__helpers__.translations import assert_is_translated
+from text_lint.exceptions.controller import CollectedErrors
+from text_lint.exceptions.rules import RuleExceptionBase
 from text_lint.exceptions.sequencers import UnconsumedData
-from text_lint.sequencers.patterns.loop import LinearLoopPattern
+from .. import controller
 from ..controller import Controller
 
 
@@ -21,13 +24,68 @@ class TestController:
     assert_is_translated(controller_instance.msg_fmt_entire_file_not_read)
 
   # pylint: disable=unused-argument
-  def test_initialize__creates_schema_instance(
+  def test_initialize__stores_schema_instance(
       self,
-      mocked_schema_path: str,
       mocked_schema: mock.Mock,
       controller_instance: Controller,
   ) -> None:
-    mocked_schema.assert_called_once_with(mocked_schema_path)
+    assert controller_instance.schema == mocked_schema
+
+  def test_initialize__stores_unused_saves(
+      self,
+      controller_instance: Controller,
+  ) -> None:
+    assert controller_instance.unused_saves == frozenset({"mocked_unused_save"})
+
+  def test_initialize__no_profiler__stores_none(
+      self,
+      controller_instance: Controller,
+  ) -> None:
+    assert controller_instance.profiler is None
+
+  def test_initialize__profiler__stores_profiler_instance(
+      self,
+      mocked_profiler: mock.Mock,
+      profiled_controller_instance: Controller,
+  ) -> None:
+    assert profiled_controller_instance.profiler == mocked_profiler
+
+  def test_initialize__no_statistics__stores_none(
+      self,
+      controller_instance: Controller,
+  ) -> None:
+    assert controller_instance.statistics is None
+
+  def test_initialize__statistics__stores_statistics_instance(
+      self,
+      mocked_statistics: mock.Mock,
+      statistics_controller_instance: Controller,
+  ) -> None:
+    assert statistics_controller_instance.statistics == mocked_statistics
+
+  def test_initialize__no_max_errors__stores_one(
+      self,
+      controller_instance: Controller,
+  ) -> None:
+    assert controller_instance.max_errors == 1
+
+  def test_initialize__max_errors__stores_max_errors(
+      self,
+      collecting_controller_instance: Controller,
+  ) -> None:
+    assert collecting_controller_instance.max_errors == 3
+
+  def test_initialize__creates_empty_errors(
+      self,
+      controller_instance: Controller,
+  ) -> None:
+    assert not controller_instance.errors
+
+  def test_initialize__creates_empty_captures(
+      self,
+      controller_instance: Controller,
+  ) -> None:
+    assert not controller_instance.captures
 
   def test_initialize__creates_rules_sequencer_instance(
       self,
@@ -35,7 +93,7 @@ class TestController:
       mocked_schema: mock.Mock,
       controller_instance: Controller,
   ) -> None:
-    mocked_rule_sequencer.assert_called_once_with(mocked_schema.return_value)
+    mocked_rule_sequencer.assert_called_once_with(mocked_schema)
     assert controller_instance.rules == mocked_rule_sequencer.return_value
 
   def test_initialize__creates_validator_sequencer_instance(
@@ -44,9 +102,7 @@ class TestController:
       mocked_validator_sequencer: mock.Mock,
       controller_instance: Controller,
   ) -> None:
-    mocked_validator_sequencer.assert_called_once_with(
-        mocked_schema.return_value
-    )
+    mocked_validator_sequencer.assert_called_once_with(mocked_schema)
     assert controller_instance.validators == (
         mocked_validator_sequencer.return_value
     )
@@ -60,11 +116,32 @@ class TestController:
   ) -> None:
     mocked_text_file_sequencer.assert_called_once_with(mocked_file_path)
     mocked_text_file_sequencer.return_value.configure.\
-        assert_called_once_with(mocked_schema.return_value)
+        assert_called_once_with(mocked_schema)
     assert controller_instance.textfile == (
         mocked_text_file_sequencer.return_value
     )
 
+  def test_initialize__vary_textfile_mode__creates_correct_sequencer_instance(
+      self,
+      mocked_file_path: str,
+      mocked_schema: mock.Mock,
+      setup_controller_mocks: Callable[[], None],
+      monkeypatch: pytest.MonkeyPatch,
+  ) -> None:
+    setup_controller_mocks()
+    mocked_registry = {"mode_a": mock.Mock(), "mode_b": mock.Mock()}
+    monkeypatch.setattr(
+        controller,
+        "textfile_registry",
+        mocked_registry,
+    )
+
+    instance = Controller(mocked_file_path, mocked_schema, "mode_b")
+
+    mocked_registry["mode_a"].assert_not_called()
+    mocked_registry["mode_b"].assert_called_once_with(mocked_file_path)
+    assert instance.textfile == mocked_registry["mode_b"].return_value
+
   def test_initialize__creates_result_forest_instance(
       self,
       mocked_result_forest: mock.Mock,
@@ -91,9 +168,8 @@ class TestController:
     for mocked_rule in mocked_sequence:
       mocked_rule.apply.assert_called_once_with(controller_instance)
 
-  def test_start__all_text__all_schema__rules_finish__add_all_results(
+  def test_start__all_text__all_schema__rules_finish__save_all_results(
       self,
-      mocked_result_forest: mock.Mock,
       mocked_rule_sequencer: mock.MagicMock,
       mocked_sequence: List[mock.Mock],
       mocked_text_file_sequencer: mock.Mock,
@@ -107,10 +183,8 @@ class TestController:
 
     controller_instance.start()
 
-    mocked_results = [
-        mock.call(mocked_rule.results) for mocked_rule in mocked_sequence
-    ]
-    mocked_result_forest.return_value.add.assert_has_calls(mocked_results)
+    for mocked_rule in mocked_sequence:
+      mocked_rule.save_results.assert_called_once_with(controller_instance)
 
   def test_start__all_text__all_schema__rules_finish__run_all_validators(
       self,
@@ -133,6 +207,137 @@ class TestController:
     for mocked_validator in mocked_sequence:
       mocked_validator.apply.assert_called_once_with(controller_instance)
 
+  def test_start__profiler__rules_finish__profiles_all_rules(
+      self,
+      mocked_profiler: mock.Mock,
+      mocked_rule_sequencer: mock.MagicMock,
+      mocked_sequence: List[mock.Mock],
+      mocked_text_file_sequencer: mock.Mock,
+      profiled_controller_instance: Controller,
+  ) -> None:
+    mocked_rule_sequencer.return_value.__iter__.return_value = mocked_sequence
+    mocked_rule_sequencer.return_value.__next__.side_effect = StopIteration
+    mocked_text_file_sequencer.return_value.__next__.side_effect = (
+        StopIteration
+    )
+
+    profiled_controller_instance.start()
+
+    assert mocked_profiler.apply.mock_calls == [
+        mock.call(
+            mocked_profiler.section_rule,
+            mocked_rule.name,
+            mocked_rule,
+            profiled_controller_instance,
+        ) for mocked_rule in mocked_sequence
+    ]
+    for mocked_rule in mocked_sequence:
+      mocked_rule.apply.assert_not_called()
+      mocked_rule.save_results.assert_called_once_with(
+          profiled_controller_instance
+      )
+
+  def test_start__profiler__rules_finish__profiles_all_validators(
+      self,
+      mocked_rule_sequencer: mock.MagicMock,
+      mocked_sequence: List[mock.Mock],
+      mocked_text_file_sequencer: mock.Mock,
+      mocked_validator_sequencer: mock.MagicMock,
+      profiled_controller_instance: Controller,
+  ) -> None:
+    mocked_rule_sequencer.return_value.__next__.side_effect = StopIteration
+    mocked_text_file_sequencer.return_value.__next__.side_effect = (
+        StopIteration
+    )
+    mocked_validator_sequencer.return_value.__iter__.return_value = (
+        mocked_sequence
+    )
+
+    mocked_profiler = cast(mock.Mock, profiled_controller_instance.profiler)
+
+    profiled_controller_instance.start()
+
+    assert mocked_profiler.apply.mock_calls == [
+        mock.call(
+            mocked_profiler.section_validator,
+            mocked_validator.name,
+            mocked_validator,
+            profiled_controller_instance,
+        ) for mocked_validator in mocked_sequence
+    ]
+    for mocked_validator in mocked_sequence:
+      mocked_validator.apply.assert_not_called()
+
+  def test_start__profiler__loop_signals_stop__save_some_results(
+      self,
+      mocked_interrupted_rule_sequence: List[mock.Mock],
+      mocked_profiler: mock.Mock,
+      mocked_rule_sequencer: mock.MagicMock,
+      mocked_text_file_sequencer: mock.Mock,
+      profiled_controller_instance: Controller,
+  ) -> None:
+    mocked_rule_sequencer.return_value.__iter__.return_value = (
+        mocked_interrupted_rule_sequence
+    )
+    mocked_text_file_sequencer.return_value.__next__.side_effect = (
+        StopIteration
+    )
+    mocked_rule_sequencer.return_value.looping = True
+    mocked_profiler.apply.side_effect = [None, StopIteration]
+
+    profiled_controller_instance.start()
+
+    assert mocked_profiler.apply.call_count == 2
+    mocked_interrupted_rule_sequence[0].save_results.assert_called_once_with(
+        profiled_controller_instance
+    )
+    mocked_interrupted_rule_sequence[1].save_results.assert_not_called()
+
+  def test_start__statistics__rules_finish__collects_statistics(
+      self,
+      mocked_rule_sequencer: mock.MagicMock,
+      mocked_statistics: mock.Mock,
+      mocked_text_file_sequencer: mock.Mock,
+      statistics_controller_instance: Controller,
+  ) -> None:
+    mocked_rule_sequencer.return_value.__next__.side_effect = StopIteration
+    mocked_text_file_sequencer.return_value.__next__.side_effect = (
+        StopIteration
+    )
+
+    statistics_controller_instance.start()
+
+    mocked_statistics.collect.assert_called_once_with(
+        statistics_controller_instance
+    )
+
+  def test_start__statistics__raise_exception__collects_statistics(
+      self,
+      mocked_statistics: mock.Mock,
+      statistics_controller_instance: Controller,
+  ) -> None:
+    with pytest.raises(UnconsumedData):
+      statistics_controller_instance.start()
+
+    mocked_statistics.collect.assert_called_once_with(
+        statistics_controller_instance
+    )
+
+  def test_start__all_text__all_schema__rules_finish__closes_text_file(
+      self,
+      mocked_rule_sequencer: mock.MagicMock,
+      mocked_text_file_sequencer: mock.Mock,
+      controller_instance: Controller,
+  ) -> None:
+    mocked_rule_sequencer.return_value.__next__.side_effect = StopIteration
+    mocked_text_file_sequencer.return_value.__next__.side_effect = (
+        StopIteration
+    )
+
+    controller_instance.start()
+
+    mocked_text_file_sequencer.return_value.close.assert_called_once_with()
+
   def test_start__all_text__all_schema__loop_signals_stop__run_some_rules(
       self,
       mocked_interrupted_rule_sequence: List[mock.Mock],
@@ -146,9 +351,7 @@ class TestController:
     mocked_text_file_sequencer.return_value.__next__.side_effect = (
         StopIteration
     )
-    mocked_rule_sequencer.return_value.pattern = LinearLoopPattern(
-        start=1, end=2
-    )
+    mocked_rule_sequencer.return_value.looping = True
 
     controller_instance.start()
 
@@ -160,11 +363,10 @@ class TestController:
     )
     mocked_interrupted_rule_sequence[2].apply.assert_not_called()
 
-  def test_start__all_text__all_schema__loop_signals_stop__add_some_results(
+  def test_start__all_text__all_schema__loop_signals_stop__save_some_results(
       self,
       mocked_interrupted_rule_sequence: List[mock.Mock],
       mocked_rule_sequencer: mock.MagicMock,
-      mocked_result_forest: mock.Mock,
       mocked_text_file_sequencer: mock.Mock,
       controller_instance: Controller,
   ) -> None:
@@ -174,15 +376,14 @@ class TestController:
     mocked_text_file_sequencer.return_value.__next__.side_effect = (
         StopIteration
     )
-    mocked_rule_sequencer.return_value.pattern = LinearLoopPattern(
-        start=1, end=2
-    )
+    mocked_rule_sequencer.return_value.looping = True
 
     controller_instance.start()
 
-    mocked_result_forest.return_value.add.assert_called_once_with(
-        mocked_interrupted_rule_sequence[0].results
+    mocked_interrupted_rule_sequence[0].save_results.assert_called_once_with(
+        controller_instance
     )
+    mocked_interrupted_rule_sequence[1].save_results.assert_not_called()
 
   def test_start__all_text__all_schema__loop_signals_stop__run_all_validators(
       self,
@@ -203,9 +404,7 @@ class TestController:
     mocked_validator_sequencer.return_value.__iter__.return_value = (
         mocked_sequence
     )
-    mocked_rule_sequencer.return_value.pattern = LinearLoopPattern(
-        start=1, end=2
-    )
+    mocked_rule_sequencer.return_value.looping = True
 
     controller_instance.start()
 
@@ -266,6 +465,19 @@ class TestController:
       mocked_rule.apply.assert_called_once_with(controller_instance)
     assert str(exc.value) == controller_instance.msg_fmt_entire_file_not_read
 
+  def test_start__partial_text__all_schema__raise_exception__closes_text_file(
+      self,
+      mocked_rule_sequencer: mock.MagicMock,
+      mocked_text_file_sequencer: mock.Mock,
+      controller_instance: Controller,
+  ) -> None:
+    mocked_rule_sequencer.return_value.__next__.side_effect = StopIteration
+
+    with pytest.raises(UnconsumedData):
+      controller_instance.start()
+
+    mocked_text_file_sequencer.return_value.close.assert_called_once_with()
+
   def test_start__partial_text__all_schema__run_no_validators__raise_exception(
       self,
       mocked_rule_sequencer: mock.MagicMock,
@@ -285,3 +497,273 @@ class TestController:
     for mocked_validator in mocked_sequence:
       mocked_validator.apply.assert_not_called()
     assert str(exc.value) == controller_instance.msg_fmt_entire_file_not_read
+
+  def test_start__rule_violation__no_max_errors__raise_exception(
+      self,
+      mocked_rule_sequencer: mock.MagicMock,
+      mocked_violated_rule_sequence: List[mock.Mock],
+      mocked_validator_sequencer: mock.MagicMock,
+      controller_instance: Controller,
+  ) -> None:
+    mocked_rule_sequencer.return_value.__iter__.return_value = (
+        mocked_violated_rule_sequence
+    )
+    mocked_validator_sequencer.return_value.__iter__.return_value = [
+        mock.Mock()
+    ]
+
+    with pytest.raises(RuleExceptionBase) as exc:
+      controller_instance.start()
+
+    assert exc.value == mocked_violated_rule_sequence[1].apply.side_effect
+    mocked_violated_rule_sequence[2].apply.assert_not_called()
+    mocked_validator_sequencer.return_value.__iter__.return_value[
+        0].apply.assert_not_called()
+
+  def test_start__validation_failure__no_max_errors__raise_exception(
+      self,
+      mocked_rule_sequencer: mock.MagicMock,
+      mocked_failed_validator_sequence: List[mock.Mock],
+      mocked_text_file_sequencer: mock.Mock,
+      mocked_validator_sequencer: mock.MagicMock,
+      controller_instance: Controller,
+  ) -> None:
+    mocked_rule_sequencer.return_value.__next__.side_effect = StopIteration
+    mocked_text_file_sequencer.return_value.__next__.side_effect = (
+        StopIteration
+    )
+    mocked_validator_sequencer.return_value.__iter__.return_value = (
+        mocked_failed_validator_sequence
+    )
+
+    with pytest.raises(ValueError) as exc:
+      controller_instance.start()
+
+    assert exc.value == mocked_failed_validator_sequence[0].apply.side_effect
+    mocked_failed_validator_sequence[1].apply.assert_not_called()
+
+  def test_start__max_errors__no_errors__does_not_raise_exception(
+      self,
+      mocked_rule_sequencer: mock.MagicMock,
+      mocked_sequence: List[mock.Mock],
+      mocked_text_file_sequencer: mock.Mock,
+      collecting_controller_instance: Controller,
+  ) -> None:
+    mocked_rule_sequencer.return_value.__iter__.return_value = mocked_sequence
+    mocked_rule_sequencer.return_value.__next__.side_effect = StopIteration
+    mocked_text_file_sequencer.return_value.__next__.side_effect = (
+        StopIteration
+    )
+
+    collecting_controller_instance.start()
+
+    assert not collecting_controller_instance.errors
+
+  def test_start__max_errors__rule_violation__resynchronizes_with_rule(
+      self,
+      mocked_rule_sequencer: mock.MagicMock,
+      mocked_violated_rule_sequence: List[mock.Mock],
+      mocked_text_file_sequencer: mock.Mock,
+      collecting_controller_instance: Controller,
+  ) -> None:
+    mocked_rule_sequencer.return_value.__iter__.return_value = (
+        mocked_violated_rule_sequence
+    )
+    mocked_rule_sequencer.return_value.__next__.side_effect = StopIteration
+    mocked_text_file_sequencer.return_value.__next__.side_effect = (
+        StopIteration
+    )
+
+    with pytest.raises(CollectedErrors):
+      collecting_controller_instance.start()
+
+    mocked_violated_rule_sequence[1].resynchronize.assert_called_once_with(
+        collecting_controller_instance
+    )
+    mocked_text_file_sequencer.return_value.read_section.assert_not_called()
+    mocked_rule_sequencer.return_value.skip_iteration.assert_not_called()
+
+  def test_start__max_errors__rule_violation__in_sequence__skips_iteration(
+      self,
+      mocked_rule_sequencer: mock.MagicMock,
+      mocked_violated_rule_sequence: List[mock.Mock],
+      mocked_text_file_sequencer: mock.Mock,
+      collecting_controller_instance: Controller,
+  ) -> None:
+    mocked_rule_sequencer.return_value.__iter__.return_value = (
+        mocked_violated_rule_sequence
+    )
+    mocked_rule_sequencer.return_value.__next__.side_effect = StopIteration
+    mocked_rule_sequencer.return_value.frames = [mock.Mock()]
+    mocked_text_file_sequencer.return_value.__next__.side_effect = (
+        StopIteration
+    )
+
+    with pytest.raises(CollectedErrors):
+      collecting_controller_instance.start()
+
+    mocked_violated_rule_sequence[1].resynchronize.assert_not_called()
+    mocked_textfile = mocked_text_file_sequencer.return_value
+    mocked_textfile.read_section.assert_called_once_with()
+    mocked_rule_sequencer.return_value.skip_iteration.assert_called_once_with()
+
+  def test_start__max_errors__rule_violation__runs_and_saves_other_rules(
+      self,
+      mocked_rule_sequencer: mock.MagicMock,
+      mocked_violated_rule_sequence: List[mock.Mock],
+      mocked_text_file_sequencer: mock.Mock,
+      collecting_controller_instance: Controller,
+  ) -> None:
+    mocked_rule_sequencer.return_value.__iter__.return_value = (
+        mocked_violated_rule_sequence
+    )
+    mocked_rule_sequencer.return_value.__next__.side_effect = StopIteration
+    mocked_text_file_sequencer.return_value.__next__.side_effect = (
+        StopIteration
+    )
+
+    with pytest.raises(CollectedErrors):
+      collecting_controller_instance.start()
+
+    for mocked_rule in mocked_violated_rule_sequence:
+      mocked_rule.apply.assert_called_once_with(collecting_controller_instance)
+    assert [
+        mocked_rule.save_results.call_count
+        for mocked_rule in mocked_violated_rule_sequence
+    ] == [1, 0, 1]
+
+  def test_start__max_errors__rule_violation__resynchronize_at_eof__stops(
+      self,
+      mocked_rule_sequencer: mock.MagicMock,
+      mocked_violated_rule_sequence: List[mock.Mock],
+      mocked_text_file_sequencer: mock.Mock,
+      collecting_controller_instance: Controller,
+  ) -> None:
+    mocked_rule_sequencer.return_value.__iter__.return_value = (
+        mocked_violated_rule_sequence
+    )
+    mocked_rule_sequencer.return_value.__next__.side_effect = StopIteration
+    mocked_text_file_sequencer.return_value.__next__.side_effect = (
+        StopIteration
+    )
+    mocked_violated_rule_sequence[1].resynchronize.side_effect = StopIteration
+
+    with pytest.raises(CollectedErrors):
+      collecting_controller_instance.start()
+
+    mocked_violated_rule_sequence[2].apply.assert_not_called()
+
+  def test_start__max_errors__rule_violation__runs_validators(
+      self,
+      mocked_rule_sequencer: mock.MagicMock,
+      mocked_violated_rule_sequence: List[mock.Mock],
+      mocked_text_file_sequencer: mock.Mock,
+      mocked_validator_sequencer: mock.MagicMock,
+      collecting_controller_instance: Controller,
+  ) -> None:
+    mocked_validators = [mock.Mock(), mock.Mock()]
+    mocked_rule_sequencer.return_value.__iter__.return_value = (
+        mocked_violated_rule_sequence
+    )
+    mocked_rule_sequencer.return_value.__next__.side_effect = StopIteration
+    mocked_text_file_sequencer.return_value.__next__.side_effect = (
+        StopIteration
+    )
+    mocked_validator_sequencer.return_value.__iter__.return_value = (
+        mocked_validators
+    )
+
+    with pytest.raises(CollectedErrors) as exc:
+      collecting_controller_instance.start()
+
+    for mocked_validator in mocked_validators:
+      mocked_validator.apply.assert_called_once_with(
+          collecting_controller_instance
+      )
+    assert_is_collected_errors(
+        exc,
+        [mocked_violated_rule_sequence[1].apply.side_effect],
+        limit_reached=False,
+    )
+
+  def test_start__max_errors__validation_failure__runs_other_validators(
+      self,
+      mocked_rule_sequencer: mock.MagicMock,
+      mocked_failed_validator_sequence: List[mock.Mock],
+      mocked_text_file_sequencer: mock.Mock,
+      mocked_validator_sequencer: mock.MagicMock,
+      collecting_controller_instance: Controller,
+  ) -> None:
+    mocked_rule_sequencer.return_value.__next__.side_effect = StopIteration
+    mocked_text_file_sequencer.return_value.__next__.side_effect = (
+        StopIteration
+    )
+    mocked_validator_sequencer.return_value.__iter__.return_value = (
+        mocked_failed_validator_sequence
+    )
+
+    with pytest.raises(CollectedErrors) as exc:
+      collecting_controller_instance.start()
+
+    for mocked_validator in mocked_failed_validator_sequence:
+      mocked_validator.apply.assert_called_once_with(
+          collecting_controller_instance
+      )
+    assert_is_collected_errors(
+        exc,
+        [mocked_failed_validator_sequence[0].apply.side_effect],
+        limit_reached=False,
+    )
+
+  def test_start__max_errors__unconsumed_data__runs_validators(
+      self,
+      mocked_sequence: List[mock.Mock],
+      mocked_validator_sequencer: mock.MagicMock,
+      collecting_controller_instance: Controller,
+  ) -> None:
+    mocked_validator_sequencer.return_value.__iter__.return_value = (
+        mocked_sequence
+    )
+
+    with pytest.raises(CollectedErrors) as exc:
+      collecting_controller_instance.start()
+
+    for mocked_validator in mocked_sequence:
+      mocked_validator.apply.assert_called_once_with(
+          collecting_controller_instance
+      )
+    assert [str(error) for error in collecting_controller_instance.errors] == [
+        collecting_controller_instance.msg_fmt_all_rules_not_read,
+        collecting_controller_instance.msg_fmt_entire_file_not_read,
+    ]
+    assert_is_collected_errors(
+        exc,
+        collecting_controller_instance.errors,
+        limit_reached=False,
+    )
+
+  def test_start__max_errors__limit_reached__raise_exception(
+      self,
+      mocked_rule_sequencer: mock.MagicMock,
+      mocked_violated_rule_sequence: List[mock.Mock],
+      mocked_validator_sequencer: mock.MagicMock,
+      collecting_controller_instance: Controller,
+  ) -> None:
+    mocked_validator = mock.Mock()
+    mocked_rule_sequencer.return_value.__iter__.return_value = (
+        mocked_violated_rule_sequence
+    )
+    mocked_validator_sequencer.return_value.__iter__.return_value = [
+        mocked_validator
+    ]
+
+    with pytest.raises(CollectedErrors) as exc:
+      collecting_controller_instance.start()
+
+    mocked_validator.apply.assert_not_called()
+    assert len(collecting_controller_instance.errors) == 3
+    assert_is_collected_errors(
+        exc,
+        collecting_controller_instance.errors,
+        limit_reached=True,
+    )
@@ -0,0 +1,545 @@
+"""Test the ControllerPool and ControllerWorker classes."""
+# pylint: disable=redefined-outer-name
+
+from typing import Generator
+from unittest import mock
+
+import pytest
+from text_lint import pool
+from text_lint.sequencers.textfile import TextFileSequencer
+from ..pool import ControllerPool, ControllerResult, ControllerWorker
+
+
+@pytest.fixture
+def mocked_controller(monkeypatch: pytest.MonkeyPatch) -> mock.Mock:
+  instance = mock.Mock()
+  monkeypatch.setattr(pool, "Controller", instance)
+  return instance
+
+
+@pytest.fixture
+def mocked_multiprocessing(monkeypatch: pytest.MonkeyPatch) -> mock.Mock:
+  instance = mock.Mock()
+  instance.Pool.return_value = mock.MagicMock()
+  monkeypatch.setattr(pool, "multiprocessing", instance)
+  return instance
+
+
+@pytest.fixture
+def mocked_profiler(monkeypatch: pytest.MonkeyPatch) -> mock.Mock:
+  instance = mock.Mock()
+  monkeypatch.setattr(pool, "Profiler", instance)
+  return instance
+
+
+@pytest.fixture
+def mocked_schema(monkeypatch: pytest.MonkeyPatch) -> mock.Mock:
+  instance = mock.Mock()
+  monkeypatch.setattr(pool, "Schema", instance)
+  return instance
+
+
+@pytest.fixture
+def mocked_statistics(monkeypatch: pytest.MonkeyPatch) -> mock.Mock:
+  instance = mock.Mock()
+  monkeypatch.setattr(pool, "Statistics", instance)
+  return instance
+
+
+@pytest.fixture
+def worker_state() -> Generator[None, None, None]:
+  yield
+  ControllerWorker.error = None
+  ControllerWorker.schema = None
+  ControllerWorker.collect_statistics = False
+  ControllerWorker.max_errors = 1
+  ControllerWorker.profile = False
+  ControllerWorker.textfile_mode = TextFileSequencer.mode
+
+
+class TestControllerWorker:
+  """Test the ControllerWorker class."""
+
+  def test_initialize__attributes(self) -> None:
+    assert ControllerWorker.collect_statistics is False
+    assert ControllerWorker.error is None
+    assert ControllerWorker.max_errors == 1
+    assert ControllerWorker.profile is False
+    assert ControllerWorker.schema is None
+    assert ControllerWorker.textfile_mode == TextFileSequencer.mode
+
+  @pytest.mark.usefixtures("worker_state")
+  def test_initialize__loads_schema_once(
+      self,
+      mocked_schema: mock.Mock,
+  ) -> None:
+    ControllerWorker.initialize("mocked_schema_path", "mocked_mode")
+
+    mocked_schema.assert_called_once_with("mocked_schema_path")
+    mocked_schema.return_value.load_rules.assert_called_once_with()
+    mocked_schema.return_value.load_validators.assert_called_once_with()
+    assert ControllerWorker.collect_statistics is False
+    assert ControllerWorker.error is None
+    assert ControllerWorker.max_errors == 1
+    assert ControllerWorker.profile is False
+    assert ControllerWorker.schema == mocked_schema.return_value
+    assert ControllerWorker.textfile_mode == "mocked_mode"
+
+  @pytest.mark.usefixtures("mocked_schema", "worker_state")
+  def test_initialize__profile__stores_profile(self) -> None:
+    ControllerWorker.initialize("mocked_schema_path", "mocked_mode", True)
+
+    assert ControllerWorker.profile is True
+
+  @pytest.mark.usefixtures("mocked_schema", "worker_state")
+  def test_initialize__collect_statistics__stores_collect_statistics(
+      self,
+  ) -> None:
+    ControllerWorker.initialize(
+        "mocked_schema_path",
+        "mocked_mode",
+        False,
+        True,
+        max_errors=1,
+    )
+
+    assert ControllerWorker.collect_statistics is True
+
+  @pytest.mark.usefixtures("mocked_schema", "worker_state")
+  def test_initialize__max_errors__stores_max_errors(self) -> None:
+    ControllerWorker.initialize(
+        "mocked_schema_path",
+        "mocked_mode",
+        False,
+        False,
+        10,
+    )
+
+    assert ControllerWorker.max_errors == 10
+
+  @pytest.mark.usefixtures("worker_state")
+  def test_initialize__invalid_schema__stores_error(
+      self,
+      mocked_schema: mock.Mock,
+  ) -> None:
+    mocked_schema.side_effect = ValueError("mocked_error")
+
+    ControllerWorker.initialize("mocked_schema_path", "mocked_mode")
+
+    assert ControllerWorker.error == "ValueError: mocked_error"
+    assert ControllerWorker.schema is None
+
+  @pytest.mark.usefixtures("worker_state")
+  def test_lint__invalid_schema__returns_error(
+      self,
+      mocked_controller: mock.Mock,
+      mocked_schema: mock.Mock,
+  ) -> None:
+    mocked_schema.side_effect = ValueError("mocked_error")
+    ControllerWorker.initialize("mocked_schema_path", "mocked_mode")
+
+    result = ControllerWorker.lint("mocked_file_path")
+
+    mocked_controller.assert_not_called()
+    assert result == ControllerResult(
+        file_path="mocked_file_path",
+        output="",
+        error="ValueError: mocked_error",
+    )
+
+  @pytest.mark.usefixtures("worker_state")
+  def test_lint__success__returns_captured_output(
+      self,
+      mocked_controller: mock.Mock,
+      mocked_schema: mock.Mock,
+  ) -> None:
+    ControllerWorker.initialize("mocked_schema_path", "mocked_mode")
+    mocked_controller.return_value.start.side_effect = (
+        lambda: print("mocked_output")
+    )
+
+    result = ControllerWorker.lint("mocked_file_path")
+
+    mocked_controller.assert_called_once_with(
+        "mocked_file_path",
+        mocked_schema.return_value,
+        "mocked_mode",
+        None,
+        None,
+        max_errors=1,
+    )
+    assert result == ControllerResult(
+        file_path="mocked_file_path",
+        output="mocked_output\n",
+        error=None,
+    )
+
+  @pytest.mark.usefixtures("worker_state")
+  def test_lint__profile__returns_profiler(
+      self,
+      mocked_controller: mock.Mock,
+      mocked_profiler: mock.Mock,
+      mocked_schema: mock.Mock,
+  ) -> None:
+    ControllerWorker.initialize("mocked_schema_path", "mocked_mode", True)
+
+    result = ControllerWorker.lint("mocked_file_path")
+
+    mocked_profiler.assert_called_once_with()
+    mocked_controller.assert_called_once_with(
+        "mocked_file_path",
+        mocked_schema.return_value,
+        "mocked_mode",
+        mocked_profiler.return_value,
+        None,
+        max_errors=1,
+    )
+    assert result == ControllerResult(
+        file_path="mocked_file_path",
+        output="",
+        error=None,
+        profiler=mocked_profiler.return_value,
+    )
+
+  @pytest.mark.usefixtures("worker_state")
+  def test_lint__collect_statistics__returns_statistics(
+      self,
+      mocked_controller: mock.Mock,
+      mocked_schema: mock.Mock,
+      mocked_statistics: mock.Mock,
+  ) -> None:
+    ControllerWorker.initialize(
+        "mocked_schema_path",
+        "mocked_mode",
+        False,
+        True,
+        max_errors=1,
+    )
+
+    result = ControllerWorker.lint("mocked_file_path")
+
+    mocked_statistics.assert_called_once_with()
+    mocked_controller.assert_called_once_with(
+        "mocked_file_path",
+        mocked_schema.return_value,
+        "mocked_mode",
+        None,
+        mocked_statistics.return_value,
+        max_errors=1,
+    )
+    assert result == ControllerResult(
+        file_path="mocked_file_path",
+        output="",
+        error=None,
+        statistics=mocked_statistics.return_value,
+    )
+
+  @pytest.mark.usefixtures("worker_state")
+  def test_lint__max_errors__creates_controller_with_max_errors(
+      self,
+      mocked_controller: mock.Mock,
+      mocked_schema: mock.Mock,
+  ) -> None:
+    ControllerWorker.initialize(
+        "mocked_schema_path",
+        "mocked_mode",
+        max_errors=10,
+    )
+
+    ControllerWorker.lint("mocked_file_path")
+
+    mocked_controller.assert_called_once_with(
+        "mocked_file_path",
+        mocked_schema.return_value,
+        "mocked_mode",
+        None,
+        None,
+        max_errors=10,
+    )
+
+  @pytest.mark.usefixtures("mocked_schema", "worker_state")
+  def test_lint__failure__returns_captured_output_and_error(
+      self,
+      mocked_controller: mock.Mock,
+  ) -> None:
+    ControllerWorker.initialize("mocked_schema_path", "mocked_mode")
+
+    def start() -> None:
+      print("mocked_output")
+      raise ValueError("mocked_error")
+
+    mocked_controller.return_value.start.side_effect = start
+
+    result = ControllerWorker.lint("mocked_file_path")
+
+    assert result == ControllerResult(
+        file_path="mocked_file_path",
+        output="mocked_output\n",
+        error="ValueError: mocked_error",
+    )
+
+
+class TestControllerPool:
+  """Test the ControllerPool class."""
+
+  def test_initialize__attributes(self) -> None:
+    instance = ControllerPool("mocked_schema_path", "mocked_mode", 2)
+
+    assert instance.schema_path == "mocked_schema_path"
+    assert instance.textfile_mode == "mocked_mode"
+    assert instance.jobs == 2
+    assert instance.collect_statistics is False
+    assert instance.max_errors == 1
+    assert instance.profile is False
+    assert instance.unused_saves == ()
+
+  @pytest.mark.parametrize("jobs", [1, 2])
+  def test_start__invalid_schema__raises_exception_before_linting(
+      self,
+      mocked_controller: mock.Mock,
+      mocked_multiprocessing: mock.Mock,
+      mocked_schema: mock.Mock,
+      jobs: int,
+  ) -> None:
+    mocked_schema.return_value.load_rules.side_effect = ValueError
+    instance = ControllerPool("mocked_schema_path", "mocked_mode", jobs)
+
+    with pytest.raises(ValueError):
+      list(instance.start(["file1", "file2"]))
+
+    mocked_controller.assert_not_called()
+    mocked_multiprocessing.Pool.assert_not_called()
+
+  @pytest.mark.usefixtures("mocked_controller")
+  @pytest.mark.parametrize("jobs", [1, 2])
+  def test_start__valid_schema__stores_unused_saves(
+      self,
+      mocked_schema: mock.Mock,
+      jobs: int,
+  ) -> None:
+    mocked_schema.return_value.load_unused_saves.return_value = ("unused",)
+    instance = ControllerPool("mocked_schema_path", "mocked_mode", jobs)
+
+    list(instance.start(["file1"]))
+
+    assert instance.unused_saves == ("unused",)
+
+  @pytest.mark.parametrize("jobs,file_count", [(1, 3), (4, 1)])
+  def test_start__one_process__lints_in_this_process(
+      self,
+      mocked_controller: mock.Mock,
+      mocked_multiprocessing: mock.Mock,
+      mocked_schema: mock.Mock,
+      jobs: int,
+      file_count: int,
+  ) -> None:
+    file_paths = ["file{0}".format(index) for index in range(file_count)]
+    instance = ControllerPool("mocked_schema_path", "mocked_mode", jobs)
+
+    results = list(instance.start(file_paths))
+
+    mocked_multiprocessing.Pool.assert_not_called()
+    mocked_schema.assert_called_once_with("mocked_schema_path")
+    assert mocked_controller.mock_calls[::2] == [
+        mock.call(
+            file_path,
+            mocked_schema.return_value,
+            "mocked_mode",
+            None,
+            None,
+            max_errors=1,
+        ) for file_path in file_paths
+    ]
+    assert results == [
+        ControllerResult(file_path=file_path, output="", error=None)
+        for file_path in file_paths
+    ]
+
+  @pytest.mark.usefixtures("mocked_schema")
+  @pytest.mark.parametrize(
+      "jobs,file_count,expected_processes,expected_chunksize",
+      [
+          (2, 3, 2, 1),
+          (4, 3, 3, 1),
+          (4, 100, 4, 6),
+      ],
+  )
+  def test_start__multiple_processes__creates_process_pool(
+      self,
+      mocked_multiprocessing: mock.Mock,
+      jobs: int,
+      file_count: int,
+      expected_processes: int,
+      expected_chunksize: int,
+  ) -> None:
+    file_paths = ["file"] * file_count
+    mocked_process_pool = (
+        mocked_multiprocessing.Pool.return_value.__enter__.return_value
+    )
+    instance = ControllerPool("mocked_schema_path", "mocked_mode", jobs)
+
+    list(instance.start(file_paths))
+
+    mocked_multiprocessing.Pool.assert_called_once_with(
+        processes=expected_processes,
+        initializer=ControllerWorker.initialize,
+        initargs=("mocked_schema_path", "mocked_mode", False, False, 1),
+    )
+    mocked_process_pool.imap.assert_called_once_with(
+        ControllerWorker.lint,
+        file_paths,
+        chunksize=expected_chunksize,
+    )
+
+  @pytest.mark.usefixtures("mocked_schema")
+  def test_start__multiple_processes__profile__initializes_workers(
+      self,
+      mocked_multiprocessing: mock.Mock,
+  ) -> None:
+    instance = ControllerPool("mocked_schema_path", "mocked_mode", 2, True)
+
+    list(instance.start(["file1", "file2"]))
+
+    mocked_multiprocessing.Pool.assert_called_once_with(
+        processes=2,
+        initializer=ControllerWorker.initialize,
+        initargs=("mocked_schema_path", "mocked_mode", True, False, 1),
+    )
+
+  def test_start__one_process__profile__returns_profilers(
+      self,
+      mocked_controller: mock.Mock,
+      mocked_profiler: mock.Mock,
+      mocked_schema: mock.Mock,
+  ) -> None:
+    instance = ControllerPool("mocked_schema_path", "mocked_mode", 1, True)
+
+    results = list(instance.start(["file1"]))
+
+    mocked_controller.assert_called_once_with(
+        "file1",
+        mocked_schema.return_value,
+        "mocked_mode",
+        mocked_profiler.return_value,
+        None,
+        max_errors=1,
+    )
+    assert results == [
+        ControllerResult(
+            file_path="file1",
+            output="",
+            error=None,
+            profiler=mocked_profiler.return_value,
+        )
+    ]
+
+  @pytest.mark.usefixtures("mocked_schema")
+  def test_start__multiple_processes__statistics__initializes_workers(
+      self,
+      mocked_multiprocessing: mock.Mock,
+  ) -> None:
+    instance = ControllerPool(
+        "mocked_schema_path",
+        "mocked_mode",
+        2,
+        collect_statistics=True,
+        max_errors=1,
+    )
+
+    list(instance.start(["file1", "file2"]))
+
+    mocked_multiprocessing.Pool.assert_called_once_with(
+        processes=2,
+        initializer=ControllerWorker.initialize,
+        initargs=("mocked_schema_path", "mocked_mode", False, True, 1),
+    )
+
+  def test_start__one_process__statistics__returns_statistics(
+      self,
+      mocked_controller: mock.Mock,
+      mocked_schema: mock.Mock,
+      mocked_statistics: mock.Mock,
+  ) -> None:
+    instance = ControllerPool(
+        "mocked_schema_path",
+        "mocked_mode",
+        1,
+        collect_statistics=True,
+        max_errors=1,
+    )
+
+    results = list(instance.start(["file1"]))
+
+    mocked_controller.assert_called_once_with(
+        "file1",
+        mocked_schema.return_value,
+        "mocked_mode",
+        None,
+        mocked_statistics.return_value,
+        max_errors=1,
+    )
+    assert results == [
+        ControllerResult(
+            file_path="file1",
+            output="",
+            error=None,
+            statistics=mocked_statistics.return_value,
+        )
+    ]
+
+  @pytest.mark.usefixtures("mocked_schema")
+  def test_start__multiple_processes__max_errors__initializes_workers(
+      self,
+      mocked_multiprocessing: mock.Mock,
+  ) -> None:
+    instance = ControllerPool(
+        "mocked_schema_path",
+        "mocked_mode",
+        2,
+        max_errors=10,
+    )
+
+    list(instance.start(["file1", "file2"]))
+
+    assert mocked_multiprocessing.Pool.call_args.kwargs["initargs"] == (
+        "mocked_schema_path",
+        "mocked_mode",
+        False,
+        False,
+        10,
+    )
+
+  @pytest.mark.usefixtures("mocked_schema")
+  def test_start__one_process__max_errors__creates_controller_with_max_errors(
+      self,
+      mocked_controller: mock.Mock,
+  ) -> None:
+    instance = ControllerPool(
+        "mocked_schema_path",
+        "mocked_mode",
+        1,
+        max_errors=10,
+    )
+
+    list(instance.start(["file1"]))
+
+    assert mocked_controller.call_args.kwargs == {"max_errors": 10}
+
+  @pytest.mark.usefixtures("mocked_schema")
+  def test_start__multiple_processes__yields_ordered_results(
+      self,
+      mocked_multiprocessing: mock.Mock,
+  ) -> None:
+    expected_results = [
+        ControllerResult(file_path="file1", output="", error=None),
+        ControllerResult(file_path="file2", output="", error="Error: 1"),
+    ]
+    mocked_process_pool = (
+        mocked_multiprocessing.Pool.return_value.__enter__.return_value
+    )
+    mocked_process_pool.imap.return_value = iter(expected_results)
+    instance = ControllerPool("mocked_schema_path", "mocked_mode", 2)
+
+    results = list(instance.start(["file1", "file2"]))
+
+    assert results == expected_results
@@ -0,0 +1,152 @@
+"""Test the Profiler class."""
+
+from unittest import mock
+
+import pytest
+from text_lint.__helpers__.translations import (
+    as_translation,
+    assert_is_translated,
+)
+from text_lint.config import NEW_LINE
+from .. import profiler
+from ..profiler import Profiler
+
+
+class TestProfiler:
+  """Test the Profiler class."""
+
+  def test_initialize__attributes(self) -> None:
+    instance = Profiler()
+
+    assert not instance.calls
+    assert not instance.seconds
+    assert instance.section_lookup == "lookup"
+    assert instance.section_rule == "rule"
+    assert instance.section_validator == "validator"
+    assert instance.msg_fmt_column_calls == as_translation("calls")
+    assert instance.msg_fmt_column_mean == as_translation("mean (ms)")
+    assert instance.msg_fmt_column_name == as_translation("name")
+    assert instance.msg_fmt_column_operation == as_translation("operation")
+    assert instance.msg_fmt_column_section == as_translation("section")
+    assert instance.msg_fmt_column_total == as_translation("total (s)")
+
+  def test_initialize__translations(self) -> None:
+    instance = Profiler()
+
+    assert_is_translated(instance.msg_fmt_column_calls)
+    assert_is_translated(instance.msg_fmt_column_mean)
+    assert_is_translated(instance.msg_fmt_column_name)
+    assert_is_translated(instance.msg_fmt_column_operation)
+    assert_is_translated(instance.msg_fmt_column_section)
+    assert_is_translated(instance.msg_fmt_column_total)
+
+  def test_apply__applies_operation_and_records_time(
+      self,
+      monkeypatch: pytest.MonkeyPatch,
+  ) -> None:
+    mocked_controller = mock.Mock()
+    mocked_operation = mock.Mock(operation="mocked_operation")
+    monkeypatch.setattr(
+        profiler.time,
+        "perf_counter",
+        mock.Mock(side_effect=[1.0, 1.5, 2.0, 2.25]),
+    )
+    instance = Profiler()
+
+    instance.apply("rule", "mocked_name", mocked_operation, mocked_controller)
+    instance.apply("rule", "mocked_name", mocked_operation, mocked_controller)
+
+    assert mocked_operation.apply.mock_calls == [
+        mock.call(mocked_controller),
+        mock.call(mocked_controller),
+    ]
+    assert instance.calls == {("rule", "mocked_name", "mocked_operation"): 2}
+    assert instance.seconds == {
+        ("rule", "mocked_name", "mocked_operation"): 0.75
+    }
+
+  def test_apply__exception__records_time_and_raises(
+      self,
+      monkeypatch: pytest.MonkeyPatch,
+  ) -> None:
+    mocked_operation = mock.Mock(operation="mocked_operation")
+    mocked_operation.apply.side_effect = StopIteration
+    monkeypatch.setattr(
+        profiler.time,
+        "perf_counter",
+        mock.Mock(side_effect=[1.0, 1.5]),
+    )
+    instance = Profiler()
+
+    with pytest.raises(StopIteration):
+      instance.apply("rule", "mocked_name", mocked_operation, mock.Mock())
+
+    assert instance.calls == {("rule", "mocked_name", "mocked_operation"): 1}
+    assert instance.seconds == {
+        ("rule", "mocked_name", "mocked_operation"): 0.5
+    }
+
+  def test_merge__adds_recorded_totals(self) -> None:
+    instance = Profiler()
+    instance.record(("rule", "a", "assert_blank"), 1, 0.5)
+    other = Profiler()
+    other.record(("rule", "a", "assert_blank"), 2, 0.25)
+    other.record(("lookup", "b", "capture"), 3, 1.0)
+
+    instance.merge(other)
+
+    assert instance.calls == {
+        ("rule", "a", "assert_blank"): 3,
+        ("lookup", "b", "capture"): 3,
+    }
+    assert instance.seconds == {
+        ("rule", "a", "assert_blank"): 0.75,
+        ("lookup", "b", "capture"): 1.0,
+    }
+
+  def test_sorted_keys__returns_most_time_spent_first(self) -> None:
+    instance = Profiler()
+    instance.record(("rule", "b", "assert_blank"), 1, 0.5)
+    instance.record(("validator", "c", "validate_equal"), 1, 2.0)
+    instance.record(("rule", "a", "assert_blank"), 1, 0.5)
+
+    assert instance.sorted_keys() == [
+        ("validator", "c", "validate_equal"),
+        ("rule", "a", "assert_blank"),
+        ("rule", "b", "assert_blank"),
+    ]
+
+  def test_report__returns_table(self) -> None:
+    instance = Profiler()
+    instance.record(("rule", "a", "assert_blank"), 4, 0.5)
+    instance.record(("validator", "b", "validate_equal"), 1, 2.0)
+
+    report = instance.report()
+
+    assert report.split(NEW_LINE) == [
+        instance.msg_fmt_row.format(
+            instance.msg_fmt_column_section,
+            instance.msg_fmt_column_name,
+            instance.msg_fmt_column_operation,
+            instance.msg_fmt_column_calls,
+            instance.msg_fmt_column_total,
+            instance.msg_fmt_column_mean,
+        ),
+        instance.msg_fmt_row.format(
+            "validator",
+            "b",
+            "validate_equal",
+            1,
+            "2.0000",
+            "2000.0000",
+        ),
+        instance.msg_fmt_row.format(
+            "rule",
+            "a",
+            "assert_blank",
+            4,
+            "0.5000",
+            "125.0000",
+        ),
+        "",
+    ]
@@ -0,0 +1,148 @@
+"""Test the Statistics class."""
+
+from unittest import mock
+
+from text_lint.results.arena import ResultArena
+from ..statistics import Statistics
+
+
+class TestStatistics:
+  """Test the Statistics class."""
+
+  def test_initialize__attributes(self) -> None:
+    instance = Statistics()
+
+    assert not instance.counters
+    assert not instance.rules
+
+  def test_collect__adds_controller_counters(self) -> None:
+    mocked_controller = mock.Mock()
+    mocked_controller.textfile.comments_skipped = 2
+    mocked_controller.textfile.index = 10
+    mocked_controller.forest.arena = ResultArena()
+    mocked_controller.forest.arena.create("value")
+    mocked_controller.forest.cursor_locations = 7
+    mocked_controller.forest.lookup_cache_hits = 3
+    mocked_controller.forest.lookup_cache_misses = 4
+    instance = Statistics()
+
+    instance.collect(mocked_controller)
+    instance.collect(mocked_controller)
+
+    assert instance.counters == {
+        "comment_lines_skipped": 4,
+        "cursor_locations": 14,
+        "lines_read": 20,
+        "lookup_cache_hits": 6,
+        "lookup_cache_misses": 8,
+        "lookups": 14,
+        "result_tree_nodes": 2,
+    }
+
+  def test_count__adds_to_counter(self) -> None:
+    instance = Statistics()
+
+    instance.count("counter", 2)
+    instance.count("counter", 3)
+
+    assert instance.counters == {"counter": 5}
+
+  def test_count_match__counts_attempts_and_failures(self) -> None:
+    instance = Statistics()
+
+    instance.count_match("rule_a", True)
+    instance.count_match("rule_a", False)
+    instance.count_match("rule_a", False, True)
+    instance.count_match("rule_b", True)
+
+    assert instance.rules == {
+        "rule_a":
+            {
+                "match_attempts": 3,
+                "match_failures": 2,
+                "prefilter_rejections": 1,
+            },
+        "rule_b":
+            {
+                "match_attempts": 1,
+                "match_failures": 0,
+                "prefilter_rejections": 0,
+            },
+    }
+
+  def test_count_matches__counts_attempts_and_failures(self) -> None:
+    instance = Statistics()
+
+    instance.count_matches("rule_a", 3, 1)
+    instance.count_matches("rule_a", 2, 2, 1)
+    instance.count_match("rule_a", False)
+
+    assert instance.rules == {
+        "rule_a":
+            {
+                "match_attempts": 6,
+                "match_failures": 4,
+                "prefilter_rejections": 1,
+            },
+    }
+
+  def test_merge__adds_counters(self) -> None:
+    instance = Statistics()
+    instance.count("counter_a", 1)
+    instance.count_match("rule_a", True)
+    other = Statistics()
+    other.count("counter_a", 2)
+    other.count("counter_b", 3)
+    other.count_match("rule_a", False)
+    other.count_match("rule_b", True)
+
+    instance.merge(other)
+
+    assert instance.counters == {"counter_a": 3, "counter_b": 3}
+    assert instance.rules == {
+        "rule_a":
+            {
+                "match_attempts": 2,
+                "match_failures": 1,
+                "prefilter_rejections": 0,
+            },
+        "rule_b":
+            {
+                "match_attempts": 1,
+                "match_failures": 0,
+                "prefilter_rejections": 0,
+            },
+    }
+
+  def test_as_dict__returns_sorted_counters(self) -> None:
+    instance = Statistics()
+    instance.count("counter_b", 2)
+    instance.count("counter_a", 1)
+    instance.count_match("rule_b", True)
+    instance.count_match("rule_a", False)
+
+    result = instance.as_dict()
+
+    assert result == {
+        "counters": {
+            "counter_a": 1,
+            "counter_b": 2,
+        },
+        "rules":
+            {
+                "rule_a":
+                    {
+                        "match_attempts": 1,
+                        "match_failures": 1,
+                        "prefilter_rejections": 0,
+                    },
+                "rule_b":
+                    {
+                        "match_attempts": 1,
+                        "match_failures": 0,
+                        "prefilter_rejections": 0,
+                    },
+            },
+    }
+    assert list(result["counters"]) == ["counter_a", "counter_b"]
+    assert list(result["rules"]) == ["rule_a", "rule_b"]
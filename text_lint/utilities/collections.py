@@ -1,17 +1,41 @@
 """Collection utilities."""
 
-from typing import List, TypeVar
+from typing import Any, Hashable, List, Set, TypeVar
 
 TypeListContents = TypeVar("TypeListContents")
 
+_DICT_FORM = object()
+_LIST_FORM = object()
+_TUPLE_FORM = object()
+
+
+def hashable_form(value: Any) -> Hashable:
+  """Create a hashable value that is equal for equal lists, tuples or dicts."""
+
+  if isinstance(value, list):
+    return (_LIST_FORM, tuple(hashable_form(nested) for nested in value))
+  if isinstance(value, tuple):
+    return (_TUPLE_FORM, tuple(hashable_form(nested) for nested in value))
+  if isinstance(value, dict):
+    return (
+        _DICT_FORM,
+        frozenset(
+            (key, hashable_form(nested)) for key, nested in value.items()
+        ),
+    )
+  return value
+
 
 def unique_list(
     non_unique_list: List[TypeListContents]
 ) -> List[TypeListContents]:
-  """Create a unique list from a list of items."""
+  """Create a unique list from a list of items, preserving their order."""
 
   created_list: List[TypeListContents] = []
+  selected_items: Set[Hashable] = set()
   for item in non_unique_list:
-    if item not in created_list:
+    item_form = hashable_form(item)
+    if item_form not in selected_items:
+      selected_items.add(item_form)
       created_list.append(item)
   return created_list
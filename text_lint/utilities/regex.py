@@ -0,0 +1,35 @@
+"""Regular expression utilities."""
+
+import re
+from typing import Any, Pattern, Tuple
+
+try:
+  from re import _parser as sre_parse  # type: ignore[attr-defined]
+except ImportError:  # pragma: no cover
+  import sre_parse  # type: ignore[no-redef]  # pylint: disable=deprecated-module
+
+
+def literal_prefix(pattern: Pattern[str]) -> str:
+  """Return the literal text every match of a compiled regex must begin with."""
+
+  if pattern.flags & re.IGNORECASE:
+    return ""
+  prefix, _ = _literal_prefix(sre_parse.parse(pattern.pattern, pattern.flags))
+  return prefix
+
+
+def _literal_prefix(parsed: Any) -> Tuple[str, bool]:
+  prefix = ""
+  for index, (opcode, av) in enumerate(parsed):
+    if opcode is sre_parse.LITERAL:
+      prefix += chr(av)
+    elif opcode is sre_parse.AT and av is sre_parse.AT_BEGINNING and not index:
+      continue
+    elif opcode is sre_parse.SUBPATTERN and not av[1] & re.IGNORECASE:
+      nested_prefix, complete = _literal_prefix(av[-1])
+      prefix += nested_prefix
+      if not complete:
+        return prefix, False
+    else:
+      return prefix, False
+  return prefix, True
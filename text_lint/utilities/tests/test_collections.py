@@ -1,11 +1,27 @@
 """Test the collections utilities."""
 
-from typing import List
+from typing import Any, List
 
 import pytest
 from text_lint.utilities import collections
 
 
+class ComparisonCounter:
+  """A hashable value that counts comparisons between instances."""
+
+  comparisons = 0
+
+  def __init__(self, value: int) -> None:
+    self.value = value
+
+  def __hash__(self) -> int:
+    return hash(self.value)
+
+  def __eq__(self, other: object) -> bool:
+    ComparisonCounter.comparisons += 1
+    return isinstance(other, ComparisonCounter) and self.value == other.value
+
+
 class TestUniqueList:
   """Test the translations module's aliases."""
 
@@ -46,3 +62,105 @@ class TestUniqueList:
     return_value = collections.unique_list(mocked_list)
 
     assert return_value == [1, 2]
+
+  @pytest.mark.parametrize(
+      "mocked_list,expected", (
+          ([["A"], ["A"], ["B"]], [["A"], ["B"]]),
+          ([["A"], ("A",), ["A"]], [["A"], ("A",)]),
+          (
+              [[["A", "B"]], [["A", "B"]], [["B", "A"]]
+              ], [[["A", "B"]], [["B", "A"]]]
+          ),
+          (
+              [{
+                  "A": ["B"]
+              }, {
+                  "A": ["B"]
+              }, {
+                  "A": ["C"]
+              }], [{
+                  "A": ["B"]
+              }, {
+                  "A": ["C"]
+              }]
+          ),
+          ([1, True, 1.0, "1"], [1, "1"]),
+      )
+  )
+  def test_unique_list__vary_nested_values__returns_equality_unique_list(
+      self,
+      mocked_list: List[Any],
+      expected: List[Any],
+  ) -> None:
+    return_value = collections.unique_list(mocked_list)
+
+    assert return_value == expected
+    for returned_item in return_value:
+      assert any(returned_item is item for item in mocked_list)
+
+  def test_unique_list__distinct_items__does_not_compare_items(self) -> None:
+    mocked_items = [ComparisonCounter(index) for index in range(0, 1000)]
+
+    return_value = collections.unique_list(mocked_items)
+
+    assert return_value == mocked_items
+    assert ComparisonCounter.comparisons == 0
+
+
+class TestHashableForm:
+  """Test the hashable_form function."""
+
+  @pytest.mark.parametrize("mocked_value", ("A", 1, 1.5, None, True))
+  def test_hashable_form__vary_scalar__returns_value(
+      self,
+      mocked_value: Any,
+  ) -> None:
+    assert collections.hashable_form(mocked_value) is mocked_value
+
+  @pytest.mark.parametrize(
+      "mocked_value1,mocked_value2", (
+          (["A", ["B"]], ["A", ["B"]]),
+          (("A", ["B"]), ("A", ["B"])),
+          ({
+              "A": ["B"],
+              "C": {}
+          }, {
+              "C": {},
+              "A": ["B"]
+          }),
+      )
+  )
+  def test_hashable_form__vary_equal_containers__returns_equal_forms(
+      self,
+      mocked_value1: Any,
+      mocked_value2: Any,
+  ) -> None:
+    form1 = collections.hashable_form(mocked_value1)
+    form2 = collections.hashable_form(mocked_value2)
+
+    assert form1 == form2
+    assert hash(form1) == hash(form2)
+
+  @pytest.mark.parametrize(
+      "mocked_value1,mocked_value2", (
+          (["A", "B"], ["B", "A"]),
+          (["A", "B"], ("A", "B")),
+          ({
+              "A": ["B"]
+          }, [("A", ["B"])]),
+          ({
+              "A": "B"
+          }, {
+              "A": "C"
+          }),
+      )
+  )
+  def test_hashable_form__vary_unequal_containers__returns_unequal_forms(
+      self,
+      mocked_value1: Any,
+      mocked_value2: Any,
+  ) -> None:
+    form1 = collections.hashable_form(mocked_value1)
+    form2 = collections.hashable_form(mocked_value2)
+
+    assert form1 != form2
@@ -0,0 +1,42 @@
+"""Test the regex utilities."""
+
+import re
+
+import pytest
+from .. import regex
+
+
+class TestLiteralPrefix:
+  """Test the literal_prefix function."""
+
+  @pytest.mark.parametrize(
+      "pattern,expected", [
+          ["^.PHONY: ([a-z-\\s]+)\\n", ""],
+          ["\\t@echo \"  ([a-z-]+)\\s+.+\n", "\t@echo \"  "],
+          ["^\t@.+\n", "\t@"],
+          ["^abc$", "abc"],
+          ["ab?c", "a"],
+          ["(ab)(cd)e+", "abcd"],
+          ["(a[bc])d", "a"],
+          ["a|b", ""],
+          ["\\babc", ""],
+          ["a^bc", "a"],
+          ["", ""],
+          ["(?i)abc", ""],
+          ["(?i:ab)c", ""],
+          ["a(?i:b)c", "a"],
+      ]
+  )
+  def test_vary_pattern__returns_correct_value(
+      self,
+      pattern: str,
+      expected: str,
+  ) -> None:
+    received_prefix = regex.literal_prefix(re.compile(pattern, re.DOTALL))
+
+    assert received_prefix == expected
+
+  def test_ignore_case_flag__returns_empty_string(self) -> None:
+    received_prefix = regex.literal_prefix(re.compile("abc", re.IGNORECASE))
+
+    assert received_prefix == ""